@@ -0,0 +1,59 @@
+"""
+Benchmark de construcción de objetos de las definiciones (objetos por segundo).
+
+Compara la construcción individual con validación (camino por defecto hasta ahora),
+la validación en bloque con TypeAdapter y la construcción sin validar (model_construct)
+para datos de confianza. También compara la búsqueda lineal de enums con la búsqueda por valor.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_definitions.py [número de objetos]
+"""
+import os
+import sys
+import time
+import random
+from uuid import uuid4
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from definitions import Event, PlayerPerformance, validate_many, construct_many
+from definitions.event import EventType
+
+def measure(label: str, function: Callable[[], object], count: int) -> None:
+    start: float = time.perf_counter()
+    function()
+    elapsed: float = time.perf_counter() - start
+    print(f"{label:<45} {count / elapsed:>14,.0f} obj/s")
+
+def linear_from_value(value: int) -> EventType:
+    for event_type in EventType:
+        if event_type.value == value:
+            return event_type
+    raise ValueError(f"Valor '{value}' de evento no soportado.")
+
+def main(count: int) -> None:
+    event_values: List[int] = [event_type.value for event_type in EventType]
+    performance_rows: List[Dict] = [
+        {"player_performance_id": uuid4(), "player_id": i, "game_id": i // 30, "team_id": i % 20, "points": random.randint(-2, 15)}
+        for i in range(count)
+    ]
+    event_rows: List[Dict] = [
+        {"player_performance_id": row["player_performance_id"], "event_type": random.choice(event_values), "event_minute": random.randint(1, 90)}
+        for row in performance_rows
+    ]
+
+    print(f"{count:,} objetos por caso\n")
+    measure("EventType: búsqueda lineal (antes)", lambda: [linear_from_value(value=row["event_type"]) for row in event_rows], count)
+    measure("EventType.from_value (después)", lambda: [EventType.from_value(value=row["event_type"]) for row in event_rows], count)
+    print()
+    for model, rows in ((PlayerPerformance, performance_rows), (Event, event_rows)):
+        name: str = model.__name__
+        measure(f"{name}(**row) (antes)", lambda: [model(**row) for row in rows], count)
+        measure(f"{name} validate_many (TypeAdapter)", lambda: validate_many(model=model, rows=rows), count)
+        measure(f"{name} construct_many (datos de confianza)", lambda: construct_many(model=model, rows=rows), count)
+        print()
+
+
+if __name__ == "__main__":
+    main(count=int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
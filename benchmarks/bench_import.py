@@ -0,0 +1,73 @@
+"""
+Benchmark del tiempo de importación de los módulos de src (python -X importtime).
+
+Cada módulo se importa en un proceso nuevo, sin las variables de entorno de Biwenger, varias
+veces, y se muestra el mejor tiempo acumulado. Para el primer módulo se muestran además las
+importaciones más lentas y se comprueba que no se cargan dependencias pesadas que solo hacen
+falta para acceder a la red (requests, dotenv, aiohttp).
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_import.py [módulo ...]
+"""
+import os
+import sys
+import subprocess
+from typing import Dict, List, Tuple
+
+SRC: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+REPEATS: int = 5
+NETWORK_MODULES: List[str] = ["requests", "dotenv", "aiohttp"]
+
+def get_env() -> Dict[str, str]:
+    env: Dict[str, str] = {
+        name: value for name, value in os.environ.items()
+        if not name.startswith(("BIWENGER_", "X-"))
+    }
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+def import_times(module: str) -> List[Tuple[str, int, int]]:
+    """
+    Importa un módulo en un proceso nuevo y devuelve (módulo, propio, acumulado) en microsegundos.
+    """
+    result: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC, env=get_env(), capture_output=True, text=True, check=True
+    )
+    times: List[Tuple[str, int, int]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split(sep="|")
+        times.append((name.rstrip(), int(self_time), int(cumulative)))
+    return times
+
+def loaded_modules(module: str) -> List[str]:
+    """
+    Devuelve qué módulos de red quedan cargados tras importar un módulo.
+    """
+    code: str = f"import sys, {module}; print(','.join(name for name in {NETWORK_MODULES!r} if name in sys.modules))"
+    result: subprocess.CompletedProcess = subprocess.run([sys.executable, "-c", code], cwd=SRC, env=get_env(), capture_output=True, text=True, check=True)
+    return [name for name in result.stdout.strip().split(sep=",") if name]
+
+def main(modules: List[str]) -> None:
+    print(f"{'módulo':<15} {'mejor (ms)':>12} {'módulos de red cargados'}")
+    for module in modules:
+        best: int = min(
+            next(cumulative for name, _, cumulative in reversed(import_times(module=module)) if name.strip() == module)
+            for _ in range(REPEATS)
+        )
+        print(f"{module:<15} {best / 1000:>12.1f} {', '.join(loaded_modules(module=module)) or '-'}")
+
+    print(f"\nImportaciones más lentas de '{modules[0]}' (acumulado):")
+    top_level: List[Tuple[str, int, int]] = [
+        (name.strip(), self_time, cumulative) for name, self_time, cumulative in import_times(module=modules[0])
+        if len(name) - len(name.lstrip()) <= 3
+    ]
+    top_level = [item for item in top_level if item[0] not in (modules[0], "site")]
+    for name, _, cumulative in sorted(top_level, key=lambda item: -item[2])[:10]:
+        print(f"  {name:<40} {cumulative / 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(modules=sys.argv[1:] or ["processor", "manifest", "archive", "market", "changelog", "metrics"])
@@ -0,0 +1,182 @@
+import os
+import logging
+from typing import Any, Dict, List, Optional
+
+# Esquema de los JSON de partidos: se declara para no tener que inferirlo leyendo todos los archivos
+REPORT_TYPE: str = "STRUCT(player STRUCT(id BIGINT, name VARCHAR, position INTEGER), points INTEGER, events STRUCT(type INTEGER, metadata JSON)[])"
+TEAM_TYPE: str = f"STRUCT(id BIGINT, name VARCHAR, score INTEGER, reports {REPORT_TYPE}[])"
+GAME_COLUMNS: Dict[str, str] = {
+    "status": "INTEGER",
+    "data": f"STRUCT(id BIGINT, status VARCHAR, date BIGINT, home {TEAM_TYPE}, away {TEAM_TYPE})",
+}
+
+# Partes de la ruta '<raíz>/Games/<puntuación>/<temporada>/R<jornada>/<partido>.json'
+PATH_PATTERN: str = r"Games/([^/]+)/([0-9]+)/R([0-9]+)/([^/]+)\.json$"
+
+def _get_duckdb() -> Any:
+    """
+    Importa el módulo opcional 'duckdb'.
+    """
+    try:
+        import duckdb
+    except ImportError:
+        raise ImportError("Las consultas SQL sobre el corpus requieren el paquete 'duckdb' (pip install duckdb).")
+    return duckdb
+
+class CorpusAnalytics:
+    """
+    Capa de consultas SQL (DuckDB) directamente sobre el árbol de JSON de partidos, sin pasar
+    por BiwengerProcessor. Registra tres vistas:
+
+        games: un partido por fila (puntuación, temporada, jornada, equipos, goles, estado...).
+        performances: una actuación por fila (UNNEST de home.reports y away.reports).
+        events: un evento por fila (UNNEST de los eventos de cada actuación).
+
+    DuckDB lee los archivos en paralelo y solo las columnas y archivos que necesita cada
+    consulta (los filtros por 'filename' se aplican antes de leer). Las vistas pueden
+    materializarse en Parquet, particionadas por puntuación y temporada, con materialize().
+    """
+
+    def __init__(self, root: str = "data/JSONs", database: str = ":memory:", threads: Optional[int] = None) -> None:
+        """
+        Args:
+            root (str): Carpeta raíz de los JSON. Por defecto, 'data/JSONs'.
+            database (str): Base de datos de DuckDB. Por defecto, en memoria.
+            threads (int, optional): Hilos de DuckDB. Por defecto, uno por núcleo.
+        """
+        self.root: str = root
+        self.connection: Any = _get_duckdb().connect(database=database)
+        if threads is not None:
+            self.connection.execute(f"SET threads = {int(threads)}")
+        self.register_json_views()
+
+    def _create_views(self, games_source: str) -> None:
+        """
+        Crea las vistas de actuaciones y eventos a partir de la vista de partidos en bruto.
+
+        Args:
+            games_source (str): Consulta que devuelve los partidos en bruto (columna 'data' y ruta).
+        """
+        self.connection.execute(f"CREATE OR REPLACE VIEW games_raw AS {games_source}")
+        self.connection.execute("""
+            CREATE OR REPLACE VIEW games AS
+            SELECT
+                scoring, season, round, game_name, data.id AS game_id, data.status AS status, data.date AS date,
+                data.home.id AS home_team_id, data.home.name AS home_team_name, data.home.score AS home_team_score,
+                data.away.id AS away_team_id, data.away.name AS away_team_name, data.away.score AS away_team_score,
+                filename
+            FROM games_raw
+        """)
+        self.connection.execute("""
+            CREATE OR REPLACE VIEW performances AS
+            WITH reports AS (
+                SELECT scoring, season, round, data.id AS game_id, data.status AS status, TRUE AS is_home,
+                       data.home.id AS team_id, data.away.id AS opponent_id, UNNEST(data.home.reports) AS report
+                FROM games_raw
+                UNION ALL
+                SELECT scoring, season, round, data.id AS game_id, data.status AS status, FALSE AS is_home,
+                       data.away.id AS team_id, data.home.id AS opponent_id, UNNEST(data.away.reports) AS report
+                FROM games_raw
+            )
+            SELECT
+                scoring, season, round, game_id, status, is_home, team_id, opponent_id,
+                report.player.id AS player_id, report.player.name AS player_name, report.player.position AS player_position,
+                report.points AS points, report.events AS events
+            FROM reports
+        """)
+        self.connection.execute("""
+            CREATE OR REPLACE VIEW events AS
+            WITH unnested AS (
+                SELECT scoring, season, round, game_id, team_id, player_id, UNNEST(events) AS event
+                FROM performances
+            )
+            SELECT
+                scoring, season, round, game_id, team_id, player_id,
+                event.type AS event_type, COALESCE(TRY_CAST(event.metadata AS INTEGER), -1) AS event_minute
+            FROM unnested
+        """)
+
+    def register_json_views(self) -> None:
+        """
+        Registra las vistas sobre los JSON de '<raíz>/Games/<puntuación>/<temporada>/R*/*.json'.
+        """
+        pattern: str = os.path.join(self.root, "Games", "*", "*", "R*", "*.json").replace("'", "''")
+        columns: str = ", ".join(f"'{name}': '{column_type}'" for name, column_type in GAME_COLUMNS.items())
+        self._create_views(games_source=f"""
+            SELECT
+                regexp_extract(filename, '{PATH_PATTERN}', 1) AS scoring,
+                CAST(regexp_extract(filename, '{PATH_PATTERN}', 2) AS INTEGER) AS season,
+                CAST(regexp_extract(filename, '{PATH_PATTERN}', 3) AS INTEGER) AS round,
+                regexp_extract(filename, '{PATH_PATTERN}', 4) AS game_name,
+                data,
+                filename
+            FROM read_json('{pattern}', columns = {{{columns}}}, format = 'auto', filename = true, union_by_name = false)
+            WHERE data IS NOT NULL
+        """)
+
+    def materialize(self, folder: str = "data/Parquet") -> str:
+        """
+        Materializa los partidos en bruto en Parquet, particionados por puntuación y temporada
+        ('<carpeta>/games/scoring=<puntuación>/season=<temporada>/*.parquet'), y vuelve a registrar
+        las vistas sobre los archivos Parquet.
+
+        Args:
+            folder (str): Carpeta de salida. Por defecto, 'data/Parquet'.
+
+        Returns:
+            str: Carpeta con los archivos Parquet de los partidos.
+        """
+        path: str = os.path.join(folder, "games")
+        os.makedirs(name=folder, exist_ok=True)
+        self.connection.execute(f"""
+            COPY (SELECT * FROM games_raw)
+            TO '{path.replace("'", "''")}' (FORMAT parquet, PARTITION_BY (scoring, season), OVERWRITE_OR_IGNORE true)
+        """)
+        logging.info(msg=f"Partidos materializados en Parquet en '{path}'.")
+        self.register_parquet_views(folder=folder)
+        return path
+
+    def register_parquet_views(self, folder: str = "data/Parquet") -> None:
+        """
+        Registra las vistas sobre los partidos materializados con materialize().
+
+        Args:
+            folder (str): Carpeta de los archivos Parquet. Por defecto, 'data/Parquet'.
+        """
+        pattern: str = os.path.join(folder, "games", "*", "*", "*.parquet").replace("'", "''")
+        self._create_views(games_source=f"""
+            SELECT scoring, CAST(season AS INTEGER) AS season, round, game_name, data, filename
+            FROM read_parquet('{pattern}', hive_partitioning = true)
+        """)
+
+    def query(self, sql: str, parameters: Optional[List[Any]] = None) -> Any:
+        """
+        Ejecuta una consulta SQL sobre las vistas y devuelve el resultado como DataFrame.
+
+        Args:
+            sql (str): Consulta SQL.
+            parameters (List[Any], optional): Parámetros de la consulta ('?').
+
+        Returns:
+            pd.DataFrame: Resultado de la consulta.
+        """
+        return self.connection.execute(sql, parameters or []).df()
+
+    def close(self) -> None:
+        """
+        Cierra la conexión con DuckDB.
+        """
+        self.connection.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    analytics: CorpusAnalytics = CorpusAnalytics()
+    print(analytics.query(sql="""
+        SELECT player_id, any_value(player_name) AS player_name, count(*) AS games, sum(points) AS points
+        FROM performances
+        WHERE scoring = 'Picas' AND points IS NOT NULL
+        GROUP BY player_id
+        ORDER BY points DESC
+        LIMIT 10
+    """))
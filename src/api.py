@@ -0,0 +1,281 @@
+import os
+import asyncio
+import hashlib
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
+
+from definitions import *
+from processor import BiwengerProcessor
+
+class CorpusView(NamedTuple):
+    version: str # Versión del corpus (hash de los partidos y sus fechas de modificación)
+    games: Dict[int, Dict] # Partido por ID
+    game_performances: Dict[int, List[Dict]] # Actuaciones de cada partido
+    players: Dict[int, Dict] # Jugador por ID (datos del partido más reciente en el que aparece)
+    game_list: List[Dict] # Partidos ordenados por fecha
+    performances_by_player: Dict[int, List[Dict]] # Actuaciones de cada jugador, por fecha
+    player_metrics: List[Dict] # Métricas agregadas por jugador, de más a menos puntos
+
+EMPTY_VIEW: CorpusView = CorpusView(version="", games={}, game_performances={}, players={}, game_list=[], performances_by_player={}, player_metrics=[])
+
+class CorpusTables:
+    """
+    Corpus cargado en memoria para servirlo por HTTP: partidos, actuaciones, jugadores y
+    métricas agregadas por jugador, con índices por jugador y por partido.
+
+    refresh() solo vuelve a procesar los partidos cuya fecha de modificación ha cambiado en
+    el manifiesto, por lo que las recargas son incrementales. Las tablas que se sirven
+    (view) no se modifican nunca: cada recarga construye una vista nueva y la sustituye de
+    una vez, de modo que las peticiones en curso siguen viendo una versión coherente.
+    """
+
+    def __init__(self, processor: BiwengerProcessor) -> None:
+        self.processor: BiwengerProcessor = processor
+        self.view: CorpusView = EMPTY_VIEW
+
+        # Tablas por partido, solo las usa refresh (bajo el lock)
+        self._lock: threading.Lock = threading.Lock()
+        self._manifest_mtime: Optional[float] = None
+        self._mtimes: Dict[int, Optional[float]] = {}
+        self._games: Dict[int, Dict] = {}
+        self._game_performances: Dict[int, List[Dict]] = {}
+        self._game_players: Dict[int, List[Dict]] = {}
+
+    def _load_game(self, season: int, round: int, game_name: str, round_raw_data: Dict) -> Tuple[Dict, List[Dict], List[Dict]]:
+        """
+        Procesa un partido, sus actuaciones y sus jugadores leyendo su JSON una única vez.
+
+        Args:
+            season (int): Temporada.
+            round (int): Número de la jornada.
+            game_name (str): Nombre del partido.
+            round_raw_data (Dict): JSON de la jornada (se lee una vez por jornada).
+        """
+        game_raw_data: Dict = self.processor._load_game(game_name=game_name, round=round, season=season)
+        game: Game = self.processor._get_game(game_name=game_name, round=round, season=season, game_raw_data=game_raw_data, round_raw_data=round_raw_data)
+        performances, _ = self.processor._get_game_performances(game_name=game_name, round=round, season=season, game_raw_data=game_raw_data)
+        players: List[Player] = self.processor._get_game_players(game_name=game_name, round=round, season=season, seen_player_ids=set(), game_raw_data=game_raw_data)
+
+        game_row: Dict = {**game.model_dump(), "season": season, "round": round}
+        performance_rows: List[Dict] = [
+            {"player_id": performance.player_id, "game_id": performance.game_id, "team_id": performance.team_id, "points": performance.points}
+            for performance in performances
+        ]
+        return game_row, performance_rows, [player.model_dump() for player in players]
+
+    def refresh(self) -> int:
+        """
+        Recarga los partidos nuevos o modificados si el manifiesto ha cambiado.
+
+        Returns:
+            int: Número de partidos (re)cargados.
+        """
+        with self._lock:
+            manifest_mtime: Optional[float] = os.path.getmtime(self.processor.manifest.path) if os.path.exists(self.processor.manifest.path) else None
+            if self._manifest_mtime is not None and manifest_mtime == self._manifest_mtime:
+                return 0
+            self._manifest_mtime = manifest_mtime
+            self.processor.reload_manifest()
+
+            scoring_folder: str = self.processor.scoring_folder
+            seen: set = set()
+            loaded: int = 0
+            for season in self.processor.manifest.get_game_seasons(scoring_folder=scoring_folder):
+                for round in self.processor.manifest.get_game_rounds(scoring_folder=scoring_folder, season=season):
+                    games: Dict[int, Dict] = self.processor.manifest.get_games(scoring_folder=scoring_folder, season=season, round=round)
+                    round_raw_data: Optional[Dict] = None
+                    for game_id, entry in games.items():
+                        seen.add(game_id)
+                        if game_id in self._mtimes and self._mtimes[game_id] == entry["mtime"]:
+                            continue
+                        game_name: str = os.path.splitext(os.path.basename(entry["path"]))[0]
+                        try:
+                            if round_raw_data is None:
+                                round_raw_data = self.processor._load_round(round=round, season=season)
+                            game_row, performance_rows, player_rows = self._load_game(season=season, round=round, game_name=game_name, round_raw_data=round_raw_data)
+                        except (ValueError, KeyError, FileNotFoundError) as e:
+                            logging.warning(msg=f"No se ha podido cargar el partido {season}/R{round}/{game_name}: {e}")
+                            continue
+                        self._games[game_id], self._game_performances[game_id], self._game_players[game_id] = game_row, performance_rows, player_rows
+                        self._mtimes[game_id] = entry["mtime"]
+                        loaded += 1
+
+            for game_id in set(self._games) - seen:
+                del self._games[game_id], self._game_performances[game_id], self._game_players[game_id], self._mtimes[game_id]
+
+            self.view = self._build_view()
+            logging.info(msg=f"Corpus recargado: {loaded} partidos procesados, {len(self._games)} en memoria.")
+            return loaded
+
+    def _build_view(self) -> CorpusView:
+        """
+        Construye una vista nueva (índices y métricas agregadas) a partir de las tablas por partido.
+        """
+        game_list: List[Dict] = sorted(self._games.values(), key=lambda game: (game["date"], game["game_id"]))
+
+        # Los jugadores se reconstruyen por orden de fecha: prevalecen los datos del partido más reciente
+        players: Dict[int, Dict] = {}
+        performances_by_player: Dict[int, List[Dict]] = {}
+        for game in game_list:
+            for player in self._game_players[game["game_id"]]:
+                players[player["player_id"]] = player
+            for performance in self._game_performances[game["game_id"]]:
+                performances_by_player.setdefault(performance["player_id"], []).append(performance)
+
+        player_metrics: List[Dict] = []
+        for player_id, performances in performances_by_player.items():
+            points: np.ndarray = np.array([performance["points"] for performance in performances if performance["points"] is not None], dtype=float)
+            player_metrics.append({
+                "player_id": player_id,
+                "player_name": players.get(player_id, {}).get("player_name"),
+                "games": int(points.size),
+                "total_points": float(points.sum()),
+                "mean_points": float(points.mean()) if points.size else None,
+                "std_points": float(points.std()) if points.size > 1 else None,
+            })
+
+        digest = hashlib.sha1()
+        for game_id in sorted(self._mtimes):
+            digest.update(f"{game_id}:{self._mtimes[game_id]};".encode())
+
+        return CorpusView(
+            version=digest.hexdigest()[:16],
+            games=dict(self._games),
+            game_performances=dict(self._game_performances),
+            players=players,
+            game_list=game_list,
+            performances_by_player=performances_by_player,
+            player_metrics=sorted(player_metrics, key=lambda metric: -metric["total_points"])
+        )
+
+tables: Optional[CorpusTables] = None
+
+def get_tables() -> CorpusTables:
+    """
+    Devuelve el corpus en memoria (se carga al arrancar el servicio).
+    """
+    if tables is None:
+        raise HTTPException(status_code=503, detail="El corpus aún no está cargado.")
+    return tables
+
+def get_view() -> CorpusView:
+    """
+    Devuelve la vista actual del corpus. Cada petición debe leerla una sola vez, para no
+    mezclar dos versiones si hay una recarga en medio.
+    """
+    return get_tables().view
+
+async def _watch_manifest(interval: float) -> None:
+    """
+    Comprueba periódicamente si el manifiesto ha cambiado y recarga el corpus de forma incremental.
+
+    Args:
+        interval (float): Segundos entre comprobaciones.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(get_tables().refresh)
+        except Exception as e:
+            logging.error(msg=f"Error recargando el corpus: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    global tables
+    tables = CorpusTables(processor=BiwengerProcessor(score=int(os.environ.get("BIWENGER_SCORE", "1"))))
+    await asyncio.to_thread(tables.refresh)
+    watcher: asyncio.Task = asyncio.create_task(_watch_manifest(interval=float(os.environ.get("BIWENGER_RELOAD_INTERVAL", "30"))))
+    try:
+        yield
+    finally:
+        watcher.cancel()
+
+app: FastAPI = FastAPI(title="Biwenger API", lifespan=lifespan)
+
+def _respond(request: Request, view: CorpusView, content: Any) -> Response:
+    """
+    Devuelve una respuesta JSON con ETag. El ETag depende de la versión del corpus y de la URL,
+    de modo que si el cliente ya tiene la respuesta se contesta 304 sin serializar nada.
+
+    Args:
+        request (Request): Petición HTTP.
+        view (CorpusView): Vista del corpus con la que se ha calculado la respuesta.
+        content (Any): Contenido de la respuesta.
+    """
+    etag: str = '"' + hashlib.sha1(f"{view.version}:{request.url.path}?{request.url.query}".encode()).hexdigest()[:20] + '"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return JSONResponse(content=content, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+def _page(items: List[Any], limit: int, offset: int) -> Dict[str, Any]:
+    """
+    Devuelve una página de resultados.
+
+    Args:
+        items (List[Any]): Resultados completos.
+        limit (int): Tamaño de página.
+        offset (int): Posición inicial.
+    """
+    return {"total": len(items), "limit": limit, "offset": offset, "items": items[offset:offset + limit]}
+
+@app.get("/players")
+def get_players(request: Request, position: Optional[int] = None, limit: int = Query(default=100, ge=1, le=1000), offset: int = Query(default=0, ge=0)) -> Response:
+    view: CorpusView = get_view()
+    players: List[Dict] = list(view.players.values())
+    if position is not None:
+        players = [player for player in players if player["player_position"] == position]
+    return _respond(request=request, view=view, content=_page(items=players, limit=limit, offset=offset))
+
+@app.get("/players/{player_id}")
+def get_player(request: Request, player_id: int) -> Response:
+    view: CorpusView = get_view()
+    player: Optional[Dict] = view.players.get(player_id)
+    if player is None:
+        raise HTTPException(status_code=404, detail=f"Jugador {player_id} no encontrado.")
+    return _respond(request=request, view=view, content=player)
+
+@app.get("/games")
+def get_games(request: Request, season: Optional[int] = None, round: Optional[int] = None, limit: int = Query(default=100, ge=1, le=1000), offset: int = Query(default=0, ge=0)) -> Response:
+    view: CorpusView = get_view()
+    games: List[Dict] = view.game_list
+    if season is not None:
+        games = [game for game in games if game["season"] == season]
+    if round is not None:
+        games = [game for game in games if game["round"] == round]
+    return _respond(request=request, view=view, content=_page(items=games, limit=limit, offset=offset))
+
+@app.get("/games/{game_id}")
+def get_game(request: Request, game_id: int) -> Response:
+    view: CorpusView = get_view()
+    game: Optional[Dict] = view.games.get(game_id)
+    if game is None:
+        raise HTTPException(status_code=404, detail=f"Partido {game_id} no encontrado.")
+    return _respond(request=request, view=view, content={**game, "performances": view.game_performances[game_id]})
+
+@app.get("/performances")
+def get_performances(request: Request, player_id: int, limit: int = Query(default=100, ge=1, le=1000), offset: int = Query(default=0, ge=0)) -> Response:
+    view: CorpusView = get_view()
+    performances: List[Dict] = view.performances_by_player.get(player_id, [])
+    return _respond(request=request, view=view, content=_page(items=performances, limit=limit, offset=offset))
+
+@app.get("/metrics/players")
+def get_player_metrics(request: Request, min_games: int = Query(default=0, ge=0), limit: int = Query(default=100, ge=1, le=1000), offset: int = Query(default=0, ge=0)) -> Response:
+    view: CorpusView = get_view()
+    metrics: List[Dict] = view.player_metrics
+    if min_games:
+        metrics = [metric for metric in metrics if metric["games"] >= min_games]
+    return _respond(request=request, view=view, content=_page(items=metrics, limit=limit, offset=offset))
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    uvicorn.run(app=app, host="127.0.0.1", port=8000)
@@ -0,0 +1,186 @@
+import os
+import json
+import mmap
+import struct
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from manifest import Manifest
+
+MAGIC: bytes = b"BWPK"
+VERSION: int = 2 # v2: cada registro guarda el mtime del JSON de origen
+SUPPORTED_VERSIONS: Tuple[int, ...] = (1, 2)
+HEADER: struct.Struct = struct.Struct("<4sH") # magic, versión
+FOOTER: struct.Struct = struct.Struct("<QQ4s") # posición del índice, longitud del índice, magic
+
+CODEC_RAW: int = 0
+CODEC_ZSTD: int = 1
+
+def _get_zstandard() -> Any:
+    """
+    Importa el módulo opcional 'zstandard'.
+    """
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("La compresión zstd requiere el paquete 'zstandard' (pip install zstandard).")
+    return zstandard
+
+def get_pack_path(scoring_folder: str, season: int, folder: str = "data/Packs") -> str:
+    """
+    Devuelve la ruta del archivo empaquetado de una temporada y sistema de puntuación.
+
+    Args:
+        scoring_folder (str): Carpeta del sistema de puntuación.
+        season (int): Temporada.
+        folder (str): Carpeta de los archivos empaquetados. Por defecto, 'data/Packs'.
+    """
+    return os.path.join(folder, scoring_folder, f"{season}.pack")
+
+def pack_season(manifest: Manifest, scoring_folder: str, season: int, compress: bool = False, folder: str = "data/Packs") -> str:
+    """
+    Consolida todos los partidos de una temporada y sistema de puntuación en un único archivo.
+
+    El archivo contiene una cabecera, los registros (JSON compacto, en crudo o comprimido con
+    zstd de forma individual), un índice JSON con la posición de cada registro y un pie con la
+    posición del índice:
+
+        [BWPK | versión] [registro 1] ... [registro N] [índice] [posición índice | longitud índice | BWPK]
+
+    Args:
+        manifest (Manifest): Manifiesto con las rutas de los partidos.
+        scoring_folder (str): Carpeta del sistema de puntuación.
+        season (int): Temporada.
+        compress (bool): Si se comprime cada registro con zstd. Por defecto, False.
+        folder (str): Carpeta de los archivos empaquetados. Por defecto, 'data/Packs'.
+
+    Returns:
+        str: Ruta del archivo generado.
+    """
+    compressor: Any = _get_zstandard().ZstdCompressor(level=9) if compress else None
+
+    path: str = get_pack_path(scoring_folder=scoring_folder, season=season, folder=folder)
+    os.makedirs(name=os.path.dirname(path), exist_ok=True)
+
+    index: Dict[str, List] = {}
+    tmp_path: str = f"{path}.{os.getpid()}.tmp"
+    with open(file=tmp_path, mode="wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION))
+        for round in manifest.get_game_rounds(scoring_folder=scoring_folder, season=season):
+            for game_id, entry in manifest.get_games(scoring_folder=scoring_folder, season=season, round=round).items():
+                source_mtime: float = os.path.getmtime(entry["path"])
+                with open(file=entry["path"], mode="r", encoding="utf-8") as game_file:
+                    record: bytes = json.dumps(json.load(fp=game_file), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                codec: int = CODEC_RAW
+                if compressor is not None:
+                    record = compressor.compress(record)
+                    codec = CODEC_ZSTD
+
+                game_name: str = os.path.splitext(os.path.basename(entry["path"]))[0]
+                index[f"{round}/{game_name}"] = [game_id, codec, file.tell(), len(record), source_mtime]
+                file.write(record)
+
+        index_offset: int = file.tell()
+        index_data: bytes = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        file.write(index_data)
+        file.write(FOOTER.pack(index_offset, len(index_data), MAGIC))
+
+    os.replace(src=tmp_path, dst=path)
+    logging.info(msg=f"Temporada {season} ({scoring_folder}) empaquetada en '{path}' con {len(index)} partidos.")
+    return path
+
+class PackReader:
+    """
+    Lector de un archivo empaquetado. El archivo se proyecta en memoria (mmap) y cada partido
+    se decodifica bajo demanda a partir de un memoryview del registro, sin copias intermedias.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self._file = open(file=path, mode="rb")
+        self._mmap: mmap.mmap = mmap.mmap(fileno=self._file.fileno(), length=0, access=mmap.ACCESS_READ)
+        self._view: memoryview = memoryview(self._mmap)
+        self._decompressor: Any = None
+
+        magic, version = HEADER.unpack_from(self._mmap, 0)
+        index_offset, index_length, footer_magic = FOOTER.unpack_from(self._mmap, len(self._mmap) - FOOTER.size)
+        if magic != MAGIC or footer_magic != MAGIC or version not in SUPPORTED_VERSIONS:
+            self.close()
+            raise ValueError(f"El archivo {path} no es un archivo empaquetado válido.")
+
+        self.index: Dict[str, List] = json.loads(str(self._view[index_offset:index_offset + index_length], "utf-8"))
+        # Los archivos v1 no guardan el mtime de cada JSON: se toma el del propio archivo empaquetado
+        self._default_mtime: float = os.path.getmtime(path)
+
+    def __contains__(self, key: Tuple[int, str]) -> bool:
+        round, game_name = key
+        return f"{round}/{game_name}" in self.index
+
+    def get_game_id(self, round: int, game_name: str) -> int:
+        """
+        Devuelve el ID de un partido del archivo.
+
+        Args:
+            round (int): Número de la jornada.
+            game_name (str): Nombre del partido.
+        """
+        return self.index[f"{round}/{game_name}"][0]
+
+    def is_fresh(self, round: int, game_name: str, mtime: Optional[float]) -> bool:
+        """
+        Comprueba si el registro de un partido está al día con su JSON de origen.
+
+        Args:
+            round (int): Número de la jornada.
+            game_name (str): Nombre del partido.
+            mtime (float, optional): Fecha de modificación actual del JSON (p. ej. la del manifiesto).
+                Si no se conoce, se considera que el registro está al día.
+
+        Returns:
+            bool: False si el JSON se ha modificado después de empaquetarlo.
+        """
+        entry: List = self.index[f"{round}/{game_name}"]
+        source_mtime: float = entry[4] if len(entry) > 4 else self._default_mtime
+        return mtime is None or mtime <= source_mtime
+
+    def get(self, round: int, game_name: str) -> Dict:
+        """
+        Decodifica un partido del archivo.
+
+        Args:
+            round (int): Número de la jornada.
+            game_name (str): Nombre del partido.
+
+        Returns:
+            Dict: Contenido del JSON del partido.
+        """
+        entry: Optional[List[int]] = self.index.get(f"{round}/{game_name}")
+        if entry is None:
+            raise KeyError(f"El partido {round}/{game_name} no está en {self.path}.")
+
+        codec, offset, length = entry[1:4]
+        record: memoryview = self._view[offset:offset + length]
+        try:
+            if codec == CODEC_ZSTD:
+                if self._decompressor is None:
+                    self._decompressor = _get_zstandard().ZstdDecompressor()
+                return json.loads(self._decompressor.decompress(record))
+            return json.loads(str(record, "utf-8"))
+        finally:
+            record.release()
+
+    def close(self) -> None:
+        """
+        Libera la proyección en memoria y cierra el archivo.
+        """
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    manifest: Manifest = Manifest.load()
+    for scoring_folder in manifest.games:
+        for season in manifest.get_game_seasons(scoring_folder=scoring_folder):
+            pack_season(manifest=manifest, scoring_folder=scoring_folder, season=season)
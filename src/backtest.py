@@ -0,0 +1,258 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed, Future
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from features import FeatureBuilder, FEATURE_COLUMNS, EVENT_FEATURES
+from processor import BiwengerProcessor
+from definitions.player import PlayerPosition
+
+# Alineación por defecto: 1 portero, 4 defensas, 4 centrocampistas y 2 delanteros
+DEFAULT_FORMATION: Dict[int, int] = {
+    PlayerPosition.PORTERO.get_value(): 1,
+    PlayerPosition.DEFENSA.get_value(): 4,
+    PlayerPosition.CENTROCAMPISTA.get_value(): 4,
+    PlayerPosition.DELANTERO.get_value(): 2,
+}
+
+class SeasonArrays(NamedTuple):
+    season: int # Temporada
+    steps: np.ndarray # Jornada (0..n-1 dentro de la temporada) de cada fila, ordenadas
+    offsets: np.ndarray # Fila inicial de cada jornada (offsets[n] = número de filas)
+    player_ids: np.ndarray # ID del jugador de cada fila
+    points: np.ndarray # Puntos reales de cada fila (NaN si no hay puntos)
+    candidate_offsets: np.ndarray # Primer candidato de cada jornada (candidate_offsets[n] = número de candidatos)
+    candidate_ids: np.ndarray # IDs de los candidatos de cada jornada (jugadores vistos en jornadas anteriores)
+    candidate_positions: np.ndarray # Posición de cada candidato
+    candidate_features: np.ndarray # Variables (FEATURE_COLUMNS) de cada candidato, solo con jornadas anteriores
+
+class RoundContext(NamedTuple):
+    season: int # Temporada
+    step: int # Jornada a alinear (0..n-1 dentro de la temporada)
+    candidates: np.ndarray # IDs de los jugadores disponibles (vistos en jornadas anteriores de la temporada)
+    positions: np.ndarray # Posición de cada candidato
+    features: np.ndarray # Variables de cada candidato, calculadas con jornadas anteriores
+    history_player_ids: np.ndarray # IDs de jugador de las jornadas anteriores de la temporada
+    history_points: np.ndarray # Puntos de las jornadas anteriores de la temporada
+
+# Una estrategia recibe la información previa a la jornada y devuelve los IDs de su alineación
+Strategy = Callable[[RoundContext], Sequence[int]]
+
+# Variables que se recalculan con el historial previo a cada jornada; el resto (contexto del
+# partido: local, rival, forma de los equipos) se toman del último partido del jugador
+HISTORY_WINDOWS: Dict[str, Tuple[str, int]] = {
+    "points_last_3": ("points", 3),
+    "points_last_5": ("points", 5),
+    "minutes_last_5": ("minutes", 5),
+    **{f"{name}_last_5": (name, 5) for name in EVENT_FEATURES.values()},
+}
+
+def _get_pre_round_candidates(history: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calcula los candidatos de una jornada y sus variables usando solo las jornadas anteriores:
+    no se sabe quién va a jugar, por lo que son candidatos todos los jugadores vistos antes.
+
+    Args:
+        history (pd.DataFrame): Filas de las jornadas anteriores de la temporada, ordenadas por jornada.
+
+    Returns:
+        pd.DataFrame: Una fila por candidato (ordenados por ID) con 'player_id' y FEATURE_COLUMNS.
+    """
+    by_player = history.groupby(by="player_id", sort=True)
+    candidates: pd.DataFrame = by_player.tail(1).set_index("player_id").sort_index()[FEATURE_COLUMNS].copy()
+    candidates["games_before"] = candidates["games_before"] + 1
+    candidates["points_season_mean"] = by_player["points"].mean()
+    candidates["points_std_5"] = by_player.tail(5).groupby(by="player_id")["points"].std()
+    for feature, (column, window) in HISTORY_WINDOWS.items():
+        candidates[feature] = by_player.tail(window).groupby(by="player_id")[column].mean()
+    return candidates.reset_index()
+
+def build_season_arrays(features: pd.DataFrame) -> Dict[int, SeasonArrays]:
+    """
+    Convierte la matriz de variables en arrays contiguos por temporada, ordenados por jornada,
+    con los candidatos de cada jornada y sus variables previas a la jornada.
+
+    Args:
+        features (pd.DataFrame): Matriz de variables (FeatureBuilder).
+
+    Returns:
+        Dict[int, SeasonArrays]: Arrays de cada temporada.
+    """
+    seasons: Dict[int, SeasonArrays] = {}
+    for season, table in features.groupby(by="season", sort=True):
+        table = table.sort_values(by=["step", "player_id"], kind="stable", ignore_index=True)
+        steps: np.ndarray = table["step"].to_numpy()
+        steps = np.unique(steps, return_inverse=True)[1]
+        offsets: np.ndarray = np.searchsorted(steps, np.arange(steps.max() + 2))
+
+        # En la primera jornada no hay información previa de la temporada: no hay candidatos
+        candidates: List[pd.DataFrame] = [_get_pre_round_candidates(history=table.iloc[:offsets[step]]) for step in range(1, len(offsets) - 1)]
+        candidate_counts: List[int] = [0, *(len(step_candidates) for step_candidates in candidates)]
+        candidates_table: pd.DataFrame = pd.concat(candidates, ignore_index=True) if candidates else pd.DataFrame(columns=["player_id", *FEATURE_COLUMNS])
+
+        seasons[int(season)] = SeasonArrays(
+            season=int(season),
+            steps=steps,
+            offsets=offsets,
+            player_ids=table["player_id"].to_numpy(dtype=np.int64),
+            points=table["points"].to_numpy(dtype=np.float64),
+            candidate_offsets=np.concatenate([[0], np.cumsum(candidate_counts)]).astype(np.int64),
+            candidate_ids=candidates_table["player_id"].to_numpy(dtype=np.int64),
+            candidate_positions=candidates_table["player_position"].to_numpy(dtype=np.int64),
+            candidate_features=candidates_table[FEATURE_COLUMNS].to_numpy(dtype=np.float64),
+        )
+    return seasons
+
+def pick_lineup(candidates: np.ndarray, positions: np.ndarray, scores: np.ndarray, formation: Dict[int, int] = DEFAULT_FORMATION) -> np.ndarray:
+    """
+    Elige, para cada posición, los candidatos con mayor puntuación según la formación.
+
+    Args:
+        candidates (np.ndarray): IDs de los candidatos.
+        positions (np.ndarray): Posición de cada candidato.
+        scores (np.ndarray): Puntuación de cada candidato (NaN se trata como la peor).
+        formation (Dict[int, int]): Jugadores por posición.
+
+    Returns:
+        np.ndarray: IDs de la alineación.
+    """
+    scores = np.where(np.isnan(scores), -np.inf, scores)
+    lineup: List[np.ndarray] = []
+    for position, count in formation.items():
+        mask: np.ndarray = positions == position
+        ranked: np.ndarray = np.argsort(-scores[mask], kind="stable")[:count]
+        lineup.append(candidates[mask][ranked])
+    return np.concatenate(lineup)
+
+def recent_form_strategy(context: RoundContext) -> Sequence[int]:
+    """
+    Alinea a los jugadores con mejor media de puntos en sus últimos 5 partidos.
+    """
+    scores: np.ndarray = context.features[:, FEATURE_COLUMNS.index("points_last_5")]
+    return pick_lineup(candidates=context.candidates, positions=context.positions, scores=scores)
+
+def season_mean_strategy(context: RoundContext) -> Sequence[int]:
+    """
+    Alinea a los jugadores con mejor media de puntos en lo que va de temporada.
+    """
+    scores: np.ndarray = context.features[:, FEATURE_COLUMNS.index("points_season_mean")]
+    return pick_lineup(candidates=context.candidates, positions=context.positions, scores=scores)
+
+def random_strategy(context: RoundContext) -> Sequence[int]:
+    """
+    Alinea jugadores al azar (referencia mínima), de forma reproducible.
+    """
+    generator: np.random.Generator = np.random.default_rng(seed=context.season * 100 + context.step)
+    scores: np.ndarray = generator.random(size=len(context.candidates))
+    return pick_lineup(candidates=context.candidates, positions=context.positions, scores=scores)
+
+_worker_seasons: Dict[int, SeasonArrays] = {}
+
+def _init_worker(seasons: Dict[int, SeasonArrays]) -> None:
+    """
+    Inicializa un proceso trabajador con los arrays de las temporadas (se envían una sola vez).
+    """
+    global _worker_seasons
+    _worker_seasons = seasons
+
+def _run_season(name: str, strategy: Strategy, season: int, max_players: int) -> List[Tuple[str, int, int, float, int, int]]:
+    """
+    Ejecuta una estrategia jornada a jornada sobre una temporada.
+
+    Args:
+        name (str): Nombre de la estrategia.
+        strategy (Strategy): Estrategia a evaluar.
+        season (int): Temporada.
+        max_players (int): Número máximo de jugadores por alineación.
+
+    Returns:
+        List[Tuple[str, int, int, float, int, int]]: (estrategia, temporada, jornada, puntos, jugadores
+        alineados, jugadores alineados que han puntuado) por jornada.
+    """
+    arrays: SeasonArrays = _worker_seasons[season]
+    results: List[Tuple[str, int, int, float, int, int]] = []
+    for step in range(len(arrays.offsets) - 1):
+        start, end = arrays.offsets[step], arrays.offsets[step + 1]
+        candidates_start, candidates_end = arrays.candidate_offsets[step], arrays.candidate_offsets[step + 1]
+        # Sin candidatos (primera jornada) o sin puntos aún (jornada pendiente) no hay nada que evaluar
+        if candidates_start == candidates_end or np.isnan(arrays.points[start:end]).all():
+            continue
+
+        context: RoundContext = RoundContext(
+            season=season,
+            step=step,
+            candidates=arrays.candidate_ids[candidates_start:candidates_end],
+            positions=arrays.candidate_positions[candidates_start:candidates_end],
+            features=arrays.candidate_features[candidates_start:candidates_end],
+            history_player_ids=arrays.player_ids[:start],
+            history_points=arrays.points[:start],
+        )
+        # Sin repetidos y en el orden de la estrategia, para recortar según su preferencia
+        ids: np.ndarray = np.asarray(strategy(context), dtype=np.int64)
+        lineup: np.ndarray = ids[np.sort(np.unique(ids, return_index=True)[1])][:max_players]
+
+        # Los jugadores de la alineación que no juegan (o no puntúan) la jornada suman 0 puntos
+        played: np.ndarray = np.isin(arrays.player_ids[start:end], lineup) & ~np.isnan(arrays.points[start:end])
+        points: float = float(arrays.points[start:end][played].sum())
+        results.append((name, season, step, points, len(lineup), int(played.sum())))
+    return results
+
+def run_backtest(
+    strategies: Dict[str, Strategy],
+    seasons: Dict[int, SeasonArrays],
+    max_workers: Optional[int] = None,
+    max_players: int = 11
+) -> pd.DataFrame:
+    """
+    Evalúa varias estrategias sobre varias temporadas en paralelo (un proceso por núcleo).
+    Cada estrategia solo recibe la información disponible antes de cada jornada (los candidatos
+    son los jugadores vistos en jornadas anteriores, no los que van a jugar) y su alineación se
+    puntúa con los puntos reales (PlayerPerformance.points); los alineados que no juegan suman 0.
+
+    Args:
+        strategies (Dict[str, Strategy]): Estrategias por nombre (deben poder serializarse, p. ej. funciones de módulo).
+        seasons (Dict[int, SeasonArrays]): Arrays de las temporadas (build_season_arrays).
+        max_workers (int, optional): Número de procesos. Por defecto, uno por núcleo.
+        max_players (int): Número máximo de jugadores por alineación. Por defecto, 11.
+
+    Returns:
+        pd.DataFrame: Una fila por (estrategia, temporada, jornada) con los puntos obtenidos, los
+        jugadores alineados y los que han puntuado.
+    """
+    rows: List[Tuple[str, int, int, float, int, int]] = []
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(seasons,)) as executor:
+        futures: List[Future] = [
+            executor.submit(_run_season, name, strategy, season, max_players)
+            for name, strategy in strategies.items()
+            for season in seasons
+        ]
+        for future in as_completed(fs=futures):
+            rows.extend(future.result())
+
+    results: pd.DataFrame = pd.DataFrame(rows, columns=["strategy", "season", "step", "points", "players", "played"])
+    return results.sort_values(by=["strategy", "season", "step"], ignore_index=True)
+
+def summarize(results: pd.DataFrame) -> pd.DataFrame:
+    """
+    Resume los resultados del backtest: puntos totales por estrategia y temporada.
+
+    Args:
+        results (pd.DataFrame): Resultados de run_backtest.
+    """
+    return results.pivot_table(index="strategy", columns="season", values="points", aggfunc="sum", margins=True, margins_name="total")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    features: pd.DataFrame = FeatureBuilder(processor=BiwengerProcessor()).load()
+    results: pd.DataFrame = run_backtest(
+        strategies={
+            "recent_form": recent_form_strategy,
+            "season_mean": season_mean_strategy,
+            "random": random_strategy,
+        },
+        seasons=build_season_arrays(features=features)
+    )
+    print(summarize(results=results))
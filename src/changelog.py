@@ -0,0 +1,185 @@
+import os
+import json
+import time
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+class Change(NamedTuple):
+    timestamp: float # Momento en que se detectó el cambio
+    entity: str # Tipo de dato ('game' o 'round')
+    path: str # Ruta del archivo modificado
+    entity_id: Optional[int] # ID del partido o de la jornada
+    player_id: Optional[int] # ID del jugador (None si el cambio no es de un jugador)
+    field: str # Campo modificado (p. ej. 'status', 'points', 'events_added')
+    old: Any # Valor anterior
+    new: Any # Valor nuevo
+
+def _get_reports(game_data: Dict) -> Dict[int, Dict]:
+    """
+    Devuelve las actuaciones de un partido por ID de jugador.
+    """
+    reports: Dict[int, Dict] = {}
+    for team in ["home", "away"]:
+        for player_raw_data in (game_data.get(team) or {}).get("reports", []):
+            reports[player_raw_data["player"]["id"]] = player_raw_data
+    return reports
+
+def _get_events(player_raw_data: Dict) -> Counter:
+    """
+    Devuelve los eventos de una actuación como multiconjunto de (tipo, minuto).
+    """
+    return Counter((event.get("type"), event.get("metadata")) for event in player_raw_data.get("events", []))
+
+def diff_game(old: Dict, new: Dict) -> List[Tuple[Optional[int], str, Any, Any]]:
+    """
+    Compara dos versiones del JSON de un partido campo a campo.
+
+    Args:
+        old (Dict): Versión guardada.
+        new (Dict): Versión nueva.
+
+    Returns:
+        List[Tuple[Optional[int], str, Any, Any]]: Cambios como (jugador, campo, anterior, nuevo).
+    """
+    old_data: Dict = old.get("data") or {}
+    new_data: Dict = new.get("data") or {}
+    changes: List[Tuple[Optional[int], str, Any, Any]] = []
+
+    for field in ["status", "date"]:
+        if old_data.get(field) != new_data.get(field):
+            changes.append((None, field, old_data.get(field), new_data.get(field)))
+    for team in ["home", "away"]:
+        old_score: Any = (old_data.get(team) or {}).get("score")
+        new_score: Any = (new_data.get(team) or {}).get("score")
+        if old_score != new_score:
+            changes.append((None, f"{team}_score", old_score, new_score))
+
+    old_reports: Dict[int, Dict] = _get_reports(game_data=old_data)
+    new_reports: Dict[int, Dict] = _get_reports(game_data=new_data)
+    for player_id in old_reports.keys() - new_reports.keys():
+        changes.append((player_id, "player_removed", old_reports[player_id].get("points"), None))
+    for player_id, player_raw_data in new_reports.items():
+        previous: Optional[Dict] = old_reports.get(player_id)
+        if previous is None:
+            changes.append((player_id, "player_added", None, player_raw_data.get("points")))
+            previous = {}
+        elif previous.get("points") != player_raw_data.get("points"):
+            changes.append((player_id, "points", previous.get("points"), player_raw_data.get("points")))
+
+        old_events: Counter = _get_events(player_raw_data=previous)
+        new_events: Counter = _get_events(player_raw_data=player_raw_data)
+        added: List[List] = [list(event) for event in (new_events - old_events).elements()]
+        removed: List[List] = [list(event) for event in (old_events - new_events).elements()]
+        if added:
+            changes.append((player_id, "events_added", None, added))
+        if removed:
+            changes.append((player_id, "events_removed", removed, None))
+
+    return changes
+
+def diff_round(old: Dict, new: Dict) -> List[Tuple[Optional[int], str, Any, Any]]:
+    """
+    Compara dos versiones del JSON de una jornada: su estado y el estado y la fecha de cada partido.
+
+    Args:
+        old (Dict): Versión guardada.
+        new (Dict): Versión nueva.
+
+    Returns:
+        List[Tuple[Optional[int], str, Any, Any]]: Cambios como (None, campo, anterior, nuevo); los
+        campos de un partido se nombran 'game.<ID>.<campo>'.
+    """
+    old_data: Dict = old.get("data") or {}
+    new_data: Dict = new.get("data") or {}
+    changes: List[Tuple[Optional[int], str, Any, Any]] = []
+
+    if old_data.get("status") != new_data.get("status"):
+        changes.append((None, "status", old_data.get("status"), new_data.get("status")))
+
+    old_games: Dict[int, Dict] = {game["id"]: game for game in old_data.get("games", [])}
+    for game in new_data.get("games", []):
+        previous: Dict = old_games.get(game["id"], {})
+        for field in ["status", "date"]:
+            if previous.get(field) != game.get(field):
+                changes.append((None, f"game.{game['id']}.{field}", previous.get(field), game.get(field)))
+
+    return changes
+
+class ChangeLog:
+    """
+    Registro de cambios (change data capture) de los datos guardados, en formato JSON Lines y
+    de solo escritura al final. Cada línea es un Change; los consumidores guardan la posición
+    (en bytes) hasta la que han leído y con read() obtienen solo los cambios posteriores.
+    """
+
+    def __init__(self, path: str = "data/JSONs/changes.jsonl") -> None:
+        self.path: str = path
+
+    def append(self, changes: List[Change]) -> int:
+        """
+        Añade cambios al registro.
+
+        Args:
+            changes (List[Change]): Cambios a añadir.
+
+        Returns:
+            int: Posición final del registro (en bytes).
+        """
+        os.makedirs(name=os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(file=self.path, mode="a", encoding="utf-8") as file:
+            for change in changes:
+                file.write(json.dumps(change._asdict(), ensure_ascii=False, separators=(",", ":")) + "\n")
+            file.flush()
+            return file.tell()
+
+    def record(self, entity: str, path: str, entity_id: Optional[int], old: Optional[Dict], new: Dict) -> List[Change]:
+        """
+        Compara la versión guardada de un archivo con la nueva y registra las diferencias.
+
+        Args:
+            entity (str): Tipo de dato ('game' o 'round').
+            path (str): Ruta del archivo.
+            entity_id (int, optional): ID del partido o de la jornada.
+            old (Dict, optional): Versión guardada (None si no existía).
+            new (Dict): Versión nueva.
+
+        Returns:
+            List[Change]: Cambios registrados.
+        """
+        if old is None:
+            diffs: List[Tuple[Optional[int], str, Any, Any]] = [(None, "created", None, (new.get("data") or {}).get("status"))]
+        elif entity == "game":
+            diffs = diff_game(old=old, new=new)
+        else:
+            diffs = diff_round(old=old, new=new)
+
+        timestamp: float = time.time()
+        changes: List[Change] = [
+            Change(timestamp=timestamp, entity=entity, path=path, entity_id=entity_id, player_id=player_id, field=field, old=old_value, new=new_value)
+            for player_id, field, old_value, new_value in diffs
+        ]
+        if changes:
+            self.append(changes=changes)
+        return changes
+
+    def read(self, offset: int = 0) -> Tuple[List[Change], int]:
+        """
+        Lee los cambios registrados a partir de una posición. Las líneas incompletas (una
+        escritura en curso) se dejan para la siguiente lectura.
+
+        Args:
+            offset (int): Posición (en bytes) desde la que leer. Por defecto, desde el principio.
+
+        Returns:
+            Tuple[List[Change], int]: Cambios leídos y posición desde la que continuar.
+        """
+        if not os.path.exists(self.path):
+            return [], offset
+
+        with open(file=self.path, mode="rb") as file:
+            file.seek(offset)
+            data: bytes = file.read()
+
+        complete: int = data.rfind(b"\n") + 1
+        changes: List[Change] = [Change(**json.loads(line)) for line in data[:complete].splitlines() if line]
+        return changes, offset + complete
@@ -1,50 +1,114 @@
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
 
 from enum import Enum
-from typing import Dict
+from typing import Dict, Optional
 
-load_dotenv()
+@lru_cache(maxsize=None)
+def _load_env() -> None:
+    """
+    Carga el archivo .env en las variables de entorno (una única vez, la primera vez que se
+    necesita una variable de configuración).
+    """
+    from dotenv import load_dotenv
 
-# Credenciales y configuración
-class MyCredential(Enum):
-    BIWENGER_EMAIL = os.environ["BIWENGER_EMAIL"]
-    BIWENGER_PASSWORD = os.environ["BIWENGER_PASSWORD"]
+    load_dotenv()
+
+def get_env(name: str) -> str:
+    """
+    Devuelve una variable de configuración del entorno (o del archivo .env).
+
+    Args:
+        name (str): Nombre de la variable.
 
+    Returns:
+        str: Valor de la variable.
+    """
+    _load_env()
+    try:
+        return os.environ[name]
+    except KeyError:
+        raise KeyError(f"Falta la variable de entorno '{name}'. Defínela en el entorno o en el archivo .env.")
+
+# Credenciales y configuración
 class Credentials:
     email: str
     password: str
 
     def __init__(
         self,
-        email: str = MyCredential.BIWENGER_EMAIL.value,
-        password: str = MyCredential.BIWENGER_PASSWORD.value
+        email: Optional[str] = None,
+        password: Optional[str] = None
     ) -> None:
-        self.email = email
-        self.password = password
+        """
+        Args:
+            email (str, optional): Email de la cuenta. Por defecto, la variable BIWENGER_EMAIL.
+            password (str, optional): Contraseña de la cuenta. Por defecto, la variable BIWENGER_PASSWORD.
+        """
+        self.email = email if email is not None else get_env(name="BIWENGER_EMAIL")
+        self.password = password if password is not None else get_env(name="BIWENGER_PASSWORD")
         
 
 ## Headers a usar en las peticiones de usuario
 class Headers(Enum):
     USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36 Edg/132.0.0.0"
-    X_USER = os.environ["X-USER"]
-    X_LEAGUE = os.environ["X-LEAGUE"]
-    X_VERSION = os.environ["X-VERSION"]
 
 # URLs de la API
 class APIUrls(Enum):
     LOGIN_URL = "https://biwenger.as.com/api/v2/auth/login"
-    SEASON_DATA_URL = "https://cf.biwenger.com/api/v2/competitions/la-liga/season/{year}"
-    ROUND_DATA_URL = "https://biwenger.as.com/api/v2/rounds/la-liga/{round}"
-    GAME_DATA_URL = "https://cf.biwenger.com/api/v2/matches/la-liga/{game}?score={score}"
+    SEASON_DATA_URL = "https://cf.biwenger.com/api/v2/competitions/{competition}/season/{year}"
+    ROUND_DATA_URL = "https://biwenger.as.com/api/v2/rounds/{competition}/{round}"
+    GAME_DATA_URL = "https://cf.biwenger.com/api/v2/matches/{competition}/{game}?score={score}"
 
 # URLs adicionales
 class AdditionalUrls(Enum):
-    COMPETITION_URL = "https://biwenger.as.com/api/v2/competitions/la-liga/data?lang=es&score=1"
+    COMPETITION_URL = "https://biwenger.as.com/api/v2/competitions/{competition}/data?lang=es&score={score}"
     MARKET_DATA_URL = "https://biwenger.as.com/api/v2/market/active"
-    JORNADA_DATA_URL_TEMPLATE = "https://biwenger.as.com/api/v2/rounds/la-liga/{round_id}"
+    JORNADA_DATA_URL_TEMPLATE = "https://biwenger.as.com/api/v2/rounds/{competition}/{round_id}"
     USER_DATA_URL_TEMPLATE = "https://biwenger.as.com/api/v2/user?fields=*,lineup"
 
+# Competiciones
+class Competition(Enum):
+    LA_LIGA = "la-liga"
+    PREMIER_LEAGUE = "premier-league"
+    SERIE_A = "serie-a"
+    BUNDESLIGA = "bundesliga"
+    LIGUE_1 = "ligue-1"
+
+    @classmethod
+    def from_value(cls, value: str) -> "Competition":
+        """
+        Devuelve un objeto Competition a partir de su identificador en la API (p. ej. 'premier-league').
+        """
+        try:
+            return cls(value)
+        except ValueError:
+            raise ValueError(f"Competición no soportada: '{value}'.")
+
+    def get_value(self) -> str:
+        """
+        Devuelve el identificador de la competición en la API.
+        """
+        return self.value
+
+    def get_data_folder(self) -> str:
+        """
+        Devuelve la carpeta de datos de la competición. La Liga usa 'data' (la estructura
+        original) y el resto 'data/Competitions/<competición>', con la misma estructura
+        ('JSONs', 'Packs', 'Market', 'queue.sqlite'...).
+        """
+        if self == Competition.LA_LIGA:
+            return "data"
+        return f"data/Competitions/{self.value}"
+
+    def get_json_folder(self) -> str:
+        """
+        Devuelve la carpeta raíz de los JSON de la competición ('<carpeta de datos>/JSONs').
+        """
+        return f"{self.get_data_folder()}/JSONs"
+
+DEFAULT_COMPETITION: str = Competition.LA_LIGA.get_value()
+
 # Sistema de Puntuaciones
 class ScoringSystem(Enum):
     PICAS = 1
@@ -56,10 +120,10 @@ class ScoringSystem(Enum):
         """
         Devuelve un objeto ScoringSystem a partir de su valor.
         """
-        for scoring_system in cls:
-            if scoring_system.value == value:
-                return scoring_system
-        raise ValueError("Valor de sistema de puntuación no soportado.")
+        try:
+            return cls(value)
+        except ValueError:
+            raise ValueError("Valor de sistema de puntuación no soportado.")
     
     def get_value(self) -> int:
         """
@@ -5,6 +5,7 @@ from .game import Game
 from .status import Status
 from .season import Season
 from .round import Round
+from .batch import validate_many, construct_many
 
 __all__ = [
     "Event",
@@ -15,4 +16,6 @@ __all__ = [
     "Status",
     "Season",
     "Round",
+    "validate_many",
+    "construct_many",
 ]
\ No newline at end of file
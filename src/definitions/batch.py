@@ -0,0 +1,46 @@
+from typing import Dict, List, Type, TypeVar
+from pydantic import BaseModel, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+_adapters: Dict[type, TypeAdapter] = {}
+
+def get_list_adapter(model: Type[M]) -> TypeAdapter:
+    """
+    Devuelve (y reutiliza) el TypeAdapter de List[model].
+
+    Args:
+        model (Type[BaseModel]): Clase de las definiciones.
+    """
+    if model not in _adapters:
+        _adapters[model] = TypeAdapter(List[model])
+    return _adapters[model]
+
+def validate_many(model: Type[M], rows: List[Dict]) -> List[M]:
+    """
+    Valida una lista completa de objetos en una única llamada a pydantic-core.
+
+    Args:
+        model (Type[BaseModel]): Clase de las definiciones.
+        rows (List[Dict]): Campos de cada objeto.
+
+    Returns:
+        List[BaseModel]: Objetos validados.
+    """
+    return get_list_adapter(model=model).validate_python(rows)
+
+def construct_many(model: Type[M], rows: List[Dict]) -> List[M]:
+    """
+    Construye una lista de objetos sin validarlos (model_construct), para datos de confianza.
+    Los atributos derivados (estado, tipo de evento, posición...) se calculan igualmente en
+    model_post_init. Ojo: con pydantic 2.x suele ser más lento que validate_many, ya que
+    model_construct se ejecuta en Python (ver benchmarks/bench_definitions.py).
+
+    Args:
+        model (Type[BaseModel]): Clase de las definiciones.
+        rows (List[Dict]): Campos de cada objeto.
+
+    Returns:
+        List[BaseModel]: Objetos construidos.
+    """
+    return [model.model_construct(**row) for row in rows]
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Dict
+from typing import Any, Dict
 from uuid import uuid4, UUID
 from pydantic import BaseModel
 
@@ -26,10 +26,10 @@ class EventType(Enum):
         """
         Devuelve un objeto EventType a partir de su valor.
         """
-        for event_type in cls:
-            if event_type.value == value:
-                return event_type
-        raise ValueError(f"Valor '{value}' de evento no soportado.")
+        try:
+            return cls(value)
+        except ValueError:
+            raise ValueError(f"Valor '{value}' de evento no soportado.")
     
     def get_value(self) -> int:
         """
@@ -70,8 +70,7 @@ class Event(BaseModel):
     _event_description: str = "" # Descripción del evento (automáticamente generado)
     _event_type: EventType = EventType.DESCONOCIDO # Tipo de evento (automáticamente generado)
 
-    def __init__(self, **data) -> None:
-        super().__init__(**data)
+    def model_post_init(self, context: Any) -> None:
         self._event_type = EventType.from_value(value=self.event_type)
         self._event_description = self._event_type.get_description()
 
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 from pydantic import BaseModel
 
 from .status import Status
@@ -14,8 +15,7 @@ class Game(BaseModel):
     home_team_score: int # Goles del equipo local
     away_team_score: int # Goles del equipo visitante
 
-    def __init__(self, **data) -> None:
-        super().__init__(**data)
+    def model_post_init(self, context: Any) -> None:
         self._status = Status.from_value(value=self.status)
 
     def __str__(self) -> str:
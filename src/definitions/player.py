@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Dict
+from typing import Any, Dict
 from uuid import uuid4, UUID
 from pydantic import BaseModel
 
@@ -15,10 +15,10 @@ class PlayerPosition(Enum):
         """
         Devuelve un objeto PlayerPosition a partir de su valor.
         """
-        for player_position in cls:
-            if player_position.value == value:
-                return player_position
-        raise ValueError("Valor de posición de jugador no soportado.")
+        try:
+            return cls(value)
+        except ValueError:
+            raise ValueError("Valor de posición de jugador no soportado.")
     
     def get_value(self) -> int:
         """
@@ -47,8 +47,7 @@ class Player(BaseModel):
     _player_position: PlayerPosition = PlayerPosition.DESCONOCIDA # Posición del jugador (automáticamente generado)
     _player_position_name: str = "" # Nombre de la posición del jugador (automáticamente generado)
 
-    def __init__(self, **data) -> None:
-        super().__init__(**data)
+    def model_post_init(self, context: Any) -> None:
         self._player_position = PlayerPosition.from_value(value=self.player_position)
         self._player_position_name = self._player_position.get_position()
 
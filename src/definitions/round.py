@@ -1,3 +1,4 @@
+from typing import Any
 from pydantic import BaseModel
 
 from .status import Status
@@ -9,8 +10,7 @@ class Round(BaseModel):
     status: str # Estado de la jornada
     _status: Status = Status.DESCONOCIDO # Estado de la jornada (automáticamente generado)
 
-    def __init__(self, **data) -> None:
-        super().__init__(**data)
+    def model_post_init(self, context: Any) -> None:
         self._status = Status.from_value(value=self.status)
 
     def __str__(self) -> str:
@@ -1,3 +1,4 @@
+from typing import Any
 from pydantic import BaseModel
 
 from .status import Status
@@ -8,8 +9,7 @@ class Season(BaseModel):
     season_status: str # Estado de la temporada
     _status: Status = Status.DESCONOCIDO # Estado de la temporada (automáticamente generado)
 
-    def __init__(self, **data) -> None:
-        super().__init__(**data)
+    def model_post_init(self, context: Any) -> None:
         self._status = Status.from_value(value=self.season_status)
 
     def __str__(self) -> str:
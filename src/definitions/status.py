@@ -12,10 +12,10 @@ class Status(Enum):
         """
         Devuelve un objeto Status a partir de su valor.
         """
-        for round_status in cls:
-            if round_status.value == value:
-                return round_status
-        raise ValueError("Valor de estado no soportado.")
+        try:
+            return cls(value)
+        except ValueError:
+            raise ValueError("Valor de estado no soportado.")
 
     def get_value(self) -> str:
         """
@@ -0,0 +1,248 @@
+import os
+import sys
+import json
+import logging
+from typing import Dict, Generic, Hashable, List, NamedTuple, Optional, TypeVar
+
+import numpy as np
+
+from definitions import *
+from definitions.player import PlayerPosition
+from processor import BiwengerProcessor
+from utils import save_json
+
+K = TypeVar("K", bound=Hashable)
+
+class Interner(Generic[K]):
+    """
+    Asigna claves enteras consecutivas (0, 1, 2...) a valores, de modo que cada valor se guarda
+    una sola vez y las filas de hechos solo referencian enteros.
+    """
+
+    def __init__(self) -> None:
+        self._keys: Dict[K, int] = {}
+        self.values: List[K] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: K) -> bool:
+        return value in self._keys
+
+    def intern(self, value: K) -> int:
+        """
+        Devuelve la clave de un valor, asignándole una nueva si no la tenía.
+
+        Args:
+            value (K): Valor.
+
+        Returns:
+            int: Clave del valor.
+        """
+        key: Optional[int] = self._keys.get(value)
+        if key is None:
+            key = len(self.values)
+            self._keys[value] = key
+            self.values.append(value)
+        return key
+
+    def get_key(self, value: K) -> Optional[int]:
+        """
+        Devuelve la clave de un valor (None si no se ha registrado).
+        """
+        return self._keys.get(value)
+
+class PerformanceFacts(NamedTuple):
+    game_ids: np.ndarray # ID del partido de cada actuación (int64)
+    player_keys: np.ndarray # Clave del jugador en la temporada (int32)
+    team_keys: np.ndarray # Clave del equipo del jugador en la temporada (int32)
+    opponent_keys: np.ndarray # Clave del equipo rival en la temporada (int32)
+    position_keys: np.ndarray # Clave de la posición del jugador (int8)
+    points: np.ndarray # Puntos de la actuación (float32, NaN si no hay puntos)
+
+class SeasonDimensions:
+    """
+    Tablas de dimensiones de una temporada (equipos, jugadores y posiciones) con claves
+    enteras, y la tabla de hechos de actuaciones que las referencia.
+    """
+
+    def __init__(self, season: int) -> None:
+        self.season: int = season
+        self.teams: Interner[int] = Interner()
+        self.players: Interner[int] = Interner()
+        self.positions: Interner[int] = Interner()
+        self.team_names: List[str] = []
+        self.player_names: List[str] = []
+        self.player_positions: List[int] = []
+        self.facts: Optional[PerformanceFacts] = None
+
+    def intern_team(self, team_raw_data: Dict) -> int:
+        """
+        Registra un equipo y devuelve su clave.
+
+        Args:
+            team_raw_data (Dict): Datos del equipo.
+        """
+        key: int = self.teams.intern(value=team_raw_data["id"])
+        if key == len(self.team_names):
+            self.team_names.append(sys.intern(team_raw_data["name"]))
+        return key
+
+    def intern_player(self, player_raw_data: Dict) -> int:
+        """
+        Registra un jugador y devuelve su clave. Si el jugador ya estaba registrado se
+        conservan su nombre y posición, que se guardan una única vez por temporada.
+
+        Args:
+            player_raw_data (Dict): Datos del jugador.
+        """
+        key: int = self.players.intern(value=player_raw_data["id"])
+        if key == len(self.player_names):
+            self.player_names.append(sys.intern(player_raw_data["name"]))
+            self.player_positions.append(self.positions.intern(value=player_raw_data["position"]))
+        return key
+
+    def get_teams(self) -> List[Team]:
+        """
+        Devuelve los equipos de la temporada, en el orden de sus claves.
+        """
+        return [Team(team_id=team_id, team_name=name) for team_id, name in zip(self.teams.values, self.team_names)]
+
+    def get_players(self) -> List[Player]:
+        """
+        Devuelve los jugadores de la temporada, en el orden de sus claves.
+        """
+        return [
+            Player(player_id=player_id, player_name=name, player_position=self.positions.values[position_key])
+            for player_id, name, position_key in zip(self.players.values, self.player_names, self.player_positions)
+        ]
+
+    def to_dict(self) -> Dict:
+        """
+        Devuelve las tablas de dimensiones como diccionario (la clave es la posición en cada lista).
+        """
+        return {
+            "season": self.season,
+            "teams": [[team_id, name] for team_id, name in zip(self.teams.values, self.team_names)],
+            "players": [[player_id, name, position_key] for player_id, name, position_key in zip(self.players.values, self.player_names, self.player_positions)],
+            "positions": [[position, PlayerPosition.from_value(value=position).get_position()] for position in self.positions.values],
+        }
+
+class DimensionTables:
+    """
+    Construye, para cada temporada, las tablas de dimensiones de equipos, jugadores y posiciones
+    con claves enteras y la tabla de hechos de actuaciones en arrays de enteros, leyendo cada
+    partido una única vez. Los nombres solo aparecen en las dimensiones, una vez por temporada.
+    """
+
+    def __init__(self, processor: BiwengerProcessor, folder: Optional[str] = None) -> None:
+        """
+        Args:
+            processor (BiwengerProcessor): Procesador con el sistema de puntuación y la competición a usar.
+            folder (str, optional): Carpeta de las tablas. Por defecto, '<carpeta de la competición>/Dimensions'.
+        """
+        self.processor: BiwengerProcessor = processor
+        self.folder: str = folder or f"{processor.folder}/Dimensions"
+        self.seasons: Dict[int, SeasonDimensions] = {}
+
+    def build_season(self, season: int) -> SeasonDimensions:
+        """
+        Construye las dimensiones y la tabla de hechos de una temporada.
+
+        Args:
+            season (int): Temporada.
+
+        Returns:
+            SeasonDimensions: Dimensiones de la temporada.
+        """
+        scoring_folder: str = self.processor.scoring_folder
+        dimensions: SeasonDimensions = SeasonDimensions(season=season)
+        game_ids: List[int] = []
+        player_keys: List[int] = []
+        team_keys: List[int] = []
+        opponent_keys: List[int] = []
+        points: List[float] = []
+
+        for round in self.processor.manifest.get_game_rounds(scoring_folder=scoring_folder, season=season):
+            for game_name in self.processor._get_round_game_names(scoring_folder=scoring_folder, round=round, season=season):
+                game_raw_data: Dict = self.processor._load_game(game_name=game_name, round=round, season=season)
+                keys: Dict[str, int] = {team: dimensions.intern_team(team_raw_data=game_raw_data["data"][team]) for team in ["home", "away"]}
+
+                for team, opponent in (("home", "away"), ("away", "home")):
+                    for player_raw_data in game_raw_data["data"][team]["reports"]:
+                        game_ids.append(game_raw_data["data"]["id"])
+                        player_keys.append(dimensions.intern_player(player_raw_data=player_raw_data["player"]))
+                        team_keys.append(keys[team])
+                        opponent_keys.append(keys[opponent])
+                        points.append(np.nan if player_raw_data["points"] is None else player_raw_data["points"])
+
+        player_positions: np.ndarray = np.asarray(dimensions.player_positions, dtype=np.int8)
+        player_keys_array: np.ndarray = np.asarray(player_keys, dtype=np.int32)
+        dimensions.facts = PerformanceFacts(
+            game_ids=np.asarray(game_ids, dtype=np.int64),
+            player_keys=player_keys_array,
+            team_keys=np.asarray(team_keys, dtype=np.int32),
+            opponent_keys=np.asarray(opponent_keys, dtype=np.int32),
+            position_keys=player_positions[player_keys_array] if len(player_keys_array) else np.empty(0, dtype=np.int8),
+            points=np.asarray(points, dtype=np.float32),
+        )
+        self.seasons[season] = dimensions
+        return dimensions
+
+    def build(self) -> Dict[int, SeasonDimensions]:
+        """
+        Construye las dimensiones de todas las temporadas.
+
+        Returns:
+            Dict[int, SeasonDimensions]: Dimensiones de cada temporada.
+        """
+        for season in self.processor.manifest.get_game_seasons(scoring_folder=self.processor.scoring_folder):
+            dimensions: SeasonDimensions = self.build_season(season=season)
+            logging.info(msg=f"Temporada {season}: {len(dimensions.teams)} equipos, {len(dimensions.players)} jugadores, {len(dimensions.facts.game_ids)} actuaciones.")
+        return self.seasons
+
+    def save(self) -> None:
+        """
+        Guarda cada temporada en '<carpeta>/<puntuación>/<temporada>.json' (dimensiones) y
+        '<carpeta>/<puntuación>/<temporada>.npz' (tabla de hechos).
+        """
+        folder: str = os.path.join(self.folder, self.processor.scoring_folder)
+        os.makedirs(name=folder, exist_ok=True)
+        for season, dimensions in self.seasons.items():
+            save_json(path=os.path.join(folder, f"{season}.json"), data=dimensions.to_dict())
+            tmp_path: str = os.path.join(folder, f"{season}.{os.getpid()}.tmp.npz")
+            np.savez_compressed(tmp_path, **dimensions.facts._asdict())
+            os.replace(src=tmp_path, dst=os.path.join(folder, f"{season}.npz"))
+
+    def load(self) -> Dict[int, SeasonDimensions]:
+        """
+        Carga las temporadas guardadas con save().
+
+        Returns:
+            Dict[int, SeasonDimensions]: Dimensiones de cada temporada.
+        """
+        folder: str = os.path.join(self.folder, self.processor.scoring_folder)
+        for file in sorted(os.listdir(path=folder)) if os.path.isdir(folder) else []:
+            if not file.endswith(".json"):
+                continue
+            with open(file=os.path.join(folder, file), mode="r", encoding="utf-8") as json_file:
+                data: Dict = json.load(fp=json_file)
+
+            dimensions: SeasonDimensions = SeasonDimensions(season=data["season"])
+            for position, _ in data["positions"]:
+                dimensions.positions.intern(value=position)
+            for team_id, name in data["teams"]:
+                dimensions.intern_team(team_raw_data={"id": team_id, "name": name})
+            for player_id, name, position_key in data["players"]:
+                dimensions.intern_player(player_raw_data={"id": player_id, "name": name, "position": dimensions.positions.values[position_key]})
+            with np.load(file=os.path.join(folder, f"{file[:-5]}.npz")) as facts:
+                dimensions.facts = PerformanceFacts(**{field: facts[field] for field in PerformanceFacts._fields})
+            self.seasons[dimensions.season] = dimensions
+        return self.seasons
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    tables: DimensionTables = DimensionTables(processor=BiwengerProcessor())
+    tables.build()
+    tables.save()
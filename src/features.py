@@ -0,0 +1,205 @@
+import os
+import json
+import hashlib
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from definitions import *
+from definitions.event import EventType
+from processor import BiwengerProcessor
+from minutes import get_performance_minutes
+
+FEATURE_VERSION: int = 3
+
+# Eventos cuyo recuento medio reciente se usa como variable
+EVENT_FEATURES: Dict[EventType, str] = {
+    EventType.GOL: "goals",
+    EventType.GOL_PENALTI: "penalty_goals",
+    EventType.ASISTENCIA: "assists",
+    EventType.TARJETA_AMARILLA: "yellow_cards",
+    EventType.TAREJETA_ROJA: "red_cards",
+    EventType.SUSTITUCION: "substituted",
+    EventType.ENTRADA_BANQUILLO: "from_bench",
+}
+
+FEATURE_COLUMNS: List[str] = [
+    "is_home",
+    "player_position",
+    "games_before",
+    "points_last_3",
+    "points_last_5",
+    "points_season_mean",
+    "points_std_5",
+    "minutes_last_5",
+    "team_form",
+    "opponent_form",
+    "opponent_conceded",
+    *[f"{name}_last_5" for name in EVENT_FEATURES.values()],
+]
+
+def get_corpus_version(processor: BiwengerProcessor) -> str:
+    """
+    Calcula un hash de la versión del corpus del sistema de puntuación del procesador a partir
+    del manifiesto (ruta, estado y fecha de modificación de cada partido y jornada).
+
+    Args:
+        processor (BiwengerProcessor): Procesador con el sistema de puntuación a usar.
+
+    Returns:
+        str: Hash de la versión del corpus.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"features-v{FEATURE_VERSION}".encode())
+    digest.update(json.dumps(processor.manifest.rounds, sort_keys=True).encode())
+    digest.update(json.dumps(processor.manifest.games.get(processor.scoring_folder, {}), sort_keys=True).encode())
+    return digest.hexdigest()[:16]
+
+class FeatureBuilder:
+    """
+    Construye la matriz de variables por (jugador, partido) a partir de la salida del procesador:
+    puntos recientes, forma del equipo y del rival, local/visitante y recuento de eventos.
+    Todas las variables de una fila usan solo partidos anteriores, por lo que pueden usarse
+    para predecir los puntos de ese partido.
+
+    Las matrices se guardan en '<carpeta de la competición>/Features/<puntuación>-<versión del corpus>.npz',
+    de modo que los reentrenamientos las reutilizan mientras el corpus no cambie.
+    """
+
+    def __init__(self, processor: BiwengerProcessor, folder: Optional[str] = None) -> None:
+        """
+        Args:
+            processor (BiwengerProcessor): Procesador con el sistema de puntuación y la competición a usar.
+            folder (str, optional): Carpeta de la caché. Por defecto, '<carpeta de la competición>/Features'.
+        """
+        self.processor: BiwengerProcessor = processor
+        self.folder: str = folder or f"{processor.folder}/Features"
+
+    def _get_cache_path(self, version: str) -> str:
+        """
+        Devuelve la ruta de la caché de una versión del corpus.
+
+        Args:
+            version (str): Versión del corpus.
+        """
+        return os.path.join(self.folder, f"{self.processor.scoring_folder}-{version}.npz")
+
+    def load(self, force: bool = False) -> pd.DataFrame:
+        """
+        Devuelve la matriz de variables, desde la caché si existe para la versión actual del corpus.
+
+        Args:
+            force (bool): Si se recalcula aunque exista la caché. Por defecto, False.
+
+        Returns:
+            pd.DataFrame: Matriz de variables.
+        """
+        path: str = self._get_cache_path(version=get_corpus_version(processor=self.processor))
+        if not force and os.path.exists(path):
+            with np.load(file=path) as cache:
+                return pd.DataFrame({column: cache[column] for column in cache.files})
+
+        features: pd.DataFrame = self.build()
+
+        os.makedirs(name=self.folder, exist_ok=True)
+        tmp_path: str = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez_compressed(tmp_path, **{column: features[column].to_numpy() for column in features.columns})
+        os.replace(src=tmp_path, dst=path)
+        logging.info(msg=f"Matriz de variables guardada en '{path}' ({len(features)} filas).")
+        return features
+
+    def _get_base_table(self) -> pd.DataFrame:
+        """
+        Une actuaciones, partidos, jornadas y jugadores en una tabla con una fila por actuación.
+        """
+        rounds: Dict[int, Round] = {round.round_id: round for round in self.processor.get_rounds()}
+        games: Dict[int, Game] = {game.game_id: game for game in self.processor.get_games()}
+        positions: Dict[int, int] = {player.player_id: player.player_position for player in self.processor.get_players()}
+        performances, events = self.processor.get_performances()
+        minutes: np.ndarray = get_performance_minutes(performances=performances, events=events)
+
+        event_counts: Dict[str, Dict] = {name: {} for name in EVENT_FEATURES.values()}
+        event_names: Dict[int, str] = {event_type.get_value(): name for event_type, name in EVENT_FEATURES.items()}
+        for event in events:
+            name: Optional[str] = event_names.get(event.event_type)
+            if name is not None:
+                counts: Dict = event_counts[name]
+                counts[event.player_performance_id] = counts.get(event.player_performance_id, 0) + 1
+
+        rows: List[Dict] = []
+        for performance, performance_minutes in zip(performances, minutes):
+            game: Optional[Game] = games.get(performance.game_id)
+            if game is None or game.round_id not in rounds:
+                continue
+            is_home: bool = performance.team_id == game.home_team_id
+            rows.append({
+                "season": rounds[game.round_id].season_id,
+                "round_id": game.round_id,
+                "game_id": game.game_id,
+                "date": game.date,
+                "player_id": performance.player_id,
+                "team_id": performance.team_id,
+                "opponent_id": game.away_team_id if is_home else game.home_team_id,
+                "is_home": int(is_home),
+                "player_position": positions.get(performance.player_id, 0),
+                "points": np.nan if performance.points is None else performance.points,
+                "minutes": performance_minutes,
+                **{name: counts.get(performance.player_performance_id, 0) for name, counts in event_counts.items()},
+            })
+
+        table: pd.DataFrame = pd.DataFrame(rows)
+        # Índice temporal de cada jornada (las jornadas se ordenan por temporada e ID)
+        table["step"] = table.groupby(["season", "round_id"]).ngroup()
+        return table.sort_values(by=["player_id", "date", "game_id"], ignore_index=True)
+
+    def build(self) -> pd.DataFrame:
+        """
+        Calcula la matriz de variables.
+
+        Returns:
+            pd.DataFrame: Una fila por actuación con las columnas de FEATURE_COLUMNS, el objetivo
+            ('points', NaN si aún no se conoce), los minutos jugados ('minutes', para calcular
+            puntos por 90 minutos), el recuento de eventos del partido y las claves (temporada,
+            jornada, partido, jugador...).
+        """
+        table: pd.DataFrame = self._get_base_table()
+
+        by_player = table.groupby(by="player_id", sort=False)
+        previous_points: pd.Series = by_player["points"].shift(1)
+        table["games_before"] = by_player.cumcount()
+        table["points_last_3"] = previous_points.groupby(table["player_id"]).rolling(window=3, min_periods=1).mean().reset_index(level=0, drop=True)
+        table["points_last_5"] = previous_points.groupby(table["player_id"]).rolling(window=5, min_periods=1).mean().reset_index(level=0, drop=True)
+        table["points_std_5"] = previous_points.groupby(table["player_id"]).rolling(window=5, min_periods=2).std().reset_index(level=0, drop=True)
+        table["minutes_last_5"] = by_player["minutes"].shift(1).groupby(table["player_id"]).rolling(window=5, min_periods=1).mean().reset_index(level=0, drop=True)
+        table["points_season_mean"] = previous_points.groupby([table["player_id"], table["season"]]).expanding().mean().reset_index(level=[0, 1], drop=True)
+
+        for name in EVENT_FEATURES.values():
+            previous_counts: pd.Series = by_player[name].shift(1)
+            table[f"{name}_last_5"] = previous_counts.groupby(table["player_id"]).rolling(window=5, min_periods=1).mean().reset_index(level=0, drop=True)
+
+        # Forma de los equipos: puntos totales de sus jugadores (y de sus rivales) en los 5 partidos anteriores
+        team_games: pd.DataFrame = table.groupby(by=["team_id", "game_id", "opponent_id", "date"], as_index=False)["points"].sum(min_count=1)
+        conceded: pd.DataFrame = team_games.rename(columns={"team_id": "opponent_id", "opponent_id": "team_id", "points": "conceded"})
+        team_games = team_games.merge(conceded[["team_id", "game_id", "conceded"]], on=["team_id", "game_id"], how="left")
+        team_games = team_games.sort_values(by=["team_id", "date", "game_id"], ignore_index=True)
+        by_team = team_games.groupby(by="team_id", sort=False)
+        for column, feature in (("points", "form"), ("conceded", "conceded_form")):
+            team_games[feature] = by_team[column].shift(1).groupby(team_games["team_id"]).rolling(window=5, min_periods=1).mean().reset_index(level=0, drop=True)
+
+        team_form: pd.DataFrame = team_games[["team_id", "game_id", "form", "conceded_form"]]
+        table = table.merge(team_form.rename(columns={"form": "team_form"})[["team_id", "game_id", "team_form"]], on=["team_id", "game_id"], how="left")
+        table = table.merge(
+            team_form.rename(columns={"team_id": "opponent_id", "form": "opponent_form", "conceded_form": "opponent_conceded"}),
+            on=["opponent_id", "game_id"],
+            how="left"
+        )
+
+        return table[["season", "round_id", "step", "game_id", "date", "player_id", "team_id", "opponent_id", *FEATURE_COLUMNS, "points", "minutes", *EVENT_FEATURES.values()]]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    features: pd.DataFrame = FeatureBuilder(processor=BiwengerProcessor()).load()
+    print(features.describe().T)
@@ -0,0 +1,302 @@
+import os
+import json
+import asyncio
+import inspect
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from config import APIUrls, ScoringSystem, Credentials
+from scraper import BiwengerScraper
+
+if TYPE_CHECKING:
+    import aiohttp
+
+LIVE_STATUSES: Tuple[str, ...] = ("in_progress", "preview")
+
+class PointsDelta(NamedTuple):
+    game_id: int # ID del partido
+    score: int # Sistema de puntuación
+    player_id: int # ID del jugador
+    previous_points: Optional[int] # Puntos antes del cambio (None si el jugador no aparecía)
+    points: Optional[int] # Puntos tras el cambio
+    status: str # Estado del partido tras el cambio
+
+class LiveGame(NamedTuple):
+    game_id: int # ID del partido
+    path: Optional[str] # Ruta del JSON del partido en el almacén (None si no se puede resolver)
+
+class LiveRoundWatcher:
+    """
+    Vigila los partidos en juego ('in_progress') y por comenzar ('preview') de la jornada actual.
+
+    Cada ciclo consulta en paralelo todos los partidos vivos y sistemas de puntuación usando
+    peticiones condicionales (ETag / Last-Modified). El intervalo entre ciclos se reduce al
+    mínimo cuando hay cambios y crece exponencialmente mientras no los hay. Los cambios de
+    puntos se guardan en la carpeta 'Games' de la competición del scraper y se notifican a los suscriptores.
+    """
+
+    def __init__(
+        self,
+        scraper: BiwengerScraper,
+        scores: Optional[List[int]] = None,
+        min_interval: float = 5,
+        max_interval: float = 120,
+        round_refresh_interval: float = 300
+    ) -> None:
+        self.scraper: BiwengerScraper = scraper
+        self.scores: List[int] = scores if scores is not None else [scoring_system.get_value() for scoring_system in ScoringSystem]
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.round_refresh_interval: float = round_refresh_interval
+
+        self._subscribers: List[Callable[[PointsDelta], Any]] = []
+        self._validators: Dict[Tuple[int, int], Dict[str, str]] = {}
+        self._points: Dict[Tuple[int, int], Dict[int, Optional[int]]] = {}
+        self._statuses: Dict[Tuple[int, int], str] = {}
+
+    def subscribe(self, callback: Callable[[PointsDelta], Any]) -> None:
+        """
+        Registra una función (síncrona o asíncrona) que recibirá cada cambio de puntos.
+
+        Args:
+            callback (Callable[[PointsDelta], Any]): Función a notificar.
+        """
+        self._subscribers.append(callback)
+
+    def _resolve_round(self, round_id: int) -> Optional[Tuple[str, str]]:
+        """
+        Busca la temporada y el nombre corto ('R12') de una jornada en los archivos de temporadas.
+
+        Args:
+            round_id (int): ID de la jornada.
+
+        Returns:
+            Tuple[str, str] | None: Temporada y nombre corto de la jornada, si se encuentran.
+        """
+        seasons_folder: str = f"{self.scraper.root}/Seasons"
+        if not os.path.exists(seasons_folder):
+            return None
+
+        for file in sorted(os.listdir(path=seasons_folder), reverse=True):
+            if not file.endswith(".json"):
+                continue
+            with open(file=os.path.join(seasons_folder, file), mode="r", encoding="utf-8") as season_file:
+                season_data: Dict = json.load(fp=season_file)
+            for round in (season_data.get("data") or {}).get("rounds", []):
+                if round["id"] == round_id:
+                    return file.split(sep=".")[0], round["short"]
+        return None
+
+    def _get_live_games(self) -> Tuple[Dict[Tuple[int, int], LiveGame], bool]:
+        """
+        Obtiene la jornada actual y devuelve sus partidos vivos para cada sistema de puntuación.
+
+        Returns:
+            Dict[Tuple[int, int], LiveGame]: Partidos vivos indexados por (ID del partido, puntuación).
+            bool: Si la jornada actual ha terminado.
+        """
+        round_data: Dict = self.scraper._get_round_json(round=None)["data"]
+        resolved: Optional[Tuple[str, str]] = self._resolve_round(round_id=round_data["id"])
+
+        games: Dict[Tuple[int, int], LiveGame] = {}
+        for game in round_data["games"]:
+            if game["status"] not in LIVE_STATUSES:
+                continue
+            for score in self.scores:
+                path: Optional[str] = None
+                if resolved is not None:
+                    season, round_name = resolved
+                    score_folder: str = self.scraper._get_score_folder(score=score)
+                    game_name: str = game["home"]["name"] + " vs " + game["away"]["name"]
+                    path = f"{self.scraper.root}/Games/{score_folder}/{season}/{round_name}/{game_name}.json"
+                games[(game["id"], score)] = LiveGame(game_id=game["id"], path=path)
+
+        return games, round_data["status"] == "finished"
+
+    def _get_points(self, game_data: Dict) -> Dict[int, Optional[int]]:
+        """
+        Extrae los puntos de cada jugador de un partido.
+
+        Args:
+            game_data (Dict): Datos del partido ('data' de la respuesta).
+        """
+        points: Dict[int, Optional[int]] = {}
+        for team in ["home", "away"]:
+            for report in (game_data.get(team) or {}).get("reports") or []:
+                points[report["player"]["id"]] = report.get("points")
+        return points
+
+    def _seed_from_store(self, key: Tuple[int, int], game: LiveGame) -> None:
+        """
+        Inicializa los puntos y el estado conocidos de un partido a partir de su JSON guardado,
+        para que la primera consulta solo notifique y guarde los cambios reales.
+
+        Args:
+            key (Tuple[int, int]): ID del partido y sistema de puntuación.
+            game (LiveGame): Partido a consultar.
+        """
+        if game.path is None or not os.path.exists(game.path):
+            return
+        try:
+            with open(file=game.path, mode="r", encoding="utf-8") as file:
+                stored: Dict = json.load(fp=file)
+            game_data: Dict = stored["data"]
+            points: Dict[int, Optional[int]] = self._get_points(game_data=game_data)
+            status: str = game_data["status"]
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError, AttributeError) as e:
+            logging.warning(msg=f"No se pudo leer el partido guardado {game.path}: {e}")
+            return
+        self._points[key] = points
+        self._statuses[key] = status
+
+    async def _fetch_game(self, session: "aiohttp.ClientSession", game_id: int, score: int) -> Optional[Dict]:
+        """
+        Descarga un partido con una petición condicional.
+
+        Args:
+            session (aiohttp.ClientSession): Sesión HTTP.
+            game_id (int): ID del partido.
+            score (int): Sistema de puntuación.
+
+        Returns:
+            Dict | None: Respuesta del partido, o None si no ha cambiado.
+        """
+        url: str = APIUrls.GAME_DATA_URL.value.format(competition=self.scraper.competition, game=game_id, score=score)
+        headers: Dict[str, str] = dict(self.scraper.GameDataExtractor.get_user_agent_header())
+        headers.update(self._validators.get((game_id, score), {}))
+
+        async with session.get(url=url, headers=headers) as response:
+            if response.status == 304:
+                return None
+            response.raise_for_status()
+
+            validators: Dict[str, str] = {}
+            if "ETag" in response.headers:
+                validators["If-None-Match"] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                validators["If-Modified-Since"] = response.headers["Last-Modified"]
+            self._validators[(game_id, score)] = validators
+
+            return await response.json(content_type=None)
+
+    async def _notify(self, delta: PointsDelta) -> None:
+        """
+        Notifica un cambio de puntos a todos los suscriptores.
+
+        Args:
+            delta (PointsDelta): Cambio de puntos.
+        """
+        for callback in self._subscribers:
+            try:
+                result: Any = callback(delta)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logging.error(msg=f"Error notificando a un suscriptor: {e}")
+
+    async def _poll_game(self, session: "aiohttp.ClientSession", key: Tuple[int, int], game: LiveGame) -> Optional[str]:
+        """
+        Consulta un partido, guarda y notifica sus cambios de puntos.
+
+        Args:
+            session (aiohttp.ClientSession): Sesión HTTP.
+            key (Tuple[int, int]): ID del partido y sistema de puntuación.
+            game (LiveGame): Partido a consultar.
+
+        Returns:
+            str | None: Estado del partido si ha cambiado algo, None en caso contrario.
+        """
+        import aiohttp
+
+        game_id, score = key
+        if key not in self._points:
+            self._seed_from_store(key=key, game=game)
+        try:
+            response: Optional[Dict] = await self._fetch_game(session=session, game_id=game_id, score=score)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logging.warning(msg=f"Error consultando el partido {game_id} (puntuación {score}): {e}")
+            return None
+
+        if response is None or response.get("status") != 200 or response.get("data") is None:
+            return None
+
+        status: str = response["data"]["status"]
+        points: Dict[int, Optional[int]] = self._get_points(game_data=response["data"])
+        previous: Dict[int, Optional[int]] = self._points.get(key, {})
+
+        deltas: List[PointsDelta] = [
+            PointsDelta(
+                game_id=game_id,
+                score=score,
+                player_id=player_id,
+                previous_points=previous.get(player_id),
+                points=player_points,
+                status=status
+            )
+            for player_id, player_points in points.items()
+            if player_id not in previous or previous[player_id] != player_points
+        ]
+        previous_status: Optional[str] = self._statuses.get(key)
+        self._points[key] = points
+        self._statuses[key] = status
+        if not deltas and status == previous_status:
+            return None
+
+        if game.path is not None:
+            os.makedirs(name=os.path.dirname(game.path), exist_ok=True)
+            self.scraper._save_payload(entity="game", path=game.path, entity_id=game_id, data=response)
+            self.scraper.manifest.add_game(path=game.path, game_id=game_id, status=status)
+
+        for delta in deltas:
+            await self._notify(delta=delta)
+
+        return status
+
+    async def run(self) -> None:
+        """
+        Vigila la jornada actual hasta que termina.
+        """
+        # aiohttp solo se importa al vigilar la jornada, no al importar el módulo
+        import aiohttp
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        interval: float = self.min_interval
+        since_round_refresh: float = self.round_refresh_interval
+
+        games: Dict[Tuple[int, int], LiveGame] = {}
+        timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            while True:
+                if since_round_refresh >= self.round_refresh_interval or not games:
+                    games, round_finished = await loop.run_in_executor(None, self._get_live_games)
+                    since_round_refresh = 0
+                    if round_finished and not games:
+                        logging.info(msg="La jornada actual ha terminado. Deteniendo la vigilancia.")
+                        return
+                    logging.info(msg=f"Vigilando {len(games)} partidos en directo.")
+
+                statuses: List[Optional[str]] = await asyncio.gather(*[
+                    self._poll_game(session=session, key=key, game=game)
+                    for key, game in games.items()
+                ])
+
+                self.scraper.manifest.save()
+                for key, status in zip(list(games), statuses):
+                    if status is not None and status not in LIVE_STATUSES:
+                        del games[key]
+
+                if any(status is not None for status in statuses):
+                    interval = self.min_interval
+                else:
+                    interval = min(interval * 2, self.max_interval)
+
+                await asyncio.sleep(interval)
+                since_round_refresh += interval
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    scraper: BiwengerScraper = BiwengerScraper(credentials=Credentials())
+    watcher: LiveRoundWatcher = LiveRoundWatcher(scraper=scraper)
+    watcher.subscribe(callback=lambda delta: logging.info(msg=f"{delta}"))
+    asyncio.run(watcher.run())
@@ -0,0 +1,240 @@
+import os
+import json
+import logging
+from typing import Dict, List, Optional
+
+class Manifest:
+    """
+    Índice de los datos guardados en 'data/JSONs', mantenido por el scraper.
+
+    Guarda en un único JSON compacto las rutas de las temporadas, de las jornadas
+    (indexadas por número) y de los partidos de cada sistema de puntuación, junto con
+    su estado y fecha de modificación:
+
+        {
+            "seasons": {temporada: ruta},
+            "rounds": {temporada: {jornada: ruta}},
+            "games": {puntuación: {temporada: {jornada: {game_id: {"path", "status", "mtime"}}}}}
+        }
+
+    De este modo, el procesador resuelve todas las rutas con una sola lectura en vez de
+    recorrer los directorios con os.listdir.
+    """
+
+    def __init__(self, path: str = "data/JSONs/manifest.json", root: str = "data/JSONs") -> None:
+        self.path: str = path
+        self.root: str = root
+        self.seasons: Dict[str, str] = {}
+        self.rounds: Dict[str, Dict[str, str]] = {}
+        self.games: Dict[str, Dict[str, Dict[str, Dict[str, Dict]]]] = {}
+        self._dirty: bool = False
+
+    @classmethod
+    def load(cls, path: str = "data/JSONs/manifest.json", root: str = "data/JSONs", save: bool = True) -> "Manifest":
+        """
+        Carga el manifiesto. Si no existe, lo reconstruye a partir de los archivos y lo guarda.
+
+        Args:
+            path (str): Ruta del manifiesto.
+            root (str): Carpeta raíz de los datos.
+            save (bool): Si guardar el manifiesto reconstruido. Con False, solo se construye en memoria.
+
+        Returns:
+            Manifest: Manifiesto cargado.
+        """
+        manifest: Manifest = cls(path=path, root=root)
+        if not os.path.exists(path):
+            logging.info(msg=f"No existe el manifiesto '{path}'. Reconstruyéndolo...")
+            manifest.rebuild()
+            if save:
+                manifest.save()
+            return manifest
+
+        with open(file=path, mode="r", encoding="utf-8") as file:
+            data: Dict = json.load(fp=file)
+        manifest.seasons = data.get("seasons", {})
+        manifest.rounds = data.get("rounds", {})
+        manifest.games = data.get("games", {})
+        return manifest
+
+    def save(self) -> None:
+        """
+        Guarda el manifiesto de forma atómica (solo si ha cambiado).
+        """
+        if not self._dirty and os.path.exists(self.path):
+            return
+
+        folder: str = os.path.dirname(self.path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(name=folder)
+
+        tmp_path: str = f"{self.path}.{os.getpid()}.tmp"
+        with open(file=tmp_path, mode="w", encoding="utf-8") as file:
+            json.dump(
+                obj={"seasons": self.seasons, "rounds": self.rounds, "games": self.games},
+                fp=file,
+                ensure_ascii=False,
+                separators=(",", ":")
+            )
+        os.replace(src=tmp_path, dst=self.path)
+        self._dirty = False
+
+    def add_season(self, season: str, path: str) -> None:
+        """
+        Registra el archivo de una temporada.
+
+        Args:
+            season (str): Temporada.
+            path (str): Ruta del archivo.
+        """
+        self.seasons[str(season)] = path
+        self._dirty = True
+
+    def add_round(self, season: str, round: str, path: str) -> None:
+        """
+        Registra el archivo de una jornada.
+
+        Args:
+            season (str): Temporada.
+            round (str): Nombre corto de la jornada (p. ej. 'R12').
+            path (str): Ruta del archivo.
+        """
+        self.rounds.setdefault(str(season), {})[round.lstrip("R")] = path
+        self._dirty = True
+
+    def add_game(self, path: str, game_id: int, status: str) -> None:
+        """
+        Registra el archivo de un partido, con ruta '<raíz>/Games/<puntuación>/<temporada>/<jornada>/<partido>.json'.
+
+        Args:
+            path (str): Ruta del archivo.
+            game_id (int): ID del partido.
+            status (str): Estado del partido.
+        """
+        scoring_folder, season, round = os.path.relpath(path, start=os.path.join(self.root, "Games")).split(sep=os.sep)[:3]
+        self.games.setdefault(scoring_folder, {}).setdefault(season, {}).setdefault(round.lstrip("R"), {})[str(game_id)] = {
+            "path": path,
+            "status": status,
+            "mtime": os.path.getmtime(path) if os.path.exists(path) else None
+        }
+        self._dirty = True
+
+    def rebuild(self) -> None:
+        """
+        Reconstruye el manifiesto recorriendo una vez todos los archivos de la carpeta raíz.
+        """
+        self.seasons, self.rounds, self.games = {}, {}, {}
+
+        seasons_folder: str = os.path.join(self.root, "Seasons")
+        if os.path.isdir(seasons_folder):
+            for file in os.listdir(path=seasons_folder):
+                if file.endswith(".json"):
+                    self.add_season(season=file[:-5], path=os.path.join(seasons_folder, file))
+
+        rounds_folder: str = os.path.join(self.root, "Rounds")
+        if os.path.isdir(rounds_folder):
+            for season in os.listdir(path=rounds_folder):
+                if not os.path.isdir(os.path.join(rounds_folder, season)):
+                    continue
+                for file in os.listdir(path=os.path.join(rounds_folder, season)):
+                    if file.endswith(".json"):
+                        self.add_round(season=season, round=file[:-5], path=os.path.join(rounds_folder, season, file))
+
+        games_folder: str = os.path.join(self.root, "Games")
+        if os.path.isdir(games_folder):
+            for dirpath, _, files in os.walk(top=games_folder):
+                for file in files:
+                    if not file.endswith(".json"):
+                        continue
+                    path: str = os.path.join(dirpath, file)
+                    try:
+                        with open(file=path, mode="r", encoding="utf-8") as game_file:
+                            game_data: Dict = json.load(fp=game_file)["data"]
+                        self.add_game(path=path, game_id=game_data["id"], status=game_data["status"])
+                    except (json.JSONDecodeError, KeyError, TypeError) as e:
+                        logging.warning(msg=f"Archivo de partido no válido '{path}': {e}")
+
+        self._dirty = True
+
+    def get_seasons(self) -> List[int]:
+        """
+        Devuelve las temporadas con archivo de temporada.
+        """
+        return sorted(int(season) for season in self.seasons)
+
+    def get_season_path(self, season: int) -> Optional[str]:
+        """
+        Devuelve la ruta del archivo de una temporada.
+
+        Args:
+            season (int): Temporada.
+        """
+        return self.seasons.get(str(season))
+
+    def get_round_seasons(self) -> List[int]:
+        """
+        Devuelve las temporadas con archivos de jornadas.
+        """
+        return sorted(int(season) for season in self.rounds)
+
+    def get_rounds(self, season: int) -> List[int]:
+        """
+        Devuelve los números de las jornadas de una temporada.
+
+        Args:
+            season (int): Temporada.
+        """
+        return sorted(int(round) for round in self.rounds.get(str(season), {}))
+
+    def get_round_path(self, round: int, season: int) -> Optional[str]:
+        """
+        Devuelve la ruta del archivo de una jornada.
+
+        Args:
+            round (int): Número de la jornada.
+            season (int): Temporada.
+        """
+        return self.rounds.get(str(season), {}).get(str(round))
+
+    def get_game_seasons(self, scoring_folder: str) -> List[int]:
+        """
+        Devuelve las temporadas con partidos de un sistema de puntuación.
+
+        Args:
+            scoring_folder (str): Carpeta del sistema de puntuación.
+        """
+        return sorted(int(season) for season in self.games.get(scoring_folder, {}))
+
+    def get_game_rounds(self, scoring_folder: str, season: int) -> List[int]:
+        """
+        Devuelve las jornadas con partidos de una temporada.
+
+        Args:
+            scoring_folder (str): Carpeta del sistema de puntuación.
+            season (int): Temporada.
+        """
+        return sorted(int(round) for round in self.games.get(scoring_folder, {}).get(str(season), {}))
+
+    def get_game(self, scoring_folder: str, season: int, round: int, game_id: int) -> Optional[Dict]:
+        """
+        Devuelve la entrada de un partido ({'path', 'status', 'mtime'}), si está en el manifiesto.
+
+        Args:
+            scoring_folder (str): Carpeta del sistema de puntuación.
+            season (int): Temporada.
+            round (int): Número de la jornada.
+            game_id (int): ID del partido.
+        """
+        return self.games.get(scoring_folder, {}).get(str(season), {}).get(str(round), {}).get(str(game_id))
+
+    def get_games(self, scoring_folder: str, season: int, round: int) -> Dict[int, Dict]:
+        """
+        Devuelve los partidos de una jornada: game_id -> {'path', 'status', 'mtime'}.
+
+        Args:
+            scoring_folder (str): Carpeta del sistema de puntuación.
+            season (int): Temporada.
+            round (int): Número de la jornada.
+        """
+        games: Dict[str, Dict] = self.games.get(scoring_folder, {}).get(str(season), {}).get(str(round), {})
+        return {int(game_id): entry for game_id, entry in games.items()}
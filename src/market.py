@@ -0,0 +1,239 @@
+import os
+import json
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+EPOCH: date = date(year=1970, month=1, day=1)
+
+def _encode_varint(value: int) -> bytes:
+    """
+    Codifica un entero con signo como varint (zigzag + LEB128).
+
+    Args:
+        value (int): Entero a codificar.
+
+    Returns:
+        bytes: Entero codificado.
+    """
+    value = value * 2 if value >= 0 else -value * 2 - 1
+    encoded: bytearray = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+def _decode_varints(buffer: bytes) -> List[int]:
+    """
+    Decodifica una secuencia de varints (zigzag + LEB128).
+
+    Args:
+        buffer (bytes): Secuencia codificada.
+
+    Returns:
+        List[int]: Enteros decodificados.
+    """
+    values: List[int] = []
+    value: int = 0
+    shift: int = 0
+    for byte in buffer:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append(value >> 1 if not value & 1 else -(value >> 1) - 1)
+        value = 0
+        shift = 0
+    return values
+
+def _cumulative(deltas: List[int]) -> List[int]:
+    """
+    Reconstruye los valores absolutos a partir de sus deltas.
+
+    Args:
+        deltas (List[int]): Deltas codificados en la columna.
+
+    Returns:
+        List[int]: Valores absolutos.
+    """
+    values: List[int] = []
+    current: int = 0
+    for delta in deltas:
+        current += delta
+        values.append(current)
+    return values
+
+class MarketStore:
+    """
+    Almacén columnar de series temporales de precios, de solo escritura al final (append-only).
+
+    Cada serie (p. ej. 'price' o 'market') se particiona por jugador en dos columnas,
+    '<player_id>.days' y '<player_id>.values', codificadas como deltas en varint. Un índice
+    por serie guarda el último día, el último valor y la longitud en bytes de cada columna,
+    de modo que añadir una fila no requiere leer el histórico.
+    """
+
+    def __init__(self, folder: str = "data/Market") -> None:
+        self.folder: str = folder
+        self._indexes: Dict[str, Dict[str, List[int]]] = {}
+
+    def _get_series_folder(self, series: str) -> str:
+        """
+        Devuelve la carpeta de una serie.
+
+        Args:
+            series (str): Nombre de la serie.
+        """
+        return os.path.join(self.folder, series)
+
+    def _load_index(self, series: str) -> Dict[str, List[int]]:
+        """
+        Carga el índice de una serie: player_id -> [último día, último valor, filas, bytes días, bytes valores].
+
+        Args:
+            series (str): Nombre de la serie.
+        """
+        if series not in self._indexes:
+            path: str = os.path.join(self._get_series_folder(series=series), "index.json")
+            if os.path.exists(path):
+                with open(file=path, mode="r", encoding="utf-8") as file:
+                    self._indexes[series] = json.load(fp=file)
+            else:
+                self._indexes[series] = {}
+        return self._indexes[series]
+
+    def _save_index(self, series: str) -> None:
+        """
+        Guarda el índice de una serie de forma atómica.
+
+        Args:
+            series (str): Nombre de la serie.
+        """
+        path: str = os.path.join(self._get_series_folder(series=series), "index.json")
+        tmp_path: str = f"{path}.tmp"
+        with open(file=tmp_path, mode="w", encoding="utf-8") as file:
+            json.dump(obj=self._indexes[series], fp=file)
+        os.replace(src=tmp_path, dst=path)
+
+    def _append_column(self, path: str, committed_bytes: int, data: bytes) -> int:
+        """
+        Añade datos al final de una columna, descartando antes cualquier escritura no registrada en el índice.
+
+        Args:
+            path (str): Ruta de la columna.
+            committed_bytes (int): Bytes válidos según el índice.
+            data (bytes): Datos a añadir.
+
+        Returns:
+            int: Nueva longitud en bytes de la columna.
+        """
+        with open(file=path, mode="ab") as file:
+            if file.tell() != committed_bytes:
+                file.truncate(committed_bytes)
+                file.seek(committed_bytes)
+            file.write(data)
+        return committed_bytes + len(data)
+
+    def append(self, series: str, day: date, values: Dict[int, int]) -> int:
+        """
+        Añade una fila por jugador para el día indicado. Los jugadores que ya tienen
+        fila para ese día (o uno posterior) se ignoran.
+
+        Args:
+            series (str): Nombre de la serie.
+            day (date): Día de la instantánea.
+            values (Dict[int, int]): Valor de cada jugador, indexado por su ID.
+
+        Returns:
+            int: Número de filas añadidas.
+        """
+        series_folder: str = self._get_series_folder(series=series)
+        if not os.path.exists(series_folder):
+            os.makedirs(name=series_folder)
+
+        index: Dict[str, List[int]] = self._load_index(series=series)
+        day_number: int = (day - EPOCH).days
+
+        appended: int = 0
+        for player_id, value in values.items():
+            entry: List[int] = index.get(str(player_id), [0, 0, 0, 0, 0])
+            last_day, last_value, rows, days_bytes, values_bytes = entry
+            if rows and day_number <= last_day:
+                continue
+
+            base_path: str = os.path.join(series_folder, str(player_id))
+            days_bytes = self._append_column(
+                path=f"{base_path}.days",
+                committed_bytes=days_bytes,
+                data=_encode_varint(value=day_number - last_day)
+            )
+            values_bytes = self._append_column(
+                path=f"{base_path}.values",
+                committed_bytes=values_bytes,
+                data=_encode_varint(value=value - last_value)
+            )
+
+            index[str(player_id)] = [day_number, value, rows + 1, days_bytes, values_bytes]
+            appended += 1
+
+        if appended:
+            self._save_index(series=series)
+        return appended
+
+    def _read_column(self, path: str, committed_bytes: int) -> List[int]:
+        """
+        Lee y decodifica una columna hasta la longitud registrada en el índice.
+
+        Args:
+            path (str): Ruta de la columna.
+            committed_bytes (int): Bytes válidos según el índice.
+        """
+        with open(file=path, mode="rb") as file:
+            return _cumulative(deltas=_decode_varints(buffer=file.read(committed_bytes)))
+
+    def get_range(self, series: str, player_id: int, start: Optional[date] = None, end: Optional[date] = None) -> List[Tuple[date, int]]:
+        """
+        Devuelve la serie de un jugador entre dos fechas (ambas incluidas).
+
+        Args:
+            series (str): Nombre de la serie.
+            player_id (int): ID del jugador.
+            start (date, optional): Fecha inicial. Por defecto, desde el principio.
+            end (date, optional): Fecha final. Por defecto, hasta el final.
+
+        Returns:
+            List[Tuple[date, int]]: Pares (día, valor) ordenados por fecha.
+        """
+        entry: Optional[List[int]] = self._load_index(series=series).get(str(player_id))
+        if entry is None:
+            return []
+
+        base_path: str = os.path.join(self._get_series_folder(series=series), str(player_id))
+        days: List[int] = self._read_column(path=f"{base_path}.days", committed_bytes=entry[3])
+
+        first: int = bisect_left(days, (start - EPOCH).days) if start else 0
+        last: int = bisect_right(days, (end - EPOCH).days) if end else len(days)
+        if first >= last:
+            return []
+
+        values: List[int] = self._read_column(path=f"{base_path}.values", committed_bytes=entry[4])
+        return [(EPOCH + timedelta(days=days[i]), values[i]) for i in range(first, last)]
+
+    def get_latest(self, series: str) -> Dict[int, int]:
+        """
+        Devuelve el último valor de cada jugador de una serie (se lee del índice, sin leer las columnas).
+
+        Args:
+            series (str): Nombre de la serie.
+        """
+        return {int(player_id): entry[1] for player_id, entry in self._load_index(series=series).items()}
+
+    def get_players(self, series: str) -> List[int]:
+        """
+        Devuelve los IDs de los jugadores con datos en una serie.
+
+        Args:
+            series (str): Nombre de la serie.
+        """
+        return [int(player_id) for player_id in self._load_index(series=series)]
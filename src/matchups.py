@@ -0,0 +1,264 @@
+import os
+import math
+import logging
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from processor import BiwengerProcessor
+
+class MatchupStats(NamedTuple):
+    player_id: int # ID del jugador (o del equipo en los enfrentamientos entre equipos)
+    opponent_id: int # ID del equipo rival
+    games: int # Partidos con puntos contra el rival
+    total_points: float # Puntos totales contra el rival
+    mean_points: float # Media de puntos contra el rival
+    variance: Optional[float] # Varianza muestral de los puntos (None con menos de 2 partidos)
+
+class RunningStats:
+    """
+    Recuento, suma, media y varianza de una serie de puntos, actualizados en O(1) por valor
+    con el algoritmo de Welford. Admite retirar valores, de modo que un partido que cambia
+    (p. ej. de 'preview' a 'finished') se puede descontar y volver a sumar.
+    """
+
+    __slots__ = ("count", "total", "mean", "m2")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        """
+        Añade un valor.
+        """
+        self.count += 1
+        self.total += value
+        delta: float = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float) -> None:
+        """
+        Retira un valor añadido previamente.
+        """
+        if self.count <= 1:
+            self.count, self.total, self.mean, self.m2 = 0, 0.0, 0.0, 0.0
+            return
+
+        previous_mean: float = (self.count * self.mean - value) / (self.count - 1)
+        self.m2 = max(self.m2 - (value - previous_mean) * (value - self.mean), 0.0)
+        self.mean = previous_mean
+        self.total -= value
+        self.count -= 1
+
+    @property
+    def variance(self) -> Optional[float]:
+        """
+        Varianza muestral (None con menos de 2 valores).
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+# Contribución de un partido al índice: (jugador, rival, puntos) y (equipo, rival, puntos del equipo)
+GameRows = Tuple[List[Tuple[int, int, float]], List[Tuple[int, int, float]]]
+
+class MatchupIndex:
+    """
+    Índice de rendimiento por rival: para cada par (jugador, equipo rival) mantiene el número
+    de partidos, la suma, la media y la varianza de los puntos, y lo mismo para cada par de
+    equipos (puntos totales del equipo contra el rival).
+
+    update() solo procesa los partidos nuevos o modificados según el manifiesto, por lo que
+    el índice se mantiene al día de forma incremental sin recorrer todo el corpus.
+    """
+
+    def __init__(self, processor: BiwengerProcessor) -> None:
+        self.processor: BiwengerProcessor = processor
+
+        self._mtimes: Dict[int, Optional[float]] = {}
+        self._game_rows: Dict[int, GameRows] = {}
+
+        self._player_stats: Dict[Tuple[int, int], RunningStats] = {}
+        self._team_stats: Dict[Tuple[int, int], RunningStats] = {}
+        self._opponents_by_player: Dict[int, Set[int]] = {}
+        self._players_by_opponent: Dict[int, Set[int]] = {}
+
+    def _get_game_rows(self, season: int, round: int, game_name: str) -> GameRows:
+        """
+        Extrae de un partido los puntos de cada jugador y de cada equipo contra su rival.
+
+        Args:
+            season (int): Temporada.
+            round (int): Número de la jornada.
+            game_name (str): Nombre del partido.
+        """
+        game_raw_data: Dict = self.processor._load_game(game_name=game_name, round=round, season=season)
+        team_ids: Dict[str, int] = {team: game_raw_data["data"][team]["id"] for team in ["home", "away"]}
+
+        player_rows: List[Tuple[int, int, float]] = []
+        team_rows: List[Tuple[int, int, float]] = []
+        for team, opponent in (("home", "away"), ("away", "home")):
+            team_points: List[float] = []
+            for player_raw_data in game_raw_data["data"][team].get("reports", []):
+                points: Optional[int] = player_raw_data.get("points")
+                if points is None:
+                    continue
+                player_rows.append((player_raw_data["player"]["id"], team_ids[opponent], float(points)))
+                team_points.append(float(points))
+
+            if team_points:
+                team_rows.append((team_ids[team], team_ids[opponent], math.fsum(team_points)))
+
+        return player_rows, team_rows
+
+    def _apply(self, rows: GameRows, remove: bool = False) -> None:
+        """
+        Suma (o descuenta) la contribución de un partido a los agregados.
+
+        Args:
+            rows (GameRows): Contribución del partido.
+            remove (bool): Si se descuenta en lugar de sumarse. Por defecto, False.
+        """
+        player_rows, team_rows = rows
+        for stats, index_rows in ((self._player_stats, player_rows), (self._team_stats, team_rows)):
+            for key_id, opponent_id, points in index_rows:
+                key: Tuple[int, int] = (key_id, opponent_id)
+                if remove:
+                    stats[key].remove(value=points)
+                    if stats[key].count == 0:
+                        del stats[key]
+                else:
+                    stats.setdefault(key, RunningStats()).add(value=points)
+
+        for player_id, opponent_id, _ in player_rows:
+            if remove and (player_id, opponent_id) not in self._player_stats:
+                self._opponents_by_player[player_id].discard(opponent_id)
+                self._players_by_opponent[opponent_id].discard(player_id)
+            elif not remove:
+                self._opponents_by_player.setdefault(player_id, set()).add(opponent_id)
+                self._players_by_opponent.setdefault(opponent_id, set()).add(player_id)
+
+    def update(self) -> int:
+        """
+        Incorpora al índice los partidos nuevos o modificados y retira los que ya no están en
+        el manifiesto.
+
+        Returns:
+            int: Número de partidos (re)procesados.
+        """
+        self.processor.reload_manifest()
+        scoring_folder: str = self.processor.scoring_folder
+
+        seen: Set[int] = set()
+        updated: int = 0
+        for season in self.processor.manifest.get_game_seasons(scoring_folder=scoring_folder):
+            for round in self.processor.manifest.get_game_rounds(scoring_folder=scoring_folder, season=season):
+                games: Dict[int, Dict] = self.processor.manifest.get_games(scoring_folder=scoring_folder, season=season, round=round)
+                for game_id, entry in games.items():
+                    seen.add(game_id)
+                    if game_id in self._mtimes and self._mtimes[game_id] == entry["mtime"]:
+                        continue
+
+                    game_name: str = os.path.splitext(os.path.basename(entry["path"]))[0]
+                    try:
+                        rows: GameRows = self._get_game_rows(season=season, round=round, game_name=game_name)
+                    except (KeyError, FileNotFoundError) as e:
+                        logging.warning(msg=f"No se ha podido indexar el partido {season}/R{round}/{game_name}: {e}")
+                        continue
+
+                    if game_id in self._game_rows:
+                        self._apply(rows=self._game_rows[game_id], remove=True)
+                    self._apply(rows=rows)
+                    self._game_rows[game_id] = rows
+                    self._mtimes[game_id] = entry["mtime"]
+                    updated += 1
+
+        for game_id in set(self._game_rows) - seen:
+            self._apply(rows=self._game_rows.pop(game_id), remove=True)
+            del self._mtimes[game_id]
+
+        logging.info(msg=f"Índice de enfrentamientos actualizado: {updated} partidos procesados, {len(self._game_rows)} indexados.")
+        return updated
+
+    def _to_stats(self, key: Tuple[int, int], stats: RunningStats) -> MatchupStats:
+        return MatchupStats(
+            player_id=key[0],
+            opponent_id=key[1],
+            games=stats.count,
+            total_points=stats.total,
+            mean_points=stats.mean,
+            variance=stats.variance
+        )
+
+    def get_matchup(self, player_id: int, opponent_id: int) -> Optional[MatchupStats]:
+        """
+        Devuelve el rendimiento de un jugador contra un equipo.
+
+        Args:
+            player_id (int): ID del jugador.
+            opponent_id (int): ID del equipo rival.
+
+        Returns:
+            MatchupStats | None: Agregados del enfrentamiento (None si nunca se han enfrentado).
+        """
+        stats: Optional[RunningStats] = self._player_stats.get((player_id, opponent_id))
+        return self._to_stats(key=(player_id, opponent_id), stats=stats) if stats is not None else None
+
+    def get_player_splits(self, player_id: int, min_games: int = 1) -> List[MatchupStats]:
+        """
+        Devuelve el rendimiento de un jugador contra cada rival, de mejor a peor media.
+
+        Args:
+            player_id (int): ID del jugador.
+            min_games (int): Partidos mínimos contra el rival. Por defecto, 1.
+        """
+        splits: List[MatchupStats] = [
+            self._to_stats(key=(player_id, opponent_id), stats=self._player_stats[(player_id, opponent_id)])
+            for opponent_id in self._opponents_by_player.get(player_id, ())
+        ]
+        return sorted([split for split in splits if split.games >= min_games], key=lambda split: -split.mean_points)
+
+    def get_opponent_leaders(self, opponent_id: int, min_games: int = 1, limit: int = 20) -> List[MatchupStats]:
+        """
+        Devuelve los jugadores con mejor media de puntos contra un equipo.
+
+        Args:
+            opponent_id (int): ID del equipo rival.
+            min_games (int): Partidos mínimos contra el rival. Por defecto, 1.
+            limit (int): Número máximo de jugadores. Por defecto, 20.
+        """
+        leaders: List[MatchupStats] = [
+            self._to_stats(key=(player_id, opponent_id), stats=self._player_stats[(player_id, opponent_id)])
+            for player_id in self._players_by_opponent.get(opponent_id, ())
+        ]
+        leaders = [leader for leader in leaders if leader.games >= min_games]
+        return sorted(leaders, key=lambda leader: -leader.mean_points)[:limit]
+
+    def get_opponents(self) -> List[int]:
+        """
+        Devuelve los IDs de los equipos rivales indexados.
+        """
+        return sorted(self._players_by_opponent)
+
+    def get_head_to_head(self, team_id: int, opponent_id: int) -> Optional[MatchupStats]:
+        """
+        Devuelve los puntos totales de un equipo en sus partidos contra otro.
+
+        Args:
+            team_id (int): ID del equipo.
+            opponent_id (int): ID del equipo rival.
+
+        Returns:
+            MatchupStats | None: Agregados del enfrentamiento (None si nunca se han enfrentado).
+        """
+        stats: Optional[RunningStats] = self._team_stats.get((team_id, opponent_id))
+        return self._to_stats(key=(team_id, opponent_id), stats=stats) if stats is not None else None
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    index: MatchupIndex = MatchupIndex(processor=BiwengerProcessor())
+    index.update()
+    for opponent_id in index.get_opponents():
+        for leader in index.get_opponent_leaders(opponent_id=opponent_id, min_games=2, limit=3):
+            print(leader)
@@ -0,0 +1,204 @@
+import os
+import time
+import logging
+import threading
+from functools import wraps
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Límites por defecto de los histogramas (en segundos para las latencias)
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+class Metrics:
+    """
+    Registro de contadores y temporizadores por etapa del ETL (lectura de directorios,
+    decodificación JSON, construcción de modelos, peticiones HTTP...).
+
+    Es seguro usarlo desde varios hilos. El informe puede obtenerse como diccionario
+    (report) o en formato de texto de Prometheus (to_prometheus).
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._timers: Dict[str, List[float]] = {} # nombre -> [llamadas, segundos totales, máximo]
+        self._histograms: Dict[str, Tuple[Tuple[float, ...], List[float]]] = {} # nombre -> (límites, [conteos por límite..., +Inf, suma])
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Incrementa un contador.
+
+        Args:
+            name (str): Nombre del contador.
+            value (float): Cantidad a sumar. Por defecto, 1.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """
+        Registra la duración de una ejecución de una etapa.
+
+        Args:
+            name (str): Nombre de la etapa.
+            seconds (float): Duración en segundos.
+        """
+        with self._lock:
+            timer: List[float] = self._timers.setdefault(name, [0, 0.0, 0.0])
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+
+    def histogram(self, name: str, value: float, buckets: Optional[Tuple[float, ...]] = None) -> None:
+        """
+        Registra un valor en un histograma (p. ej. latencias o número de reintentos).
+
+        Args:
+            name (str): Nombre del histograma.
+            value (float): Valor observado.
+            buckets (Tuple[float, ...], optional): Límites superiores de los intervalos, en orden creciente.
+                Solo se usan la primera vez que se registra el histograma. Por defecto, DEFAULT_BUCKETS.
+        """
+        with self._lock:
+            if name not in self._histograms:
+                limits: Tuple[float, ...] = buckets or DEFAULT_BUCKETS
+                self._histograms[name] = (limits, [0] * (len(limits) + 2))
+            limits, counts = self._histograms[name]
+            index: int = next((index for index, limit in enumerate(limits) if value <= limit), len(limits))
+            counts[index] += 1
+            counts[-1] += value
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Mide el tiempo de un bloque de código como parte de una etapa.
+
+        Args:
+            name (str): Nombre de la etapa.
+        """
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name=name, seconds=time.perf_counter() - start)
+
+    def reset(self) -> None:
+        """
+        Reinicia todos los contadores y temporizadores.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+            self._histograms.clear()
+
+    def report(self) -> Dict[str, Dict]:
+        """
+        Devuelve un informe estructurado con los contadores y los temporizadores.
+
+        Returns:
+            Dict[str, Dict]: {'counters': {...}, 'stages': {etapa: {'calls', 'total_seconds', 'mean_seconds', 'max_seconds'}},
+            'histograms': {nombre: {'buckets': {límite: conteo acumulado}, 'count', 'sum'}}}
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "stages": {
+                    name: {
+                        "calls": int(calls),
+                        "total_seconds": total,
+                        "mean_seconds": total / calls if calls else 0.0,
+                        "max_seconds": maximum
+                    }
+                    for name, (calls, total, maximum) in self._timers.items()
+                },
+                "histograms": {
+                    name: {
+                        "buckets": {str(limit): sum(counts[:index + 1]) for index, limit in enumerate([*limits, "+Inf"])},
+                        "count": sum(counts[:-1]),
+                        "sum": counts[-1]
+                    }
+                    for name, (limits, counts) in self._histograms.items()
+                }
+            }
+
+    def to_prometheus(self, prefix: str = "biwenger") -> str:
+        """
+        Devuelve las métricas en el formato de texto de Prometheus.
+
+        Args:
+            prefix (str): Prefijo de las métricas. Por defecto, 'biwenger'.
+        """
+        report: Dict[str, Dict] = self.report()
+        lines: List[str] = []
+        for name, value in sorted(report["counters"].items()):
+            metric: str = f"{prefix}_{name.replace('.', '_')}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+
+        lines.append(f"# TYPE {prefix}_stage_seconds summary")
+        for name, stage in sorted(report["stages"].items()):
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {stage["calls"]}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {stage["total_seconds"]}')
+
+        for name, histogram in sorted(report["histograms"].items()):
+            metric: str = f"{prefix}_{name.replace('.', '_')}"
+            lines.append(f"# TYPE {metric} histogram")
+            for limit, count in histogram["buckets"].items():
+                lines.append(f'{metric}_bucket{{le="{limit}"}} {count}')
+            lines.append(f"{metric}_count {histogram['count']}")
+            lines.append(f"{metric}_sum {histogram['sum']}")
+        return "\n".join(lines) + "\n"
+
+# Registro global compartido por el scraper, el procesador y el wrapper
+metrics: Metrics = Metrics()
+
+_profiling: threading.local = threading.local()
+
+def profiled(function: F) -> F:
+    """
+    Decorador para los puntos de entrada públicos. Si la variable de entorno BIWENGER_PROFILE
+    vale 'cprofile' o 'pyinstrument', perfila la llamada (solo la más externa de cada hilo) y
+    guarda el resultado en BIWENGER_PROFILE_DIR (por defecto, 'data/profiles').
+
+    Args:
+        function (Callable): Función a perfilar.
+    """
+    @wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profiler_name: str = os.environ.get("BIWENGER_PROFILE", "").lower()
+        if profiler_name not in ("cprofile", "pyinstrument") or getattr(_profiling, "active", False):
+            return function(*args, **kwargs)
+
+        folder: str = os.environ.get("BIWENGER_PROFILE_DIR", "data/profiles")
+        os.makedirs(name=folder, exist_ok=True)
+        path: str = os.path.join(folder, f"{function.__qualname__}-{time.strftime('%Y%m%d-%H%M%S')}")
+
+        _profiling.active = True
+        try:
+            if profiler_name == "cprofile":
+                import cProfile
+
+                profiler: Any = cProfile.Profile()
+                try:
+                    return profiler.runcall(function, *args, **kwargs)
+                finally:
+                    profiler.dump_stats(f"{path}.prof")
+                    logging.info(msg=f"Perfil de {function.__qualname__} guardado en '{path}.prof'.")
+            else:
+                from pyinstrument import Profiler
+
+                profiler: Any = Profiler()
+                profiler.start()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    profiler.stop()
+                    with open(file=f"{path}.html", mode="w", encoding="utf-8") as file:
+                        file.write(profiler.output_html())
+                    logging.info(msg=f"Perfil de {function.__qualname__} guardado en '{path}.html'.")
+        finally:
+            _profiling.active = False
+
+    return wrapper # type: ignore[return-value]
@@ -0,0 +1,127 @@
+import logging
+from uuid import UUID
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from definitions import *
+from definitions.event import EventType
+from processor import BiwengerProcessor
+
+MATCH_MINUTES: int = 90
+
+# Eventos que marcan la entrada y la salida de un jugador del campo
+ENTRY_EVENTS: List[int] = [EventType.ENTRADA_BANQUILLO.get_value()]
+EXIT_EVENTS: List[int] = [
+    EventType.SUSTITUCION.get_value(),
+    EventType.TAREJETA_ROJA.get_value(),
+    EventType.DOBLE_TARJETA_AMARILLA.get_value(),
+]
+
+def reconstruct_minutes(
+    performance_index: np.ndarray,
+    event_types: np.ndarray,
+    event_minutes: np.ndarray,
+    performances_count: int,
+    match_minutes: int = MATCH_MINUTES
+) -> np.ndarray:
+    """
+    Reconstruye los minutos jugados de cada actuación a partir de los eventos, en una única
+    pasada vectorizada: un jugador entra en el minuto 0 o en el de su ENTRADA_BANQUILLO y sale
+    en el minuto final o en el primero de SUSTITUCION, TARJETA_ROJA o DOBLE_TARJETA_AMARILLA.
+    Los eventos sin minuto (-1) se ignoran.
+
+    Args:
+        performance_index (np.ndarray): Índice de la actuación de cada evento.
+        event_types (np.ndarray): Tipo de cada evento.
+        event_minutes (np.ndarray): Minuto de cada evento.
+        performances_count (int): Número de actuaciones.
+        match_minutes (int): Duración del partido. Por defecto, 90.
+
+    Returns:
+        np.ndarray: Minutos jugados de cada actuación (int16).
+    """
+    valid: np.ndarray = event_minutes >= 0
+    minutes: np.ndarray = np.minimum(event_minutes, match_minutes)
+
+    entries: np.ndarray = valid & np.isin(event_types, ENTRY_EVENTS)
+    start: np.ndarray = np.zeros(performances_count, dtype=np.int16)
+    np.maximum.at(start, performance_index[entries], minutes[entries])
+
+    exits: np.ndarray = valid & np.isin(event_types, EXIT_EVENTS)
+    end: np.ndarray = np.full(performances_count, match_minutes, dtype=np.int16)
+    np.minimum.at(end, performance_index[exits], minutes[exits])
+
+    return np.maximum(end - start, 0).astype(np.int16)
+
+def get_performance_minutes(performances: List[PlayerPerformance], events: List[Event], match_minutes: int = MATCH_MINUTES) -> np.ndarray:
+    """
+    Empaqueta los eventos en arrays y reconstruye los minutos jugados de cada actuación.
+
+    Args:
+        performances (List[PlayerPerformance]): Actuaciones.
+        events (List[Event]): Eventos de las actuaciones.
+        match_minutes (int): Duración del partido. Por defecto, 90.
+
+    Returns:
+        np.ndarray: Minutos jugados de cada actuación, en el orden de 'performances' (float,
+        NaN si la actuación no tiene puntos, p. ej. en partidos sin jugar).
+    """
+    positions: Dict[UUID, int] = {performance.player_performance_id: index for index, performance in enumerate(performances)}
+    performance_index: np.ndarray = np.fromiter((positions.get(event.player_performance_id, -1) for event in events), dtype=np.int64, count=len(events))
+    event_types: np.ndarray = np.fromiter((event.event_type for event in events), dtype=np.int16, count=len(events))
+    event_minutes: np.ndarray = np.fromiter((event.event_minute for event in events), dtype=np.int16, count=len(events))
+
+    known: np.ndarray = performance_index >= 0
+    minutes: np.ndarray = reconstruct_minutes(
+        performance_index=performance_index[known],
+        event_types=event_types[known],
+        event_minutes=event_minutes[known],
+        performances_count=len(performances),
+        match_minutes=match_minutes
+    ).astype(float)
+
+    played: np.ndarray = np.fromiter((performance.points is not None for performance in performances), dtype=bool, count=len(performances))
+    minutes[~played] = np.nan
+    return minutes
+
+def get_season_minutes(processor: BiwengerProcessor, season: int) -> Tuple[List[PlayerPerformance], np.ndarray]:
+    """
+    Reconstruye los minutos jugados de todas las actuaciones de una temporada.
+
+    Args:
+        processor (BiwengerProcessor): Procesador con el sistema de puntuación a usar.
+        season (int): Temporada.
+
+    Returns:
+        Tuple[List[PlayerPerformance], np.ndarray]: Actuaciones y minutos jugados de cada una.
+    """
+    performances, events = processor._get_season_performances(season=season)
+    return performances, get_performance_minutes(performances=performances, events=events)
+
+def points_per_90(points: np.ndarray, minutes: np.ndarray, min_minutes: int = 1) -> np.ndarray:
+    """
+    Calcula los puntos por cada 90 minutos jugados.
+
+    Args:
+        points (np.ndarray): Puntos.
+        minutes (np.ndarray): Minutos jugados.
+        min_minutes (int): Minutos mínimos para calcularlos (NaN por debajo). Por defecto, 1.
+
+    Returns:
+        np.ndarray: Puntos por 90 minutos.
+    """
+    points = np.asarray(points, dtype=float)
+    minutes = np.asarray(minutes, dtype=float)
+    enough: np.ndarray = minutes >= min_minutes
+    return np.divide(points * MATCH_MINUTES, minutes, out=np.full(points.shape, np.nan), where=enough)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    processor: BiwengerProcessor = BiwengerProcessor()
+    for season in processor.manifest.get_game_seasons(scoring_folder=processor.scoring_folder):
+        performances, minutes = get_season_minutes(processor=processor, season=season)
+        points: np.ndarray = np.array([np.nan if performance.points is None else performance.points for performance in performances])
+        logging.info(msg=f"Temporada {season}: {len(performances)} actuaciones, {np.nanmean(minutes):.1f} minutos de media, "
+                         f"{np.nanmean(points_per_90(points=points, minutes=minutes, min_minutes=30)):.2f} puntos por 90 minutos.")
@@ -0,0 +1,93 @@
+import logging
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingRegressor
+
+from features import FeatureBuilder, FEATURE_COLUMNS
+from processor import BiwengerProcessor
+
+def make_baseline_model() -> Any:
+    """
+    Devuelve el modelo base de predicción de puntos (sin entrenar). Admite valores
+    ausentes, por lo que no hace falta imputar las variables de jugadores sin historial.
+    """
+    return HistGradientBoostingRegressor(max_iter=200, learning_rate=0.05, max_leaf_nodes=31, random_state=0)
+
+def train_model(features: pd.DataFrame, model_factory: Callable[[], Any] = make_baseline_model) -> Any:
+    """
+    Entrena un modelo con todas las filas con puntos conocidos.
+
+    Args:
+        features (pd.DataFrame): Matriz de variables (FeatureBuilder).
+        model_factory (Callable): Función que crea el modelo sin entrenar.
+
+    Returns:
+        Any: Modelo entrenado.
+    """
+    labeled: pd.DataFrame = features[features["points"].notna()]
+    model: Any = model_factory()
+    model.fit(labeled[FEATURE_COLUMNS].to_numpy(dtype=float), labeled["points"].to_numpy(dtype=float))
+    return model
+
+def walk_forward_backtest(
+    features: pd.DataFrame,
+    model_factory: Callable[[], Any] = make_baseline_model,
+    min_train_steps: int = 10,
+    retrain_every: int = 5
+) -> pd.DataFrame:
+    """
+    Evalúa el modelo avanzando jornada a jornada: para predecir cada jornada solo se entrena
+    con las jornadas anteriores. El modelo se reentrena cada 'retrain_every' jornadas.
+    Como referencia se compara con la media de los últimos 5 partidos del jugador.
+
+    Args:
+        features (pd.DataFrame): Matriz de variables (FeatureBuilder).
+        model_factory (Callable): Función que crea el modelo sin entrenar.
+        min_train_steps (int): Jornadas mínimas de entrenamiento antes de la primera predicción. Por defecto, 10.
+        retrain_every (int): Cada cuántas jornadas se reentrena el modelo. Por defecto, 5.
+
+    Returns:
+        pd.DataFrame: Una fila por jornada evaluada con el error absoluto medio (MAE) y el
+        error cuadrático medio (RMSE) del modelo y de la referencia.
+    """
+    labeled: pd.DataFrame = features[features["points"].notna()]
+    X: np.ndarray = labeled[FEATURE_COLUMNS].to_numpy(dtype=float)
+    y: np.ndarray = labeled["points"].to_numpy(dtype=float)
+    steps: np.ndarray = labeled["step"].to_numpy()
+    reference: np.ndarray = labeled["points_last_5"].fillna(value=0).to_numpy(dtype=float)
+
+    results: List[Dict] = []
+    model: Any = None
+    for index, step in enumerate(np.unique(steps)[min_train_steps:]):
+        if model is None or index % retrain_every == 0:
+            train: np.ndarray = steps < step
+            model = model_factory()
+            model.fit(X[train], y[train])
+
+        test: np.ndarray = steps == step
+        errors: np.ndarray = model.predict(X[test]) - y[test]
+        reference_errors: np.ndarray = reference[test] - y[test]
+        results.append({
+            "step": int(step),
+            "season": int(labeled["season"].to_numpy()[test][0]),
+            "round_id": int(labeled["round_id"].to_numpy()[test][0]),
+            "rows": int(test.sum()),
+            "mae": float(np.abs(errors).mean()),
+            "rmse": float(np.sqrt((errors ** 2).mean())),
+            "reference_mae": float(np.abs(reference_errors).mean()),
+            "reference_rmse": float(np.sqrt((reference_errors ** 2).mean())),
+        })
+
+    backtest: pd.DataFrame = pd.DataFrame(results)
+    if not backtest.empty:
+        logging.info(msg=f"Backtest: MAE {np.average(backtest['mae'], weights=backtest['rows']):.3f} "
+                         f"(referencia {np.average(backtest['reference_mae'], weights=backtest['rows']):.3f}) en {len(backtest)} jornadas.")
+    return backtest
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    features: pd.DataFrame = FeatureBuilder(processor=BiwengerProcessor()).load()
+    print(walk_forward_backtest(features=features))
@@ -0,0 +1,313 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
+
+from config import ScoringSystem, Credentials, Competition, DEFAULT_COMPETITION
+from manifest import Manifest
+from metrics import metrics
+from utils import save_json
+
+class Stage(NamedTuple):
+    name: str # Nombre único de la etapa
+    run: Callable[[], Any] # Función que ejecuta la etapa
+    fingerprint: Callable[[], Any] # Función que resume las entradas de la etapa (se evalúa al llegar su turno)
+    depends: List[str] = [] # Etapas que deben terminar antes
+    version: int = 1 # Versión del código de la etapa (cambiarla fuerza su ejecución)
+
+class StageResult(NamedTuple):
+    name: str # Nombre de la etapa
+    status: str # 'ran', 'skipped' (entradas sin cambios), 'failed' o 'blocked' (falló una dependencia)
+    key: Optional[str] # Hash de las entradas de la etapa
+    seconds: float # Duración de la ejecución
+    error: Optional[str] # Error, si la etapa ha fallado
+
+def hash_parts(*parts: Any) -> str:
+    """
+    Calcula un hash estable de varios valores serializables en JSON.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+class Pipeline:
+    """
+    Orquestador del ETL como un grafo de etapas (DAG). La clave de cada etapa es un hash de sus
+    entradas (su fingerprint), de su versión y de las claves de sus dependencias; si coincide con
+    la de la última ejecución correcta, la etapa se omite. Las etapas independientes (p. ej. de
+    distintos sistemas de puntuación) se ejecutan a la vez.
+
+    El estado se guarda en un JSON (por defecto, 'data/pipeline.json') al terminar cada etapa,
+    por lo que una ejecución interrumpida se reanuda sin repetir lo ya hecho.
+    """
+
+    def __init__(self, stages: List[Stage], state_path: str = "data/pipeline.json", max_workers: int = 4) -> None:
+        self.stages: Dict[str, Stage] = {stage.name: stage for stage in stages}
+        self.state_path: str = state_path
+        self.max_workers: int = max_workers
+        self._lock: threading.Lock = threading.Lock()
+
+        for stage in stages:
+            for dependency in stage.depends:
+                if dependency not in self.stages:
+                    raise ValueError(f"La etapa '{stage.name}' depende de '{dependency}', que no existe.")
+        self._check_cycles()
+
+    def _check_cycles(self) -> None:
+        """
+        Comprueba que el grafo de etapas no tiene ciclos.
+        """
+        visiting: Set[str] = set()
+        visited: Set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"El grafo de etapas tiene un ciclo en '{name}'.")
+            visiting.add(name)
+            for dependency in self.stages[name].depends:
+                visit(name=dependency)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.stages:
+            visit(name=name)
+
+    def _load_state(self) -> Dict[str, Dict]:
+        """
+        Carga el estado de la última ejecución de cada etapa.
+        """
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(file=self.state_path, mode="r", encoding="utf-8") as file:
+            return json.load(fp=file)
+
+    def _run_stage(self, stage: Stage, key: str) -> StageResult:
+        """
+        Ejecuta una etapa y mide su duración.
+        """
+        logging.info(msg=f"Ejecutando la etapa '{stage.name}'...")
+        start: float = time.perf_counter()
+        try:
+            with metrics.stage(name=f"pipeline.{stage.name}"):
+                stage.run()
+        except Exception as e:
+            logging.error(msg=f"Error en la etapa '{stage.name}': {e}")
+            return StageResult(name=stage.name, status="failed", key=key, seconds=time.perf_counter() - start, error=repr(e))
+        return StageResult(name=stage.name, status="ran", key=key, seconds=time.perf_counter() - start, error=None)
+
+    def run(self, force: bool = False, only: Optional[List[str]] = None) -> List[StageResult]:
+        """
+        Ejecuta el grafo de etapas.
+
+        Args:
+            force (bool): Si se ejecutan todas las etapas aunque sus entradas no hayan cambiado. Por defecto, False.
+            only (List[str], optional): Si se indica, solo se ejecutan estas etapas (y las que dependen de ellas
+                se consideran bloqueadas si no se han ejecutado nunca).
+
+        Returns:
+            List[StageResult]: Resultado de cada etapa, en orden de finalización.
+        """
+        state: Dict[str, Dict] = self._load_state()
+        pending: Dict[str, Stage] = {name: stage for name, stage in self.stages.items() if only is None or name in only}
+        keys: Dict[str, str] = {name: entry["key"] for name, entry in state.items() if name not in pending}
+        done: Set[str] = {name for name in self.stages if name not in pending}
+        failed: Set[str] = set()
+        results: List[StageResult] = []
+        running: Dict[Future, Stage] = {}
+
+        def finish(result: StageResult) -> None:
+            results.append(result)
+            if result.status in ("ran", "skipped"):
+                keys[result.name] = result.key
+                done.add(result.name)
+                if result.status == "ran":
+                    with self._lock:
+                        state[result.name] = {"key": result.key, "finished": time.time(), "seconds": round(result.seconds, 3)}
+                        os.makedirs(name=os.path.dirname(self.state_path) or ".", exist_ok=True)
+                        save_json(path=self.state_path, data=state)
+            else:
+                failed.add(result.name)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                progress: bool = False
+                for name, stage in list(pending.items()):
+                    if any(dependency in failed for dependency in stage.depends) or any(dependency not in keys and dependency in done for dependency in stage.depends):
+                        del pending[name]
+                        progress = True
+                        finish(result=StageResult(name=name, status="blocked", key=None, seconds=0.0, error="Ha fallado una dependencia."))
+                        continue
+                    if not all(dependency in done for dependency in stage.depends):
+                        continue
+
+                    del pending[name]
+                    progress = True
+                    try:
+                        key: str = hash_parts(stage.name, stage.version, stage.fingerprint(), [keys[dependency] for dependency in stage.depends])
+                    except Exception as e:
+                        finish(result=StageResult(name=name, status="failed", key=None, seconds=0.0, error=repr(e)))
+                        continue
+
+                    if not force and state.get(name, {}).get("key") == key:
+                        logging.info(msg=f"Etapa '{name}' sin cambios. Se omite.")
+                        finish(result=StageResult(name=name, status="skipped", key=key, seconds=0.0, error=None))
+                        continue
+                    running[executor.submit(self._run_stage, stage, key)] = stage
+
+                if not running:
+                    if pending and progress:
+                        continue
+                    break
+
+                completed, _ = wait(fs=list(running), return_when=FIRST_COMPLETED)
+                for future in completed:
+                    del running[future]
+                    finish(result=future.result())
+
+        return results
+
+def _get_manifest_section(section: str, root: str, scoring_folder: Optional[str] = None) -> Any:
+    """
+    Lee una sección del manifiesto actual de una competición (se relee en cada llamada, tras las
+    etapas anteriores).
+
+    Args:
+        section (str): Sección del manifiesto ('seasons', 'rounds' o 'games').
+        root (str): Carpeta raíz de los JSON de la competición.
+        scoring_folder (str, optional): Si se indica, solo la parte de ese sistema de puntuación.
+    """
+    manifest: Manifest = Manifest.load(path=f"{root}/manifest.json", root=root)
+    data: Dict = getattr(manifest, section)
+    return data.get(scoring_folder, {}) if scoring_folder is not None else data
+
+def build_default_pipeline(
+        scores: Optional[List[int]] = None,
+        scrape: bool = True,
+        max_workers: int = 4,
+        refresh_rounds: int = 2,
+        competition: str = DEFAULT_COMPETITION
+    ) -> Pipeline:
+    """
+    Construye el pipeline diario: descarga (temporadas, jornadas y partidos), y para cada sistema
+    de puntuación validación, matriz de variables y tablas de dimensiones, y por último las métricas.
+
+    Las etapas de descarga se ejecutan como máximo una vez al día; las demás, solo cuando cambian
+    los partidos de su sistema de puntuación en el manifiesto. El estado del pipeline, los informes
+    de calidad y las métricas se guardan en la carpeta de la competición.
+
+    Args:
+        scores (List[int], optional): Sistemas de puntuación. Por defecto, todos.
+        scrape (bool): Si se incluyen las etapas de descarga (requieren credenciales). Por defecto, True.
+        max_workers (int): Número máximo de etapas simultáneas. Por defecto, 4.
+        refresh_rounds (int): Número de jornadas más recientes (y sus partidos) que se vuelven a descargar
+            en cada ejecución, para recoger correcciones posteriores. Por defecto, 2.
+        competition (str): Competición. Por defecto, DEFAULT_COMPETITION.
+
+    Returns:
+        Pipeline: Pipeline construido.
+    """
+    scores = scores if scores is not None else [scoring_system.get_value() for scoring_system in ScoringSystem]
+    folder: str = Competition.from_value(value=competition).get_data_folder()
+    root: str = Competition.from_value(value=competition).get_json_folder()
+    stages: List[Stage] = []
+    games_stage: List[str] = []
+
+    if scrape:
+        scraper_holder: Dict[str, Any] = {}
+
+        def get_scraper() -> Any:
+            # Un único scraper (y un único login) para todas las etapas de descarga
+            if "scraper" not in scraper_holder:
+                from scraper import BiwengerScraper
+
+                scraper_holder["scraper"] = BiwengerScraper(credentials=Credentials(), competition=competition)
+            return scraper_holder["scraper"]
+
+        def scrape_games() -> None:
+            get_scraper().save_all_games_data(scores=scores)
+            get_scraper().refresh_recent_games(rounds=refresh_rounds, scores=scores)
+
+        stages.extend([
+            Stage(
+                name="scrape.seasons",
+                run=lambda: get_scraper().save_seasons_data(),
+                fingerprint=lambda: str(date.today())
+            ),
+            Stage(
+                name="scrape.rounds",
+                run=lambda: get_scraper().save_rounds_data(refresh_rounds=refresh_rounds),
+                fingerprint=lambda: [str(date.today()), _get_manifest_section(section="seasons", root=root)],
+                depends=["scrape.seasons"]
+            ),
+            Stage(
+                name="scrape.games",
+                run=scrape_games,
+                fingerprint=lambda: [str(date.today()), _get_manifest_section(section="rounds", root=root)],
+                depends=["scrape.rounds"]
+            ),
+        ])
+        games_stage = ["scrape.games"]
+
+    def add_score_stages(score: int) -> List[str]:
+        from processor import BiwengerProcessor
+
+        scoring_folder: str = ScoringSystem.from_value(value=score).get_scoring_system()
+
+        def corpus() -> Any:
+            return [
+                _get_manifest_section(section="rounds", root=root),
+                _get_manifest_section(section="games", root=root, scoring_folder=scoring_folder)
+            ]
+
+        def validate() -> None:
+            from validation import validate_corpus
+
+            validate_corpus(score=score, competition=competition).save()
+
+        def build_features() -> None:
+            from features import FeatureBuilder
+
+            FeatureBuilder(processor=BiwengerProcessor(score=score, competition=competition)).load()
+
+        def export_dimensions() -> None:
+            from dimensions import DimensionTables
+
+            tables: DimensionTables = DimensionTables(processor=BiwengerProcessor(score=score, competition=competition))
+            tables.build()
+            tables.save()
+
+        names: List[str] = [f"validate.{scoring_folder}", f"features.{scoring_folder}", f"export.{scoring_folder}"]
+        stages.extend([
+            Stage(name=names[0], run=validate, fingerprint=corpus, depends=games_stage),
+            Stage(name=names[1], run=build_features, fingerprint=corpus, depends=[*games_stage, names[0]]),
+            Stage(name=names[2], run=export_dimensions, fingerprint=corpus, depends=[*games_stage, names[0]]),
+        ])
+        return names
+
+    score_stages: List[str] = []
+    for score in scores:
+        score_stages.extend(add_score_stages(score=score))
+
+    def write_metrics() -> None:
+        os.makedirs(name=folder, exist_ok=True)
+        with open(file=f"{folder}/metrics.prom", mode="w", encoding="utf-8") as file:
+            file.write(metrics.to_prometheus())
+
+    stages.append(Stage(name="metrics", run=write_metrics, fingerprint=lambda: time.time(), depends=score_stages))
+    return Pipeline(stages=stages, state_path=f"{folder}/pipeline.json", max_workers=max_workers)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    pipeline: Pipeline = build_default_pipeline()
+    for result in pipeline.run():
+        print(f"{result.name:<25} {result.status:<8} {result.seconds:>8.2f} s {result.error or ''}")
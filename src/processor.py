@@ -1,20 +1,81 @@
 import os
 import json
+import logging
 from uuid import uuid4, UUID
-from pydantic import ValidationError
-from typing import List, Dict, Optional, Tuple
+from pydantic import BaseModel, ValidationError
+from typing import TYPE_CHECKING, Any, List, Dict, Optional, Tuple, Type, TypeVar
 
 from definitions import *
-from config import ScoringSystem, Credentials
-from scraper import BiwengerScraper
+from config import ScoringSystem, Credentials, Competition, DEFAULT_COMPETITION
+from work_queue import FetchTask
+from manifest import Manifest
+from archive import PackReader, get_pack_path
+from snapshots import Snapshot, SnapshotStore
+from metrics import metrics, profiled
+
+if TYPE_CHECKING:
+    from scraper import BiwengerScraper
+
+M = TypeVar("M", bound=BaseModel)
 
 class BiwengerProcessor:
     score: int
 
-    def __init__(self, score: int = 1) -> None:
+    def __init__(
+            self,
+            score: int = 1,
+            scraper: Optional["BiwengerScraper"] = None,
+            snapshot: Optional[str] = None,
+            competition: str = DEFAULT_COMPETITION
+        ) -> None:
+        """
+        Args:
+            score (int): Sistema de puntuación. Por defecto, 1 (Picas).
+            scraper (BiwengerScraper, optional): Scraper para refrescar partidos. Por defecto, se crea al necesitarlo.
+            snapshot (str, optional): ID o nombre de una instantánea del corpus (SnapshotStore de la competición).
+                Si se indica, los datos se leen de la instantánea, y no de 'data/JSONs', y no se pueden refrescar.
+            competition (str): Competición (p. ej. 'la-liga'); se leen los datos de su carpeta. Por defecto, DEFAULT_COMPETITION.
+        """
         self.score = score
+        self.competition: str = Competition.from_value(value=competition).get_value()
+        self.folder: str = Competition.from_value(value=competition).get_data_folder()
+        self.root: str = Competition.from_value(value=competition).get_json_folder()
         self.scoring_folder: str = self._get_scoring_folder(score=self.score)
-        self.scraper: BiwengerScraper = BiwengerScraper(credentials=Credentials())
+        self._scraper: Optional["BiwengerScraper"] = scraper
+        self._manifest: Optional[Manifest] = None
+        self._packs: Dict[Tuple[str, int], Optional[PackReader]] = {}
+        self.snapshot: Optional[Snapshot] = SnapshotStore(competition=self.competition).load(snapshot=snapshot) if snapshot is not None else None
+
+    @property
+    def scraper(self) -> "BiwengerScraper":
+        """
+        Scraper usado para refrescar partidos. Solo se importa y se crea (e inicia sesión) cuando
+        se necesita, por lo que el procesador funciona sin red mientras no se refresquen partidos.
+        """
+        if self._scraper is None:
+            from scraper import BiwengerScraper
+
+            self._scraper = BiwengerScraper(credentials=Credentials(), competition=self.competition)
+        return self._scraper
+
+    @property
+    def manifest(self) -> Manifest:
+        """
+        Manifiesto con las rutas de todos los datos. Se lee una única vez, la primera vez que se usa.
+        Si no existe, se reconstruye solo en memoria: el procesador no escribe en 'data/JSONs'.
+        """
+        if self.snapshot is not None:
+            return self.snapshot.manifest
+        if self._manifest is None:
+            with metrics.stage(name="manifest.load"):
+                self._manifest = Manifest.load(path=f"{self.root}/manifest.json", root=self.root, save=False)
+        return self._manifest
+
+    def reload_manifest(self) -> None:
+        """
+        Vuelve a leer el manifiesto (p. ej. tras ejecutar el scraper).
+        """
+        self._manifest = None
 
     def set_scoring_system(self, score: int) -> None:
         """
@@ -53,9 +114,54 @@ class BiwengerProcessor:
         Returns:
             dict: Contenido del archivo JSON como diccionario.
         """
-        with open(file=path, mode="r", encoding="utf-8") as file:
-            data: Dict = json.load(fp=file)
+        if self.snapshot is not None:
+            with metrics.stage(name="snapshot.read"):
+                data: Dict = self.snapshot.load_json(path=path)
+            metrics.increment(name="objects_read")
+            return data
+
+        with metrics.stage(name="file.read"):
+            with open(file=path, mode="rb") as file:
+                raw_data: bytes = file.read()
+        metrics.increment(name="files_read")
+        metrics.increment(name="bytes_decoded", value=len(raw_data))
+
+        with metrics.stage(name="json.load"):
+            data: Dict = json.loads(raw_data)
         return data
+
+    def _build(self, model: Type[M], **data: Any) -> M:
+        """
+        Construye (y valida) un objeto de las definiciones.
+
+        Args:
+            model (Type[BaseModel]): Clase del objeto.
+            **data: Campos del objeto.
+
+        Returns:
+            BaseModel: Objeto construido.
+        """
+        with metrics.stage(name="pydantic"):
+            instance: M = model(**data)
+        metrics.increment(name="objects_built")
+        return instance
+
+    def _build_many(self, model: Type[M], rows: List[Dict]) -> List[M]:
+        """
+        Construye y valida una lista de objetos de las definiciones en bloque, con una única
+        llamada al TypeAdapter de la lista.
+
+        Args:
+            model (Type[BaseModel]): Clase de los objetos.
+            rows (List[Dict]): Campos de cada objeto.
+
+        Returns:
+            List[BaseModel]: Objetos construidos.
+        """
+        with metrics.stage(name="pydantic"):
+            instances: List[M] = validate_many(model=model, rows=rows)
+        metrics.increment(name="objects_built", value=len(instances))
+        return instances
     
     def _load_season(self, season: int) -> Dict:
         """
@@ -67,9 +173,9 @@ class BiwengerProcessor:
         Returns:
             dict: Contenido del archivo JSON como diccionario.
         """
-        path: str = os.path.join("data/JSONs/Seasons", f"{season}.json")
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"El archivo {path} no existe.")
+        path: Optional[str] = self.manifest.get_season_path(season=season)
+        if path is None:
+            raise FileNotFoundError(f"La temporada {season} no está en el manifiesto.")
         
         return self._load_json(path=path)
    
@@ -91,12 +197,14 @@ class BiwengerProcessor:
                 is_finished = False
                 break
 
-        return Season(
+        return self._build(
+            model=Season,
             season_id=season_raw_data["data"]["id"],
             season_name=season_raw_data["data"]["name"],
             season_status="finished" if is_finished else "in_progress",
         )
     
+    @profiled
     def get_seasons(self) -> List[Season]:
         """
         Devuelve una lista con todas las temporadas disponibles.
@@ -105,10 +213,8 @@ class BiwengerProcessor:
             List[Season]: Lista de temporadas.
         """
         seasons: List[Season] = []
-        for file in os.listdir(path="data/JSONs/Seasons"):
-            if file.endswith(".json"):
-                season_id: int = int(file.split(sep=".")[0])
-                seasons.append(self._get_season(season=season_id))
+        for season_id in self.manifest.get_seasons():
+            seasons.append(self._get_season(season=season_id))
         return seasons
     
     def _load_round(self, round: int, season: int) -> Dict:
@@ -122,9 +228,9 @@ class BiwengerProcessor:
         Returns:
             dict: Contenido del archivo JSON como diccionario.
         """
-        path: str = os.path.join("data/JSONs/Rounds", str(object=season), f"R{round}.json")
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"El archivo {path} no existe.")
+        path: Optional[str] = self.manifest.get_round_path(round=round, season=season)
+        if path is None:
+            raise FileNotFoundError(f"La jornada {season}/R{round} no está en el manifiesto.")
         
         return self._load_json(path=path)
 
@@ -150,7 +256,8 @@ class BiwengerProcessor:
                 elif match_raw_data["status"] == "pending":
                     round_status = "pending"
 
-        return Round(
+        return self._build(
+            model=Round,
             round_id=round_raw_data["data"]["id"],
             season_id=season,
             name=round_raw_data["data"]["name"],
@@ -168,12 +275,11 @@ class BiwengerProcessor:
             List[Round]: Lista de jornadas.
         """
         rounds: List[Round] = []
-        for file in os.listdir(path=os.path.join("data/JSONs/Rounds", str(object=season))):
-            if file.endswith(".json"):
-                round_id: int = int(file.split(sep=".")[0][1:])
-                rounds.append(self._get_round(round=round_id, season=season))
+        for round_id in self.manifest.get_rounds(season=season):
+            rounds.append(self._get_round(round=round_id, season=season))
         return rounds
     
+    @profiled
     def get_rounds(self) -> List[Round]:
         """
         Devuelve una lista con todas las jornadas disponibles.
@@ -182,10 +288,8 @@ class BiwengerProcessor:
             List[Round]: Lista de jornadas.
         """
         rounds: List[Round] = []
-        for season in os.listdir(path="data/JSONs/Rounds"):
-            if os.path.isdir(s=os.path.join("data/JSONs/Rounds", season)):
-                season_id: int = int(season)
-                rounds.extend(self._get_season_rounds(season=season_id))
+        for season_id in self.manifest.get_round_seasons():
+            rounds.extend(self._get_season_rounds(season=season_id))
         return rounds
     
     def _load_game(self, game_name: str, round: int, season: int, score: Optional[int] = None) -> Dict:
@@ -206,13 +310,69 @@ class BiwengerProcessor:
         else:
             scoring_folder: str = self._get_scoring_folder(score=score)
 
-        path: str = os.path.join("data/JSONs/Games", scoring_folder, str(object=season), f"R{round}", f"{game_name}.json")
-        if not os.path.exists(path):
+        # Los archivos empaquetados reflejan los datos actuales, no los de la instantánea
+        pack: Optional[PackReader] = self._get_pack(scoring_folder=scoring_folder, season=season) if self.snapshot is None else None
+        if pack is not None and (round, game_name) in pack:
+            # Si el JSON se ha reescrito después de empaquetarlo (refresco, directo, scraper), se lee el JSON
+            entry: Optional[Dict] = self.manifest.get_game(
+                scoring_folder=scoring_folder,
+                season=season,
+                round=round,
+                game_id=pack.get_game_id(round=round, game_name=game_name)
+            )
+            if pack.is_fresh(round=round, game_name=game_name, mtime=(entry or {}).get("mtime")):
+                with metrics.stage(name="pack.decode"):
+                    data: Dict = pack.get(round=round, game_name=game_name)
+                metrics.increment(name="records_decoded")
+                return data
+            metrics.increment(name="pack_stale_records")
+
+        path: str = os.path.join(f"{self.root}/Games", scoring_folder, str(object=season), f"R{round}", f"{game_name}.json")
+        try:
+            return self._load_json(path=path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"El archivo {path} no existe.")
-        
-        return self._load_json(path=path)
     
-    def _get_game(self, game_name: str, round: int, season: int) -> Game:
+    def _get_round_game_names(self, scoring_folder: str, round: int, season: int) -> List[str]:
+        """
+        Devuelve los nombres de los archivos de los partidos de una jornada según el manifiesto.
+
+        Args:
+            scoring_folder (str): Carpeta del sistema de puntuación.
+            round (int): Número de la jornada.
+            season (int): Año de la temporada.
+
+        Returns:
+            List[str]: Nombres de los partidos (sin extensión).
+        """
+        games: Dict[int, Dict] = self.manifest.get_games(scoring_folder=scoring_folder, season=season, round=round)
+        return [os.path.splitext(os.path.basename(entry["path"]))[0] for entry in games.values()]
+
+    def _get_pack(self, scoring_folder: str, season: int) -> Optional[PackReader]:
+        """
+        Devuelve (y mantiene abierto) el archivo empaquetado de una temporada, si existe.
+
+        Args:
+            scoring_folder (str): Carpeta del sistema de puntuación.
+            season (int): Año de la temporada.
+
+        Returns:
+            PackReader | None: Lector del archivo empaquetado.
+        """
+        key: Tuple[str, int] = (scoring_folder, season)
+        if key not in self._packs:
+            path: str = get_pack_path(scoring_folder=scoring_folder, season=season, folder=f"{self.folder}/Packs")
+            self._packs[key] = PackReader(path=path) if os.path.exists(path) else None
+        return self._packs[key]
+
+    def _get_game(
+            self,
+            game_name: str,
+            round: int,
+            season: int,
+            game_raw_data: Optional[Dict] = None,
+            round_raw_data: Optional[Dict] = None
+        ) -> Game:
         """
         Procesa un partido específico.
         
@@ -220,31 +380,35 @@ class BiwengerProcessor:
             game_name (str): Nombre del archivo JSON del partido.
             round (int): Número de la jornada.
             season (int): Año de la temporada.
+            game_raw_data (Dict, optional): JSON del partido, si ya se ha cargado. Por defecto, se carga.
+            round_raw_data (Dict, optional): JSON de la jornada, si ya se ha cargado. Por defecto, se carga.
         
         Returns:
             Game: Contenido del archivo JSON como objeto.
         """
-        game_raw_data: Dict = self._load_game(game_name=game_name, round=round, season=season, score=self.score)
-        round_raw_data: Dict = self._load_round(round=round, season=season)
+        if game_raw_data is None:
+            game_raw_data = self._load_game(game_name=game_name, round=round, season=season, score=self.score)
+        if round_raw_data is None:
+            round_raw_data = self._load_round(round=round, season=season)
     
         if game_raw_data["data"]["status"] == "pending":
             home_team_score: int = -1
             away_team_score: int = -1
         
         elif game_raw_data["data"]["status"] == "preview":
-            game_raw_data: Dict = self.scraper._get_game_json(
-                game=game_raw_data["data"]["id"],
-                score=self.score
-            )
-            home_team_score: int = game_raw_data["data"]["home"]["score"]
-            away_team_score: int = game_raw_data["data"]["away"]["score"]
+            # Los partidos en 'preview' se refrescan antes, en lote, con prefetch_previews
+            home_score: Optional[int] = game_raw_data["data"]["home"].get("score")
+            away_score: Optional[int] = game_raw_data["data"]["away"].get("score")
+            home_team_score: int = home_score if home_score is not None else -1
+            away_team_score: int = away_score if away_score is not None else -1
         
         else:
             home_team_score: int = game_raw_data["data"]["home"]["score"]
             away_team_score: int = game_raw_data["data"]["away"]["score"]
 
         try:
-            game: Game = Game(
+            game: Game = self._build(
+                model=Game,
                 game_id=game_raw_data["data"]["id"],
                 round_id=round_raw_data["data"]["id"],
                 home_team_id=game_raw_data["data"]["home"]["id"],
@@ -272,10 +436,8 @@ class BiwengerProcessor:
             List[Game]: Lista de partidos.
         """
         games: List[Game] = []
-        for game_name in os.listdir(path=os.path.join("data/JSONs/Games", self.scoring_folder, str(object=season), f"R{round}")):
-            if game_name.endswith(".json"):
-                game_name: str = game_name[:-5]
-                games.append(self._get_game(game_name=game_name, round=round, season=season))
+        for game_name in self._get_round_game_names(scoring_folder=self.scoring_folder, round=round, season=season):
+            games.append(self._get_game(game_name=game_name, round=round, season=season))
         
         return games
     
@@ -290,117 +452,144 @@ class BiwengerProcessor:
             List[Game]: Lista de partidos.
         """
         games: List[Game] = []
-        for round in os.listdir(path=os.path.join("data/JSONs/Games", self.scoring_folder, str(object=season))):
-            if os.path.isdir(s=os.path.join("data/JSONs/Games", self.scoring_folder, str(object=season), round)):
-                games.extend(self._get_round_games(round=int(round[1:]), season=season))
+        for round_id in self.manifest.get_game_rounds(scoring_folder=self.scoring_folder, season=season):
+            games.extend(self._get_round_games(round=round_id, season=season))
         
         return games
     
-    def get_games(self) -> List[Game]:
+    def _get_preview_tasks(self, score: int) -> List[FetchTask]:
         """
-        Devuelve una lista con todos los partidos disponibles.
+        Busca en los datos locales los partidos guardados en estado 'preview'.
+
+        Args:
+            score (int): Sistema de puntuación.
 
         Returns:
-            List[Game]: Lista de partidos.
-        """
-        games: List[Game] = []
-        for season in os.listdir(path=os.path.join("data/JSONs/Games", self.scoring_folder)):
-            if os.path.isdir(s=os.path.join("data/JSONs/Games", self.scoring_folder, season)):
-                season_id: int = int(season)
-                games.extend(self._get_season_games(season=season_id))
+            List[FetchTask]: Partidos a refrescar.
+        """
+        scoring_folder: str = self._get_scoring_folder(score=score)
+
+        tasks: List[FetchTask] = []
+        for season in self.manifest.get_game_seasons(scoring_folder=scoring_folder):
+            for round in self.manifest.get_game_rounds(scoring_folder=scoring_folder, season=season):
+                games: Dict[int, Dict] = self.manifest.get_games(scoring_folder=scoring_folder, season=season, round=round)
+                for game_id, entry in games.items():
+                    if entry["status"] == "preview":
+                        tasks.append(FetchTask(
+                            season=str(season),
+                            round=f"R{round}",
+                            game_id=game_id,
+                            score=score,
+                            path=entry["path"]
+                        ))
+        return tasks
+
+    def prefetch_previews(self, score: Optional[int] = None, max_workers: int = 8) -> int:
+        """
+        Refresca en un único paso, con peticiones concurrentes, todos los partidos guardados
+        en estado 'preview' y sobrescribe sus archivos. Es el único paso del procesador que
+        accede a la red.
 
-        return games
-    
-    def _get_player_events(self, events_raw_data: List[Dict], player_performance_id: UUID) -> List[Event] | str:
-        """
-        Procesa los eventos de un jugador en un partido específico.
-        
         Args:
-            events_raw_data (list): Eventos del jugador.
-            player_performance_id (UUID): ID de la actuación del jugador.
-        
+            score (int, optional): Sistema de puntuación a utilizar. Por defecto es el sistema de puntuación actual.
+            max_workers (int): Número máximo de peticiones simultáneas. Por defecto, 8.
+
         Returns:
-            List[Event]: Eventos del jugador en el partido.
+            int: Número de partidos refrescados.
         """
-        events: List[Event] = []
-        for raw_event in events_raw_data:
-            try:
-                event: Event = Event(
-                    event_type=raw_event["type"],
-                    player_performance_id=player_performance_id,
-                    event_minute=raw_event["metadata"] if "metadata" in raw_event else -1,
-                )
-            except (ValidationError, ValueError) as e:
-                return str(e)
-            except KeyError as e:
-                return str(raw_event)
-            events.append(event)
-        return events
-    
-    def _get_player_game(self, player_raw_data: Dict, team_id: int, game_id: int) -> Tuple[PlayerPerformance, List[Event]]:
+        if self.snapshot is not None:
+            raise ValueError(f"La instantánea {self.snapshot.info.snapshot_id} es de solo lectura: no se pueden refrescar partidos.")
+
+        tasks: List[FetchTask] = self._get_preview_tasks(score=score if score is not None else self.score)
+        if not tasks:
+            return 0
+
+        with metrics.stage(name="http.preview_refresh"):
+            refreshed: int = self.scraper.refresh_games(tasks=tasks, max_workers=max_workers)
+
+        self.reload_manifest()
+        return refreshed
+
+    @profiled
+    def get_games(self, refresh_previews: bool = False) -> List[Game]:
         """
-        Procesa el rendimiento de un jugador en un partido específico.
-        
+        Devuelve una lista con todos los partidos disponibles.
+
         Args:
-            player_raw_data (dict): Datos del jugador.
-            team_id (int): ID del equipo.
-            game_id (int): ID del partido.
-        
+            refresh_previews (bool): Si se refrescan antes los partidos en 'preview' (requiere red). Por defecto, False.
+
         Returns:
-            PlayerPerformance: Rendimiento del jugador en el partido.
-            List[Event]: Eventos del jugador en el partido.
+            List[Game]: Lista de partidos.
         """
-        player_performance_id: UUID = uuid4()
-        
-        player_events: List[Event] | str = self._get_player_events(
-            events_raw_data=player_raw_data["events"],
-            player_performance_id=player_performance_id
-        ) if "events" in player_raw_data else []
+        if refresh_previews:
+            self.prefetch_previews()
 
-        if isinstance(player_events, str):
-            raise ValueError(f"Error al procesar los eventos del jugador {player_raw_data['player']['name']} en {game_id}: {player_events}")
-
-        player_performance: PlayerPerformance = PlayerPerformance(
-            player_performance_id=player_performance_id,
-            player_id=player_raw_data["player"]["id"],
-            game_id=game_id,
-            team_id=team_id,
-            points=player_raw_data["points"]
-        )
+        games: List[Game] = []
+        for season_id in self.manifest.get_game_seasons(scoring_folder=self.scoring_folder):
+            games.extend(self._get_season_games(season=season_id))
 
-        return player_performance, player_events
+        return games
     
-    def _get_game_performances(self, game_name: str, round: int, season: int, score: Optional[int] = None) -> Tuple[List[PlayerPerformance], List[Event]]:
-        """
-        Procesa las actuaciones de los jugadores en un partido específico.
+    def _get_game_performances(
+            self,
+            game_name: str,
+            round: int,
+            season: int,
+            score: Optional[int] = None,
+            game_raw_data: Optional[Dict] = None
+        ) -> Tuple[List[PlayerPerformance], List[Event]]:
+        """
+        Procesa las actuaciones de los jugadores en un partido específico. Las actuaciones y
+        los eventos de todo el partido se construyen en bloque.
         
         Args:
             game_name (str): Nombre del archivo JSON del partido.
             round (int): Número de la jornada.
             season (int): Año de la temporada.
             score (int, optional): Sistema de puntuación a utilizar. Por defecto es el sistema de puntuación actual.
+            game_raw_data (Dict, optional): JSON del partido, si ya se ha cargado. Por defecto, se carga.
         
         Returns:
             Tuple[List[PlayerPerformance], List[Event]]: Actuaciones de los jugadores y eventos del partido.
         """
-        game_raw_data: Dict = self._load_game(game_name=game_name, round=round, season=season, score=score)
+        if game_raw_data is None:
+            game_raw_data = self._load_game(game_name=game_name, round=round, season=season, score=score)
+        game_id: int = game_raw_data["data"]["id"]
         
-        player_performances: List[PlayerPerformance] = []
-        events: List[Event] = []
+        performance_rows: List[Dict] = []
+        event_rows: List[Dict] = []
+        event_players: List[str] = []
         
         for team in ["home", "away"]:
+            team_id: int = game_raw_data["data"][team]["id"]
             for player_raw_data in game_raw_data["data"][team]["reports"]:
-                player_game: Tuple[PlayerPerformance , List[Event]] = self._get_player_game(
-                    player_raw_data=player_raw_data,
-                    team_id=game_raw_data["data"][team]["id"],
-                    game_id=game_raw_data["data"]["id"]
-                )
-                
-                player_performance: PlayerPerformance = player_game[0]
-                player_events: List[Event] = player_game[1]
-                
-                player_performances.append(player_performance)
-                events.extend(player_events)
+                player_performance_id: UUID = uuid4()
+                performance_rows.append({
+                    "player_performance_id": player_performance_id,
+                    "player_id": player_raw_data["player"]["id"],
+                    "game_id": game_id,
+                    "team_id": team_id,
+                    "points": player_raw_data["points"]
+                })
+
+                for raw_event in player_raw_data.get("events", []):
+                    if "type" not in raw_event:
+                        raise ValueError(f"Error al procesar los eventos del jugador {player_raw_data['player']['name']} en {game_id}: {raw_event}")
+                    event_rows.append({
+                        "event_type": raw_event["type"],
+                        "player_performance_id": player_performance_id,
+                        "event_minute": raw_event["metadata"] if "metadata" in raw_event else -1
+                    })
+                    event_players.append(player_raw_data["player"]["name"])
+
+        player_performances: List[PlayerPerformance] = self._build_many(model=PlayerPerformance, rows=performance_rows)
+        try:
+            events: List[Event] = self._build_many(model=Event, rows=event_rows)
+        except ValidationError as e:
+            player_name: str = event_players[e.errors()[0]["loc"][0]]
+            raise ValueError(f"Error al procesar los eventos del jugador {player_name} en {game_id}: {e}")
+        except ValueError as e:
+            raise ValueError(f"Error al procesar los eventos del partido {game_id}: {e}")
 
         return player_performances, events
     
@@ -424,21 +613,19 @@ class BiwengerProcessor:
         round_performances: List[PlayerPerformance] = []
         round_events: List[Event] = []
         
-        for game_name in os.listdir(path=os.path.join("data/JSONs/Games", scoring_folder, str(object=season), f"R{round}")):
-            if game_name.endswith(".json"):
-                game_name: str = game_name[:-5]
-                game: Tuple[List[PlayerPerformance], List[Event]] = self._get_game_performances(
-                    game_name=game_name,
-                    round=round,
-                    season=season,
-                    score=score
-                )
-
-                game_performances: List[PlayerPerformance] = game[0]
-                game_events: List[Event] = game[1]
-                
-                round_performances.extend(game_performances)
-                round_events.extend(game_events)
+        for game_name in self._get_round_game_names(scoring_folder=scoring_folder, round=round, season=season):
+            game: Tuple[List[PlayerPerformance], List[Event]] = self._get_game_performances(
+                game_name=game_name,
+                round=round,
+                season=season,
+                score=score
+            )
+
+            game_performances: List[PlayerPerformance] = game[0]
+            game_events: List[Event] = game[1]
+            
+            round_performances.extend(game_performances)
+            round_events.extend(game_events)
 
         return round_performances, round_events
 
@@ -461,23 +648,22 @@ class BiwengerProcessor:
         season_performances: List[PlayerPerformance] = []
         season_events: List[Event] = []
 
-        for round in os.listdir(path=os.path.join("data/JSONs/Games", scoring_folder, str(object=season))):
-            if os.path.isdir(s=os.path.join("data/JSONs/Games", scoring_folder, str(object=season), round)):
-                round_id: int = int(round[1:])
-                round_performances: Tuple[List[PlayerPerformance], List[Event]] = self._get_round_performances(
-                    round=round_id,
-                    season=season,
-                    score=score
-                )
+        for round_id in self.manifest.get_game_rounds(scoring_folder=scoring_folder, season=season):
+            round_performances: Tuple[List[PlayerPerformance], List[Event]] = self._get_round_performances(
+                round=round_id,
+                season=season,
+                score=score
+            )
 
-                performances: List[PlayerPerformance] = round_performances[0]
-                events: List[Event] = round_performances[1]
+            performances: List[PlayerPerformance] = round_performances[0]
+            events: List[Event] = round_performances[1]
 
-                season_performances.extend(performances)
-                season_events.extend(events)
+            season_performances.extend(performances)
+            season_events.extend(events)
 
         return season_performances, season_events
 
+    @profiled
     def get_performances(self, score: Optional[int] = None) -> Tuple[List[PlayerPerformance], List[Event]]:
         """
         Devuelve las actuaciones de los jugadores y eventos de la temporada actual.
@@ -496,16 +682,14 @@ class BiwengerProcessor:
         performances: List[PlayerPerformance] = []
         events: List[Event] = []
 
-        for season in os.listdir(path=os.path.join("data/JSONs/Games", scoring_folder)):
-            if os.path.isdir(s=os.path.join("data/JSONs/Games", scoring_folder, season)):
-                season_id: int = int(season)
-                season_performances: Tuple[List[PlayerPerformance], List[Event]] = self._get_season_performances(
-                    season=season_id,
-                    score=score
-                )
+        for season_id in self.manifest.get_game_seasons(scoring_folder=scoring_folder):
+            season_performances: Tuple[List[PlayerPerformance], List[Event]] = self._get_season_performances(
+                season=season_id,
+                score=score
+            )
 
-                performances.extend(season_performances[0])
-                events.extend(season_performances[1])
+            performances.extend(season_performances[0])
+            events.extend(season_performances[1])
         
         return performances, events
 
@@ -519,13 +703,21 @@ class BiwengerProcessor:
         Returns:
             Player: Información del jugador.
         """
-        return Player(
+        return self._build(
+            model=Player,
             player_id=player_raw_data["id"],
             player_name=player_raw_data["name"],
             player_position=player_raw_data["position"]
         )
     
-    def _get_game_players(self, game_name: str, round: int, season: int, seen_player_ids: set) -> List[Player]:
+    def _get_game_players(
+            self,
+            game_name: str,
+            round: int,
+            season: int,
+            seen_player_ids: set,
+            game_raw_data: Optional[Dict] = None
+        ) -> List[Player]:
         """
         Procesa los jugadores de un partido específico.
         
@@ -534,11 +726,13 @@ class BiwengerProcessor:
             round (int): Número de la jornada.
             season (int): Año de la temporada.
             seen_player_ids (set): Conjunto de IDs de jugadores ya procesados.
+            game_raw_data (Dict, optional): JSON del partido, si ya se ha cargado. Por defecto, se carga.
         
         Returns:
             List[Player]: Lista de jugadores en el partido.
         """
-        game_raw_data: Dict = self._load_game(game_name=game_name, round=round, season=season)
+        if game_raw_data is None:
+            game_raw_data = self._load_game(game_name=game_name, round=round, season=season)
         
         players: List[Player] = []
         for team in ["home", "away"]:
@@ -563,10 +757,8 @@ class BiwengerProcessor:
             List[Player]: Lista de jugadores en la jornada.
         """
         players: List[Player] = []
-        for game_name in os.listdir(path=os.path.join("data/JSONs/Games", self.scoring_folder, str(object=season), f"R{round}")):
-            if game_name.endswith(".json"):
-                game_name: str = game_name[:-5]
-                players.extend(self._get_game_players(game_name=game_name, round=round, season=season, seen_player_ids=seen_player_ids))
+        for game_name in self._get_round_game_names(scoring_folder=self.scoring_folder, round=round, season=season):
+            players.extend(self._get_game_players(game_name=game_name, round=round, season=season, seen_player_ids=seen_player_ids))
         
         return players
     
@@ -582,13 +774,12 @@ class BiwengerProcessor:
             List[Player]: Lista de jugadores en la temporada.
         """
         players: List[Player] = []
-        for round in os.listdir(path=os.path.join("data/JSONs/Games", self.scoring_folder, str(object=season))):
-            if os.path.isdir(s=os.path.join("data/JSONs/Games", self.scoring_folder, str(object=season), round)):
-                round_id: int = int(round[1:])
-                players.extend(self._get_round_players(round=round_id, season=season, seen_player_ids=seen_player_ids))
+        for round_id in self.manifest.get_game_rounds(scoring_folder=self.scoring_folder, season=season):
+            players.extend(self._get_round_players(round=round_id, season=season, seen_player_ids=seen_player_ids))
         
         return players
     
+    @profiled
     def get_players(self) -> List[Player]:
         """
         Devuelve una lista con todos los jugadores disponibles.
@@ -599,14 +790,71 @@ class BiwengerProcessor:
         players: List[Player] = []
         seen_player_ids: set = set()
         
-        for season in os.listdir(path=os.path.join("data/JSONs/Games", self.scoring_folder)):
-            if os.path.isdir(s=os.path.join("data/JSONs/Games", self.scoring_folder, season)):
-                season_id: int = int(season)
-                players.extend(self._get_season_players(season=season_id, seen_player_ids=seen_player_ids))
+        for season_id in self.manifest.get_game_seasons(scoring_folder=self.scoring_folder):
+            players.extend(self._get_season_players(season=season_id, seen_player_ids=seen_player_ids))
         
         return players
 
+    def _get_team(self, team_raw_data: Dict) -> Team:
+        """
+        Procesa los datos de un equipo y devuelve su información.
+
+        Args:
+            team_raw_data (dict): Datos del equipo.
+
+        Returns:
+            Team: Información del equipo.
+        """
+        return self._build(
+            model=Team,
+            team_id=team_raw_data["id"],
+            team_name=team_raw_data["name"]
+        )
+
+    def _get_game_teams(self, game_name: str, round: int, season: int, seen_team_ids: set) -> List[Team]:
+        """
+        Procesa los equipos de un partido específico.
+
+        Args:
+            game_name (str): Nombre del archivo JSON del partido.
+            round (int): Número de la jornada.
+            season (int): Año de la temporada.
+            seen_team_ids (set): Conjunto de IDs de equipos ya procesados.
+
+        Returns:
+            List[Team]: Lista de equipos del partido.
+        """
+        game_raw_data: Dict = self._load_game(game_name=game_name, round=round, season=season)
+
+        teams: List[Team] = []
+        for team in ["home", "away"]:
+            team_id: int = game_raw_data["data"][team]["id"]
+            if team_id not in seen_team_ids:
+                teams.append(self._get_team(team_raw_data=game_raw_data["data"][team]))
+                seen_team_ids.add(team_id)
+
+        return teams
+
+    @profiled
+    def get_teams(self) -> List[Team]:
+        """
+        Devuelve una lista con todos los equipos disponibles.
+
+        Returns:
+            List[Team]: Lista de equipos.
+        """
+        teams: List[Team] = []
+        seen_team_ids: set = set()
+
+        for season_id in self.manifest.get_game_seasons(scoring_folder=self.scoring_folder):
+            for round_id in self.manifest.get_game_rounds(scoring_folder=self.scoring_folder, season=season_id):
+                for game_name in self._get_round_game_names(scoring_folder=self.scoring_folder, round=round_id, season=season_id):
+                    teams.extend(self._get_game_teams(game_name=game_name, round=round_id, season=season_id, seen_team_ids=seen_team_ids))
+
+        return teams
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
     processor = BiwengerProcessor()
     
     for season in processor.get_seasons():
@@ -629,4 +877,10 @@ if __name__ == "__main__":
 
     for player in processor.get_players():
         print(player)
-        break
\ No newline at end of file
+        break
+
+    for team in processor.get_teams():
+        print(team)
+        break
+
+    print(metrics.to_prometheus())
\ No newline at end of file
@@ -0,0 +1,386 @@
+import time
+import random
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Deque, Dict, NamedTuple, Optional, Tuple
+
+from metrics import metrics
+
+if TYPE_CHECKING:
+    import requests
+
+# Tipos de resultado de una petición
+OK: str = "ok"
+RATE_LIMITED: str = "rate_limited" # HTTP 429 o 'status' 429 en el cuerpo
+SERVER: str = "server" # HTTP 5xx o 408
+NETWORK: str = "network" # Error de conexión o timeout
+INVALID: str = "invalid" # Respuesta 2xx que no es JSON (p. ej. truncada o una página de error)
+CLIENT: str = "client" # HTTP 4xx (salvo 408 y 429) o petición no válida (URL, redirecciones): no se reintenta
+
+RETRYABLE: Tuple[str, ...] = (RATE_LIMITED, SERVER, NETWORK, INVALID)
+
+RETRY_BUCKETS: Tuple[float, ...] = (0, 1, 2, 3, 5, 8)
+
+class RetryPolicy(NamedTuple):
+    max_retries: int = 5 # Reintentos máximos por petición
+    base_delay: float = 1.0 # Espera mínima entre intentos (segundos)
+    max_delay: float = 60.0 # Espera máxima entre intentos, también para Retry-After (segundos)
+    timeout: float = 30.0 # Timeout de cada intento (segundos)
+    max_outage: float = 600.0 # Tiempo máximo que se espera a que se cierre el circuito antes de abandonar (segundos)
+
+class RequestError(Exception):
+    """
+    Error de una petición tras agotar los reintentos (o que no se reintenta).
+    """
+
+    def __init__(self, message: str, kind: str) -> None:
+        super().__init__(message)
+        self.kind: str = kind
+
+class CircuitOpenError(RequestError):
+    """
+    El circuito está abierto: la API está fallando y no se hacen peticiones hasta que pase la espera.
+    """
+
+    def __init__(self, retry_in: float) -> None:
+        super().__init__(message=f"Circuito abierto por exceso de errores. Se reintentará en {retry_in:.0f} s.", kind="circuit_open")
+        self.retry_in: float = retry_in
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Interpreta la cabecera Retry-After (segundos o fecha HTTP).
+
+    Args:
+        value (str, optional): Valor de la cabecera.
+        now (float, optional): Momento actual (timestamp). Por defecto, time.time().
+
+    Returns:
+        float | None: Segundos a esperar, o None si no hay cabecera o no es válida.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(moment.timestamp() - (now if now is not None else time.time()), 0.0)
+
+def decorrelated_jitter(previous: float, base: float, cap: float, rng: random.Random) -> float:
+    """
+    Calcula la siguiente espera con 'decorrelated jitter': aleatoria entre la espera base y el
+    triple de la anterior, con un máximo. Evita que los hilos que fallan a la vez reintenten a la vez.
+
+    Args:
+        previous (float): Espera anterior (la base en el primer reintento).
+        base (float): Espera mínima.
+        cap (float): Espera máxima.
+        rng (random.Random): Generador de números aleatorios.
+
+    Returns:
+        float: Segundos a esperar.
+    """
+    return min(cap, rng.uniform(base, max(previous, base) * 3))
+
+class RateLimiter:
+    """
+    Limitador de peticiones por segundo compartido por todos los hilos (y competiciones). Cada
+    petición reserva el siguiente hueco libre en orden de llegada (GCRA), de modo que el
+    reparto es justo: ningún hilo puede acaparar la cuota mientras otros esperan.
+
+    Es seguro usarlo desde varios hilos.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Args:
+            rate (float): Peticiones por segundo.
+            burst (int): Peticiones que pueden salir seguidas tras un periodo de inactividad. Por defecto, 1.
+        """
+        self.interval: float = 1 / rate
+        self.burst: int = burst
+        self._next: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Espera al hueco reservado para la siguiente petición.
+
+        Returns:
+            float: Segundos esperados.
+        """
+        with self._lock:
+            now: float = time.monotonic()
+            slot: float = max(self._next, now - (self.burst - 1) * self.interval)
+            self._next = slot + self.interval
+        delay: float = max(slot - now, 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def defer(self, seconds: float) -> None:
+        """
+        Retrasa todas las peticiones siguientes (p. ej. al recibir un Retry-After).
+
+        Args:
+            seconds (float): Segundos desde ahora hasta el siguiente hueco.
+        """
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + seconds)
+
+class CircuitBreaker:
+    """
+    Circuit breaker por tasa de errores. Guarda el resultado de las últimas peticiones y, si la
+    proporción de fallos supera el umbral, abre el circuito durante un tiempo: las peticiones
+    fallan al momento sin llegar a la API. Pasado ese tiempo deja pasar una petición de prueba
+    (semiabierto); si tiene éxito se cierra, y si falla vuelve a abrirse.
+
+    Es seguro usarlo desde varios hilos.
+    """
+
+    def __init__(self, window: int = 50, failure_rate: float = 0.5, min_calls: int = 10, cooldown: float = 30.0) -> None:
+        """
+        Args:
+            window (int): Número de peticiones recientes consideradas. Por defecto, 50.
+            failure_rate (float): Proporción de fallos que abre el circuito. Por defecto, 0.5.
+            min_calls (int): Peticiones mínimas en la ventana para poder abrirlo. Por defecto, 10.
+            cooldown (float): Segundos que permanece abierto. Por defecto, 30.
+        """
+        self.failure_rate: float = failure_rate
+        self.min_calls: int = min_calls
+        self.cooldown: float = cooldown
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._opened_at: Optional[float] = None
+        self._outage_start: Optional[float] = None
+        self._probing: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        Estado del circuito: 'closed', 'open' o 'half_open'.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            return "open" if time.monotonic() - self._opened_at < self.cooldown else "half_open"
+
+    @property
+    def outage(self) -> float:
+        """
+        Segundos desde que se abrió el circuito sin volver a cerrarse (0 si está cerrado).
+        """
+        with self._lock:
+            return time.monotonic() - self._outage_start if self._outage_start is not None else 0.0
+
+    def before_call(self) -> bool:
+        """
+        Comprueba si se puede hacer una petición.
+
+        Returns:
+            bool: Si la petición es la de prueba del circuito semiabierto. Hay que pasarlo a record.
+
+        Raises:
+            CircuitOpenError: Si el circuito está abierto o ya hay una petición de prueba en curso.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            elapsed: float = time.monotonic() - self._opened_at
+            if elapsed < self.cooldown or self._probing:
+                raise CircuitOpenError(retry_in=max(self.cooldown - elapsed, 0.0))
+            self._probing = True
+            return True
+
+    def record(self, success: bool, probe: bool = False) -> None:
+        """
+        Registra el resultado de una petición.
+
+        Args:
+            success (bool): Si la petición ha tenido éxito.
+            probe (bool): Si es la petición de prueba (lo que devolvió before_call). Por defecto, False.
+        """
+        with self._lock:
+            if probe:
+                self._probing = False
+                if success:
+                    logging.info(msg="Circuito cerrado: la API vuelve a responder.")
+                    self._opened_at = None
+                    self._outage_start = None
+                    self._outcomes.clear()
+                else:
+                    self._opened_at = time.monotonic()
+                return
+            if self._opened_at is not None:
+                # Peticiones que empezaron antes de abrirse el circuito: solo cuenta la de prueba
+                return
+
+            self._outcomes.append(success)
+            failures: int = self._outcomes.count(False)
+            if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_rate:
+                logging.warning(msg=f"Circuito abierto: {failures}/{len(self._outcomes)} peticiones recientes fallidas. Pausa de {self.cooldown:.0f} s.")
+                metrics.increment(name="http_circuit_opened")
+                self._opened_at = time.monotonic()
+                self._outage_start = self._opened_at
+
+class RequestEngine:
+    """
+    Motor de peticiones GET a la API con reintentos: clasifica cada fallo (límite de peticiones,
+    error del servidor, de red, respuesta no válida o error del cliente), reintenta solo los
+    recuperables respetando Retry-After o, si no lo hay, con decorrelated jitter, y comparte un
+    circuit breaker entre todos los hilos.
+
+    Si se indica un limitador, cada intento espera su turno y los Retry-After frenan a todos
+    los hilos que lo comparten, no solo al que recibió la respuesta.
+
+    Mientras el circuito está abierto, las peticiones esperan a que se cierre en lugar de fallar
+    todas a la vez; solo se abandonan si el corte dura más de RetryPolicy.max_outage.
+
+    Registra la latencia de cada intento (histograma 'http_latency_seconds'), la espera del
+    limitador ('http_throttle_seconds'), los reintentos de cada petición ('http_retries') y los
+    fallos por tipo ('http_failures_<tipo>').
+    """
+
+    def __init__(
+        self,
+        session: "requests.Session",
+        policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        limiter: Optional[RateLimiter] = None,
+        seed: Optional[int] = None
+    ) -> None:
+        """
+        Args:
+            session (requests.Session): Sesión HTTP.
+            policy (RetryPolicy, optional): Política de reintentos. Por defecto, RetryPolicy().
+            breaker (CircuitBreaker, optional): Circuit breaker. Por defecto, uno nuevo.
+            limiter (RateLimiter, optional): Limitador de peticiones por segundo. Por defecto, ninguno.
+            seed (int, optional): Semilla del jitter.
+        """
+        self.session: "requests.Session" = session
+        self.policy: RetryPolicy = policy or RetryPolicy()
+        self.breaker: CircuitBreaker = breaker or CircuitBreaker()
+        self.limiter: Optional[RateLimiter] = limiter
+        self._rng: random.Random = random.Random(seed)
+        self._rng_lock: threading.Lock = threading.Lock()
+
+    def _attempt(self, url: str, headers: Dict) -> Tuple[str, Optional[Dict], Optional[float], str]:
+        """
+        Hace un intento y lo clasifica.
+
+        Returns:
+            Tuple[str, Dict | None, float | None, str]: Tipo de resultado, JSON de la respuesta,
+            segundos de Retry-After y descripción del fallo.
+        """
+        import requests
+
+        start: float = time.perf_counter()
+        try:
+            response: requests.Response = self.session.get(url=url, headers=headers, timeout=self.policy.timeout)
+        except (requests.exceptions.InvalidURL, requests.exceptions.MissingSchema, requests.exceptions.InvalidSchema, requests.exceptions.TooManyRedirects) as e:
+            # Fallos de la propia petición: repetirla daría el mismo resultado
+            return CLIENT, None, None, repr(e)
+        except requests.exceptions.RequestException as e:
+            # Conexión, timeout, cuerpo truncado (ChunkedEncodingError) o mal comprimido (ContentDecodingError)
+            return NETWORK, None, None, repr(e)
+        finally:
+            metrics.histogram(name="http_latency_seconds", value=time.perf_counter() - start)
+
+        metrics.increment(name="http_calls")
+        metrics.increment(name="http_bytes", value=len(response.content))
+        retry_after: Optional[float] = parse_retry_after(value=response.headers.get("Retry-After"))
+
+        try:
+            data: Optional[Dict] = response.json()
+        except ValueError:
+            data = None
+
+        code: int = response.status_code
+        if code == 429 or (isinstance(data, dict) and data.get("status") == 429):
+            return RATE_LIMITED, data, retry_after, f"HTTP {code}: límite de peticiones"
+        if code >= 500 or code == 408:
+            return SERVER, data, retry_after, f"HTTP {code}"
+        if code >= 400:
+            # La API informa de los errores en el cuerpo: si es JSON, se devuelve al que llama
+            return (CLIENT, data, None, f"HTTP {code}") if data is None else (OK, data, None, "")
+        if not isinstance(data, dict):
+            return INVALID, None, None, f"HTTP {code}: respuesta no JSON ({response.headers.get('Content-Type', '?')})"
+        return OK, data, None, ""
+
+    def _wait_for_circuit(self) -> bool:
+        """
+        Espera a que el circuito deje pasar una petición.
+
+        Returns:
+            bool: Si la petición es la de prueba del circuito semiabierto.
+
+        Raises:
+            CircuitOpenError: Si el circuito lleva abierto más de RetryPolicy.max_outage.
+        """
+        while True:
+            try:
+                return self.breaker.before_call()
+            except CircuitOpenError as e:
+                if self.breaker.outage >= self.policy.max_outage:
+                    raise
+                # Si hay una petición de prueba en curso (retry_in = 0), se vuelve a comprobar en breve
+                time.sleep(max(e.retry_in, self.policy.base_delay))
+
+    def get_json(self, url: str, headers: Dict) -> Dict:
+        """
+        Hace una petición GET y devuelve el JSON de la respuesta, reintentando los fallos recuperables.
+
+        Args:
+            url (str): URL de la petición.
+            headers (Dict): Headers de la petición.
+
+        Returns:
+            Dict: JSON de la respuesta.
+
+        Raises:
+            CircuitOpenError: Si el circuito lleva abierto más de RetryPolicy.max_outage.
+            RequestError: Si el fallo no es recuperable o se agotan los reintentos.
+        """
+        delay: float = self.policy.base_delay
+        error: str = ""
+        kind: str = OK
+        for attempt in range(self.policy.max_retries + 1):
+            probe: bool = self._wait_for_circuit()
+            try:
+                if self.limiter is not None:
+                    metrics.histogram(name="http_throttle_seconds", value=self.limiter.acquire())
+                with metrics.stage(name="http.request"):
+                    kind, data, retry_after, error = self._attempt(url=url, headers=headers)
+            except BaseException:
+                # Un error inesperado no puede dejar el circuito esperando a una prueba que no termina
+                self.breaker.record(success=False, probe=probe)
+                raise
+            self.breaker.record(success=kind in (OK, CLIENT), probe=probe)
+
+            if kind == OK:
+                metrics.histogram(name="http_retries", value=attempt, buckets=RETRY_BUCKETS)
+                return data
+            metrics.increment(name=f"http_failures_{kind}")
+            if kind not in RETRYABLE:
+                metrics.histogram(name="http_retries", value=attempt, buckets=RETRY_BUCKETS)
+                raise RequestError(message=f"{error} en {url}", kind=kind)
+            if attempt == self.policy.max_retries:
+                break
+
+            with self._rng_lock:
+                delay = decorrelated_jitter(previous=delay, base=self.policy.base_delay, cap=self.policy.max_delay, rng=self._rng)
+            wait_time: float = min(retry_after, self.policy.max_delay) if retry_after is not None else delay
+            if kind == RATE_LIMITED and self.limiter is not None:
+                self.limiter.defer(seconds=wait_time)
+            logging.warning(msg=f"{error} en {url}. Intento {attempt + 1}/{self.policy.max_retries + 1}. Reintentando en {wait_time:.1f} s...")
+            time.sleep(wait_time)
+
+        metrics.histogram(name="http_retries", value=self.policy.max_retries, buckets=RETRY_BUCKETS)
+        raise RequestError(message=f"Fallo tras {self.policy.max_retries + 1} intentos en {url}: {error}", kind=kind)
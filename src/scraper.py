@@ -2,21 +2,78 @@ import os
 import time
 import json
 import logging
-from datetime import datetime
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from datetime import datetime, date
+from typing import Dict, List, Optional, Set, Tuple
 
-from utils import wait
+from utils import wait, save_json
+from market import MarketStore
+from work_queue import WorkQueue, FetchTask
+from manifest import Manifest
+from changelog import ChangeLog
+from snapshots import ObjectStore
+from metrics import profiled
 from wrapper import GameDataExtractor
 
-from config import ScoringSystem, Credentials
-
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+from config import ScoringSystem, Credentials, Competition, DEFAULT_COMPETITION
 
 class BiwengerScraper:
-    def __init__(self, credentials: Credentials) -> None:
+    def __init__(
+            self,
+            credentials: Credentials,
+            competition: str = DEFAULT_COMPETITION,
+            extractor: Optional[GameDataExtractor] = None
+        ) -> None:
+        """
+        Args:
+            credentials (Credentials): Credenciales de Biwenger.
+            competition (str): Competición (p. ej. 'la-liga'). Sus datos se guardan en su propia carpeta
+                (Competition.get_data_folder). Por defecto, DEFAULT_COMPETITION.
+            extractor (GameDataExtractor, optional): Extractor a utilizar. Si se comparte entre los scrapers de
+                varias competiciones, comparten también la sesión, el login y el límite de peticiones.
+        """
         self.email: str = credentials.email
         self.password: str = credentials.password
-        self.GameDataExtractor: GameDataExtractor = GameDataExtractor(email=self.email, password=self.password)
+        self.competition: str = Competition.from_value(value=competition).get_value()
+        self.folder: str = Competition.from_value(value=competition).get_data_folder()
+        self.root: str = Competition.from_value(value=competition).get_json_folder()
+        self.GameDataExtractor: GameDataExtractor = extractor or GameDataExtractor(email=self.email, password=self.password)
+        self._manifest: Optional[Manifest] = None
+        self.changelog: ChangeLog = ChangeLog(path=f"{self.root}/changes.jsonl")
+        self.objects: ObjectStore = ObjectStore()
+
+    @property
+    def manifest(self) -> Manifest:
+        """
+        Manifiesto de los datos guardados. Se carga (o se reconstruye) la primera vez que se usa.
+        """
+        if self._manifest is None:
+            self._manifest = Manifest.load(path=f"{self.root}/manifest.json", root=self.root)
+        return self._manifest
+
+    def _save_payload(self, entity: str, path: str, entity_id: Optional[int], data: Dict) -> None:
+        """
+        Guarda el JSON de un partido o una jornada. Si ya existía, antes se compara campo a campo
+        con la versión guardada y las diferencias se añaden al registro de cambios. El contenido
+        se guarda también en el almacén de objetos, para las instantáneas del corpus.
+
+        Args:
+            entity (str): Tipo de dato ('game' o 'round').
+            path (str): Ruta del archivo.
+            entity_id (int, optional): ID del partido o de la jornada.
+            data (Dict): Contenido a guardar.
+        """
+        old_data: Optional[Dict] = None
+        if os.path.exists(path):
+            try:
+                with open(file=path, mode="r", encoding="utf-8") as file:
+                    old_data = json.load(fp=file)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                old_data = None
+
+        self.changelog.record(entity=entity, path=path, entity_id=entity_id, old=old_data, new=data)
+        save_json(path=path, data=data)
+        self.objects.put(data=data, path=path)
 
     def _get_score_folder(self, score: int) -> str:
         """
@@ -60,7 +117,7 @@ class BiwengerScraper:
             year (int): Año de la temporada.
             score (int): Sistema de puntuación a utilizar.
         """
-        return self.GameDataExtractor.get_season_data(year=year)
+        return self.GameDataExtractor.get_season_data(year=year, competition=self.competition)
     
     def _get_round_json(self, round: Optional[int]) -> Dict:
         """
@@ -69,7 +126,7 @@ class BiwengerScraper:
         Args:
             round (int): Número de la jornada.
         """
-        return self.GameDataExtractor.get_round_data(round=round)
+        return self.GameDataExtractor.get_round_data(round=round, competition=self.competition)
     
     def _get_game_json(self, game: int, score: int) -> Dict:
         """
@@ -79,8 +136,24 @@ class BiwengerScraper:
             game (int): ID del partido.
             score (int): Sistema de puntuación a utilizar.
         """
-        return self.GameDataExtractor.get_game_data(game=game, score=score)
+        return self.GameDataExtractor.get_game_data(game=game, score=score, competition=self.competition)
+
+    def _get_competition_json(self, score: int) -> Dict:
+        """
+        Obtiene los datos de la competición en formato JSON.
 
+        Args:
+            score (int): Sistema de puntuación a utilizar.
+        """
+        return self.GameDataExtractor.get_competition_data(score=score, competition=self.competition)
+
+    def _get_market_json(self) -> Dict:
+        """
+        Obtiene los datos del mercado activo en formato JSON.
+        """
+        return self.GameDataExtractor.get_market_data()
+
+    @profiled
     def save_seasons_data(self) -> None:
         """
         Guarda los datos de las temporadas en formato JSON.
@@ -88,45 +161,104 @@ class BiwengerScraper:
         Args:
             score (int): Sistema de puntuación a utilizar
         """
-        if not os.path.exists("data/JSONs/Seasons"):
-                os.makedirs(name="data/JSONs/Seasons")
+        if not os.path.exists(f"{self.root}/Seasons"):
+                os.makedirs(name=f"{self.root}/Seasons")
 
-        logging.info(msg=f"Guardando datos de las temporadas en 'data/JSONs/Seasons'...")
+        logging.info(msg=f"Guardando datos de las temporadas en '{self.root}/Seasons'...")
         for year in range(2015, datetime.now().year + 1):
             season_data: Dict = self._get_season_json(year=year)
 
-            season_path: str = f"data/JSONs/Seasons/{year}.json"
+            season_path: str = f"{self.root}/Seasons/{year}.json"
             if os.path.exists(season_path) and self._is_valid_json(path=season_path):
                 logging.info(msg=f"\t\t-Datos de la temporada {year} ya guardados. Continuando...")
                 continue
             
             logging.info(msg=f"\t-Guardando datos de la temporada {year}...")
-            with open(file=season_path, mode="w", encoding="utf-8") as file:
-                json.dump(
-                    obj=season_data,
-                    fp=file,
-                    indent=4,
-                    ensure_ascii=False
-                )
+            save_json(path=season_path, data=season_data)
+            self.objects.put(data=season_data, path=season_path)
+            self.manifest.add_season(season=str(year), path=season_path)
 
             logging.info(msg=f"\t-Datos de la temporada {year} guardados correctamente.")
             #wait()
 
-    def save_rounds_data(self) -> None:
+        self.manifest.save()
+
+    def _get_started_rounds(self) -> Set[Tuple[int, int]]:
+        """
+        Devuelve las jornadas que ya han empezado o terminado según los archivos de temporada: las
+        finalizadas y las que tienen la fecha de inicio ('start') en el pasado. Las jornadas futuras
+        también se guardan, por lo que el número de jornada no indica cuáles son las más recientes.
+
+        Returns:
+            Set[Tuple[int, int]]: (temporada, jornada) de cada jornada empezada.
+        """
+        now: float = time.time()
+        started: Set[Tuple[int, int]] = set()
+        for season in self.manifest.get_seasons():
+            try:
+                with open(file=self.manifest.get_season_path(season=season), mode="r", encoding="utf-8") as file:
+                    season_data: Dict = json.load(fp=file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                continue
+
+            for round in (season_data.get("data") or {}).get("rounds", []):
+                start: int = round.get("start") or 0
+                if round.get("status") == "finished" or 0 < start <= now:
+                    started.add((season, int(round["short"].lstrip("R"))))
+        return started
+
+    def _get_recent_rounds(self, rounds: int, scoring_folder: Optional[str] = None) -> List[Tuple[int, int]]:
         """
-        Guarda los datos de las jornadas en formato JSON.
+        Devuelve las últimas jornadas guardadas que ya han empezado o terminado, de la más antigua a
+        la más reciente.
 
         Args:
-            score (int): Sistema de puntuación a utilizar
+            rounds (int): Número de jornadas.
+            scoring_folder (str, optional): Si se indica, jornadas con partidos de ese sistema de puntuación.
+                Por defecto, jornadas con archivo de jornada.
+
+        Returns:
+            List[Tuple[int, int]]: (temporada, jornada) de cada jornada.
+        """
+        if rounds <= 0:
+            return []
+
+        if scoring_folder is None:
+            saved: List[Tuple[int, int]] = [
+                (season, round)
+                for season in self.manifest.get_round_seasons()
+                for round in self.manifest.get_rounds(season=season)
+            ]
+        else:
+            saved: List[Tuple[int, int]] = [
+                (season, round)
+                for season in self.manifest.get_game_seasons(scoring_folder=scoring_folder)
+                for round in self.manifest.get_game_rounds(scoring_folder=scoring_folder, season=season)
+            ]
+
+        started: Set[Tuple[int, int]] = self._get_started_rounds()
+        return [round for round in saved if round in started][-rounds:]
+
+    @profiled
+    def save_rounds_data(self, refresh_rounds: int = 0) -> None:
         """
-        logging.info(msg=f"Guardando datos de las jornadas en 'data/JSONs/Rounds'...")
-        for season in os.listdir(path=f"data/JSONs/Seasons"):
+        Guarda los datos de las jornadas en formato JSON. Las jornadas ya guardadas se omiten,
+        salvo las 'refresh_rounds' más recientes que ya han empezado, que se vuelven a descargar: sus cambios
+        (aplazamientos, cambios de fecha...) se añaden al registro de cambios.
+
+        Args:
+            refresh_rounds (int): Número de jornadas empezadas más recientes que se vuelven a descargar. Por defecto, 0.
+        """
+        refresh: List[Tuple[int, int]] = self._get_recent_rounds(rounds=refresh_rounds)
+
+        logging.info(msg=f"Guardando datos de las jornadas en '{self.root}/Rounds'...")
+        for season in os.listdir(path=f"{self.root}/Seasons"):
             season: str = season.split(sep=".")[0]
 
-            if not os.path.exists(f"data/JSONs/Rounds/{season}"):
-                os.makedirs(name=f"data/JSONs/Rounds/{season}")
+            if not os.path.exists(f"{self.root}/Rounds/{season}"):
+                os.makedirs(name=f"{self.root}/Rounds/{season}")
 
-            with open(file=f"data/JSONs/Seasons/{season}.json", mode="r", encoding="utf-8") as file:
+            with open(file=f"{self.root}/Seasons/{season}.json", mode="r", encoding="utf-8") as file:
                 season_data: Dict = json.load(fp=file)
             
             logging.info(msg=f"\t-Guardando datos de las jornadas de la temporada {season}...")
@@ -134,71 +266,327 @@ class BiwengerScraper:
                 round_id: int = round["id"]
                 round_name: str = round["short"]
 
-                round_path: str = f"data/JSONs/Rounds/{season}/{round_name}.json"
-                if os.path.exists(round_path) and self._is_valid_json(path=round_path):
+                round_path: str = f"{self.root}/Rounds/{season}/{round_name}.json"
+                saved: bool = os.path.exists(round_path) and self._is_valid_json(path=round_path)
+                if saved and (int(season), int(round_name.lstrip("R"))) not in refresh:
                     logging.info(msg=f"\t\t-Datos de la jornada {round_name} ya guardados. Continuando...")
                     continue
 
-                logging.info(msg=f"\t\t-Guardando datos de la jornada {round_name}...")
+                logging.info(msg=f"\t\t-{'Refrescando' if saved else 'Guardando'} datos de la jornada {round_name}...")
                 round_data: Dict = self._get_round_json(round=round_id)
-                with open(file=f"data/JSONs/Rounds/{season}/{round_name}.json", mode="w", encoding="utf-8") as file:
-                    json.dump(
-                        obj=round_data,
-                        fp=file,
-                        indent=4,
-                        ensure_ascii=False
-                    )
+                if saved and not self._is_valid_data(data=round_data):
+                    logging.warning(msg=f"\t\t-Respuesta no válida para la jornada {round_name}. Se mantiene la versión guardada.")
+                    continue
+
+                self._save_payload(entity="round", path=round_path, entity_id=round_id, data=round_data)
+                self.manifest.add_round(season=season, round=round_name, path=round_path)
 
                 logging.info(msg=f"\t\t-Datos de la jornada {round_name} guardados correctamente.")
                 #wait()
 
-    def save_games_data(self, score: int = ScoringSystem.PICAS.value) -> None:
+        self.manifest.save()
+
+    def _plan_games_tasks(self, queue: WorkQueue, scores: List[int]) -> None:
         """
-        Guarda los datos de los partidos en formato JSON.
+        Añade a la cola de trabajo las descargas de partidos de las jornadas aún no planificadas.
+        Los archivos que ya existen y son válidos se registran como tareas completadas, de modo
+        que solo se validan una vez.
 
         Args:
-            score (int): Sistema de puntuación a utilizar
+            queue (WorkQueue): Cola de trabajo.
+            scores (List[int]): Sistemas de puntuación a planificar.
         """
-        score_folder: str = self._get_score_folder(score=score)
-        logging.info(msg=f"Guardando datos de los partidos en 'data/JSONs/Games/{score_folder}'...")
-
-        round_folder: str = f"data/JSONs/Rounds"
+        round_folder: str = f"{self.root}/Rounds"
         for season in os.listdir(path=round_folder):
-            logging.info(msg=f"\t-Guardando datos de los partidos de la temporada {season}...")
             for round in os.listdir(path=f"{round_folder}/{season}"):
+                if not round.endswith(".json"):
+                    continue
                 round: str = round.split(sep=".")[0]
 
-                if not os.path.exists(f"data/JSONs/Games/{score_folder}/{season}/{round}"):
-                    os.makedirs(name=f"data/JSONs/Games/{score_folder}/{season}/{round}")
+                unplanned_scores: List[int] = [
+                    score for score in scores
+                    if not queue.is_planned(season=season, round=round, score=score)
+                ]
+                if not unplanned_scores:
+                    continue
 
                 with open(file=f"{round_folder}/{season}/{round}.json", mode="r", encoding="utf-8") as file:
                     round_data: Dict = json.load(fp=file)
 
-                logging.info(msg=f"\t\t-Guardando datos de los partidos de la jornada {round}...")
-                for game in round_data["data"]["games"]:
-                    game_id: int = game["id"]
-                    game_name: str = game["home"]["name"] + " vs " + game["away"]["name"]
+                logging.info(msg=f"\t-Planificando los partidos de la jornada {season}/{round}...")
+                for score in unplanned_scores:
+                    score_folder: str = self._get_score_folder(score=score)
+                    tasks: List[FetchTask] = []
+                    for game in round_data["data"]["games"]:
+                        game_name: str = game["home"]["name"] + " vs " + game["away"]["name"]
+                        tasks.append(FetchTask(
+                            season=season,
+                            round=round,
+                            game_id=game["id"],
+                            score=score,
+                            path=f"{self.root}/Games/{score_folder}/{season}/{round}/{game_name}.json"
+                        ))
+
+                    queue.plan(
+                        season=season,
+                        round=round,
+                        score=score,
+                        tasks=tasks,
+                        done=[os.path.exists(task.path) and self._is_valid_json(path=task.path) for task in tasks]
+                    )
+
+    def _is_valid_data(self, data: Dict) -> bool:
+        """
+        Comprueba si la respuesta de la API contiene datos válidos.
+
+        Args:
+            data (Dict): Respuesta de la API.
+        """
+        return data.get("status") == 200 and data.get("data") is not None
+
+    def _save_games_tasks(self, queue: Optional[WorkQueue], tasks: List[FetchTask], max_workers: int) -> int:
+        """
+        Descarga y guarda los partidos de una lista de tareas. Las peticiones se lanzan en
+        paralelo sobre la sesión compartida del extractor; la escritura de archivos y el
+        marcado de tareas se hacen desde el hilo principal.
+
+        Args:
+            queue (WorkQueue, optional): Cola de trabajo en la que marcar las tareas completadas.
+            tasks (List[FetchTask]): Tareas a ejecutar.
+            max_workers (int): Número máximo de peticiones simultáneas.
+
+        Returns:
+            int: Número de partidos guardados.
+        """
+        saved: int = 0
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures: Dict[Future, FetchTask] = {
+                    executor.submit(self._get_game_json, game=task.game_id, score=task.score): task
+                    for task in tasks
+                }
+                for future in as_completed(fs=futures):
+                    task: FetchTask = futures[future]
+                    game_name: str = os.path.basename(task.path)[:-5]
+                    score_folder: str = self._get_score_folder(score=task.score)
+
+                    try:
+                        game_data: Dict = future.result()
+                    except Exception as e:
+                        logging.error(msg=f"\t\t-Error descargando el partido {game_name} ({score_folder}): {e}")
+                        continue
 
-                    game_path: str = f"data/JSONs/Games/{score_folder}/{season}/{round}/{game_name}.json"
-                    if os.path.exists(game_path) and self._is_valid_json(path=game_path):
-                        #logging.info(msg=f"\t\t\t-Datos del partido {game_name} ya guardados. Continuando...")
+                    if not self._is_valid_data(data=game_data):
+                        logging.warning(msg=f"\t\t-Respuesta no válida para el partido {game_name} ({score_folder}). Se reintentará en la próxima ejecución.")
                         continue
 
-                    logging.info(msg=f"\t\t\t-Guardando datos del partido {game_name}...")
-                    game_data: Dict = self._get_game_json(game=game_id, score=score)
-                    with open(file=f"data/JSONs/Games/{score_folder}/{season}/{round}/{game_name}.json", mode="w", encoding="utf-8") as file:
-                        json.dump(
-                            obj=game_data,
-                            fp=file,
-                            indent=4,
-                            ensure_ascii=False
-                        )
+                    os.makedirs(name=os.path.dirname(task.path), exist_ok=True)
+                    self._save_payload(entity="game", path=task.path, entity_id=task.game_id, data=game_data)
+                    if queue is not None:
+                        queue.complete(task=task)
+                    self.manifest.add_game(path=task.path, game_id=task.game_id, status=game_data["data"]["status"])
+                    saved += 1
+                    if saved % 200 == 0:
+                        self.manifest.save()
+
+                    logging.info(msg=f"\t\t-Datos del partido {task.season}/{task.round}/{game_name} ({score_folder}) guardados correctamente.")
+        finally:
+            self.manifest.save()
+
+        return saved
+
+    def refresh_games(self, tasks: List[FetchTask], max_workers: int = 8) -> int:
+        """
+        Vuelve a descargar un lote de partidos ya guardados y sobrescribe sus archivos.
+
+        Args:
+            tasks (List[FetchTask]): Partidos a refrescar.
+            max_workers (int): Número máximo de peticiones simultáneas. Por defecto, 8.
+
+        Returns:
+            int: Número de partidos refrescados.
+        """
+        logging.info(msg=f"Refrescando {len(tasks)} partidos...")
+        return self._save_games_tasks(queue=None, tasks=tasks, max_workers=max_workers)
+
+    def refresh_recent_games(self, rounds: int, scores: Optional[List[int]] = None, max_workers: int = 8) -> int:
+        """
+        Vuelve a descargar todos los partidos (también los finalizados o guardados aún como
+        pendientes) de las últimas jornadas empezadas, para recoger los resultados nuevos y las
+        correcciones de puntos o eventos posteriores al partido. Los cambios se añaden al registro
+        de cambios.
+
+        Args:
+            rounds (int): Número de jornadas empezadas más recientes a refrescar.
+            scores (List[int], optional): Sistemas de puntuación. Por defecto, todos los de ScoringSystem.
+            max_workers (int): Número máximo de peticiones simultáneas. Por defecto, 8.
+
+        Returns:
+            int: Número de partidos refrescados.
+        """
+        if scores is None:
+            scores = [scoring_system.get_value() for scoring_system in ScoringSystem]
+
+        tasks: List[FetchTask] = []
+        for score in scores:
+            scoring_folder: str = self._get_score_folder(score=score)
+            for season, round in self._get_recent_rounds(rounds=rounds, scoring_folder=scoring_folder):
+                games: Dict[int, Dict] = self.manifest.get_games(scoring_folder=scoring_folder, season=season, round=round)
+                tasks.extend(
+                    FetchTask(season=str(season), round=f"R{round}", game_id=game_id, score=score, path=entry["path"])
+                    for game_id, entry in games.items()
+                )
+
+        if not tasks:
+            return 0
+        return self.refresh_games(tasks=tasks, max_workers=max_workers)
+
+    @profiled
+    def save_games_data(self, score: int = ScoringSystem.PICAS.value, max_workers: int = 1) -> None:
+        """
+        Guarda los datos de los partidos en formato JSON. Las descargas se gestionan con una
+        cola de trabajo persistente ('<carpeta de la competición>/queue.sqlite'), por lo que si la ejecución se
+        interrumpe, la siguiente retoma directamente las tareas pendientes.
+
+        Args:
+            score (int): Sistema de puntuación a utilizar
+            max_workers (int): Número máximo de peticiones simultáneas. Por defecto, 1.
+        """
+        self.save_all_games_data(scores=[score], max_workers=max_workers)
+
+    @profiled
+    def save_all_games_data(self, scores: Optional[List[int]] = None, max_workers: int = 8) -> None:
+        """
+        Guarda los datos de los partidos para varios sistemas de puntuación en una sola pasada:
+        cada archivo de jornada se lee una vez y las puntuaciones de cada partido se descargan
+        en paralelo, guardándose en su carpeta '<raíz de la competición>/Games/<puntuación>'.
+
+        Args:
+            scores (List[int], optional): Sistemas de puntuación. Por defecto, todos los de ScoringSystem.
+            max_workers (int): Número máximo de peticiones simultáneas. Por defecto, 8.
+        """
+        if scores is None:
+            scores = [scoring_system.get_value() for scoring_system in ScoringSystem]
+
+        score_folders: List[str] = [self._get_score_folder(score=score) for score in scores]
+        logging.info(msg=f"Guardando datos de los partidos en '{self.root}/Games/{{{','.join(score_folders)}}}'...")
+
+        queue: WorkQueue = WorkQueue(path=f"{self.folder}/queue.sqlite")
+        try:
+            self._plan_games_tasks(queue=queue, scores=scores)
+
+            pending: List[FetchTask] = queue.get_pending(scores=scores)
+            logging.info(msg=f"\t-{len(pending)} descargas de partidos pendientes.")
+            self._save_games_tasks(queue=queue, tasks=pending, max_workers=max_workers)
+        finally:
+            queue.close()
+
+    @profiled
+    def save_market_data(self, store: Optional[MarketStore] = None) -> None:
+        """
+        Guarda una instantánea diaria de los precios de los jugadores ('price') y de
+        las ventas activas del mercado ('market') en el almacén de series temporales.
+
+        Args:
+            store (MarketStore, optional): Almacén a utilizar. Por defecto, '<carpeta de la competición>/Market'.
+        """
+        if store is None:
+            store = MarketStore(folder=f"{self.folder}/Market")
+
+        today: date = date.today()
+        logging.info(msg=f"Guardando instantánea del mercado del {today.isoformat()} en '{store.folder}'...")
+
+        competition_data: Dict = self._get_competition_json(score=ScoringSystem.PICAS.value)
+        prices: Dict[int, int] = {
+            int(player["id"]): int(player["price"])
+            for player in (competition_data.get("data") or {}).get("players", {}).values()
+            if player.get("price") is not None
+        }
+        rows: int = store.append(series="price", day=today, values=prices)
+        logging.info(msg=f"\t-Precios de {rows} jugadores guardados correctamente.")
+
+        market_data: Dict = self._get_market_json()
+        sales: Dict[int, int] = {
+            int(sale["player"]["id"]): int(sale["price"])
+            for sale in (market_data.get("data") or {}).get("sales", [])
+            if sale.get("price") is not None
+        }
+        rows: int = store.append(series="market", day=today, values=sales)
+        logging.info(msg=f"\t-Precios de {rows} ventas del mercado guardados correctamente.")
+
+    def watch_market_data(self, interval: int = 6 * 60 * 60, store: Optional[MarketStore] = None) -> None:
+        """
+        Toma instantáneas del mercado periódicamente. Como el almacén guarda como mucho una
+        fila por jugador y día, las ejecuciones repetidas en el mismo día no duplican datos.
+
+        Args:
+            interval (int): Segundos entre instantáneas. Por defecto, 6 horas.
+            store (MarketStore, optional): Almacén a utilizar. Por defecto, '<carpeta de la competición>/Market'.
+        """
+        if store is None:
+            store = MarketStore(folder=f"{self.folder}/Market")
+
+        while True:
+            try:
+                self.save_market_data(store=store)
+            except Exception as e:
+                logging.error(msg=f"Error guardando la instantánea del mercado: {e}")
+            wait(seconds=interval)
+
+
+def scrape_competitions(
+        credentials: Credentials,
+        competitions: Optional[List[str]] = None,
+        scores: Optional[List[int]] = None,
+        rate_limit: float = 10.0,
+        max_workers: int = 8,
+        refresh_rounds: int = 0
+    ) -> Dict[str, Optional[str]]:
+    """
+    Descarga temporadas, jornadas y partidos de varias competiciones a la vez. Todas comparten
+    un único extractor (login, sesión, circuit breaker y límite de peticiones por segundo), que
+    reparte la cuota entre ellas por orden de llegada, de modo que añadir una competición
+    aprovecha la cuota libre en lugar de sumar su duración a la de las demás.
+
+    Args:
+        credentials (Credentials): Credenciales de Biwenger.
+        competitions (List[str], optional): Competiciones. Por defecto, todas las de Competition.
+        scores (List[int], optional): Sistemas de puntuación. Por defecto, todos los de ScoringSystem.
+        rate_limit (float): Peticiones por segundo entre todas las competiciones. Por defecto, 10.
+        max_workers (int): Número máximo de peticiones simultáneas por competición. Por defecto, 8.
+        refresh_rounds (int): Número de jornadas más recientes (y sus partidos) que se vuelven a descargar. Por defecto, 0.
+
+    Returns:
+        Dict[str, Optional[str]]: Error de cada competición (None si ha terminado correctamente).
+    """
+    if competitions is None:
+        competitions = [competition.get_value() for competition in Competition]
+
+    extractor: GameDataExtractor = GameDataExtractor(email=credentials.email, password=credentials.password, rate_limit=rate_limit)
 
-                    logging.info(msg=f"\t\t\t-Datos del partido {game_name} guardados correctamente.")
-                    #wait()
+    def scrape(competition: str) -> None:
+        scraper: BiwengerScraper = BiwengerScraper(credentials=credentials, competition=competition, extractor=extractor)
+        scraper.save_seasons_data()
+        scraper.save_rounds_data(refresh_rounds=refresh_rounds)
+        scraper.save_all_games_data(scores=scores, max_workers=max_workers)
+        scraper.refresh_recent_games(rounds=refresh_rounds, scores=scores, max_workers=max_workers)
 
+    errors: Dict[str, Optional[str]] = {}
+    with ThreadPoolExecutor(max_workers=len(competitions)) as executor:
+        futures: Dict[Future, str] = {executor.submit(scrape, competition): competition for competition in competitions}
+        for future in as_completed(fs=futures):
+            competition: str = futures[future]
+            try:
+                future.result()
+                errors[competition] = None
+                logging.info(msg=f"Competición '{competition}' descargada correctamente.")
+            except Exception as e:
+                errors[competition] = repr(e)
+                logging.error(msg=f"Error descargando la competición '{competition}': {e}")
+    return errors
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
     my_credentials: Credentials = Credentials()
     scoring_system: ScoringSystem = ScoringSystem.MEDIA
     
@@ -206,4 +594,6 @@ if __name__ == "__main__":
     
     #scraper.save_seasons_data()
     #scraper.save_rounds_data()
-    scraper.save_games_data(score=scoring_system.get_value())
\ No newline at end of file
+    scraper.save_games_data(score=scoring_system.get_value())
+    #scraper.save_all_games_data()
+    #scraper.watch_market_data()
\ No newline at end of file
@@ -0,0 +1,160 @@
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from features import FeatureBuilder, EVENT_FEATURES
+from processor import BiwengerProcessor
+from market import MarketStore
+from definitions.player import PlayerPosition
+
+PROFILE_COLUMNS: List[str] = [
+    "games",
+    "points_mean",
+    "points_std",
+    "points_p25",
+    "points_p75",
+    "minutes_mean",
+    "team_strength",
+    *[f"{name}_rate" for name in EVENT_FEATURES.values()],
+]
+
+POSITIONS: List[int] = [position.get_value() for position in PlayerPosition if position != PlayerPosition.DESCONOCIDA]
+
+class SimilarPlayer(NamedTuple):
+    player_id: int # ID del jugador
+    season: int # Temporada del perfil
+    position: int # Posición del jugador
+    similarity: float # Similitud del coseno con el perfil buscado (1 = idéntico)
+    price: Optional[int] # Precio del jugador (None si no se conoce)
+
+def build_profiles(features: pd.DataFrame, min_games: int = 3) -> pd.DataFrame:
+    """
+    Construye el perfil de cada jugador en cada temporada: distribución de puntos, minutos,
+    tasa de eventos por partido y fuerza de su equipo.
+
+    Args:
+        features (pd.DataFrame): Matriz de variables (FeatureBuilder).
+        min_games (int): Partidos mínimos con puntos en la temporada. Por defecto, 3.
+
+    Returns:
+        pd.DataFrame: Una fila por (temporada, jugador) con la posición y las columnas de PROFILE_COLUMNS.
+    """
+    played: pd.DataFrame = features[features["points"].notna()]
+    groups = played.groupby(by=["season", "player_id"], sort=True)
+    profiles: pd.DataFrame = groups.agg(
+        position=("player_position", "last"),
+        games=("points", "size"),
+        points_mean=("points", "mean"),
+        points_std=("points", "std"),
+        points_p25=("points", lambda points: points.quantile(q=0.25)),
+        points_p75=("points", lambda points: points.quantile(q=0.75)),
+        minutes_mean=("minutes", "mean"),
+        team_strength=("team_form", "mean"),
+        **{f"{name}_rate": (name, "mean") for name in EVENT_FEATURES.values()},
+    ).reset_index()
+    return profiles[profiles["games"] >= min_games].fillna(value=0).reset_index(drop=True)
+
+class SimilarityIndex:
+    """
+    Índice de búsqueda de jugadores similares (p. ej. para sustituir a un lesionado).
+
+    Los perfiles se estandarizan, se añade la posición en one-hot y cada fila se normaliza,
+    de modo que la similitud del coseno con todos los perfiles es un único producto
+    matriz-vector y los k mejores se obtienen con argpartition, en milisegundos.
+    """
+
+    def __init__(self, profiles: pd.DataFrame, prices: Optional[Dict[int, int]] = None, position_weight: float = 2.0) -> None:
+        """
+        Args:
+            profiles (pd.DataFrame): Perfiles de los jugadores (build_profiles).
+            prices (Dict[int, int], optional): Precio de cada jugador, para filtrar por presupuesto.
+            position_weight (float): Peso de la posición frente al resto de variables. Por defecto, 2.0.
+        """
+        self.profiles: pd.DataFrame = profiles
+        self.player_ids: np.ndarray = profiles["player_id"].to_numpy(dtype=np.int64)
+        self.seasons: np.ndarray = profiles["season"].to_numpy(dtype=np.int64)
+        self.positions: np.ndarray = profiles["position"].to_numpy(dtype=np.int64)
+        self.prices: np.ndarray = np.array([(prices or {}).get(int(player_id), -1) for player_id in self.player_ids], dtype=np.int64)
+
+        values: np.ndarray = profiles[PROFILE_COLUMNS].to_numpy(dtype=np.float64)
+        std: np.ndarray = values.std(axis=0)
+        values = (values - values.mean(axis=0)) / np.where(std > 0, std, 1)
+        one_hot: np.ndarray = (self.positions[:, None] == np.array(POSITIONS)[None, :]) * position_weight
+        matrix: np.ndarray = np.hstack([values, one_hot])
+        norms: np.ndarray = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self.matrix: np.ndarray = (matrix / np.where(norms > 0, norms, 1)).astype(np.float32)
+
+        self._seasons_count: int = max(len(np.unique(self.seasons)), 1)
+
+        # Fila del perfil más reciente de cada jugador
+        self._latest_rows: Dict[int, int] = {int(player_id): row for row, player_id in enumerate(self.player_ids)}
+        self._rows: Dict[Tuple[int, int], int] = {(int(season), int(player_id)): row for row, (season, player_id) in enumerate(zip(self.seasons, self.player_ids))}
+
+    def find_similar(
+        self,
+        player_id: int,
+        season: Optional[int] = None,
+        k: int = 10,
+        budget: Optional[int] = None,
+        same_position: bool = True,
+        only_season: Optional[int] = None
+    ) -> List[SimilarPlayer]:
+        """
+        Busca los jugadores con el perfil más parecido al de un jugador.
+
+        Args:
+            player_id (int): ID del jugador de referencia.
+            season (int, optional): Temporada del perfil de referencia. Por defecto, la más reciente.
+            k (int): Número de jugadores a devolver. Por defecto, 10.
+            budget (int, optional): Precio máximo (se descartan los jugadores sin precio).
+            same_position (bool): Si solo se buscan jugadores de la misma posición. Por defecto, True.
+            only_season (int, optional): Si se indica, solo se buscan perfiles de esa temporada.
+
+        Returns:
+            List[SimilarPlayer]: Jugadores similares, de mayor a menor similitud (un perfil por jugador).
+        """
+        row: Optional[int] = self._latest_rows.get(player_id) if season is None else self._rows.get((season, player_id))
+        if row is None:
+            raise ValueError(f"El jugador {player_id} no tiene perfil{'' if season is None else f' en la temporada {season}'}.")
+
+        similarities: np.ndarray = self.matrix @ self.matrix[row]
+        candidates: np.ndarray = self.player_ids != player_id
+        if same_position:
+            candidates &= self.positions == self.positions[row]
+        if budget is not None:
+            candidates &= (self.prices >= 0) & (self.prices <= budget)
+        if only_season is not None:
+            candidates &= self.seasons == only_season
+        similarities = np.where(candidates, similarities, -np.inf)
+
+        # Se piden k filas por temporada porque un mismo jugador puede tener un perfil en cada una
+        top: int = min(len(similarities), k * self._seasons_count)
+        best: np.ndarray = np.argpartition(-similarities, kth=top - 1)[:top] if top else np.empty(0, dtype=np.int64)
+        best = best[np.argsort(-similarities[best], kind="stable")]
+
+        results: List[SimilarPlayer] = []
+        seen: set = set()
+        for index in best:
+            if not np.isfinite(similarities[index]) or len(results) == k:
+                break
+            if self.player_ids[index] in seen:
+                continue
+            seen.add(self.player_ids[index])
+            results.append(SimilarPlayer(
+                player_id=int(self.player_ids[index]),
+                season=int(self.seasons[index]),
+                position=int(self.positions[index]),
+                similarity=float(similarities[index]),
+                price=int(self.prices[index]) if self.prices[index] >= 0 else None
+            ))
+        return results
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    features: pd.DataFrame = FeatureBuilder(processor=BiwengerProcessor()).load()
+    index: SimilarityIndex = SimilarityIndex(profiles=build_profiles(features=features), prices=MarketStore().get_latest(series="price"))
+    for similar in index.find_similar(player_id=int(index.player_ids[0])):
+        print(similar)
@@ -0,0 +1,173 @@
+import logging
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from features import FeatureBuilder
+from processor import BiwengerProcessor
+
+class SimulationResult(NamedTuple):
+    player_ids: np.ndarray # IDs de los jugadores simulados
+    player_points: np.ndarray # Puntos simulados de cada jugador (jugadores x simulaciones)
+    totals: np.ndarray # Puntos totales de la plantilla en cada simulación
+
+    def percentiles(self, q: Sequence[float] = (5, 25, 50, 75, 95)) -> Dict[float, float]:
+        """
+        Devuelve las bandas de percentiles de los puntos totales.
+
+        Args:
+            q (Sequence[float]): Percentiles. Por defecto, 5, 25, 50, 75 y 95.
+        """
+        return dict(zip(q, np.percentile(self.totals, q=q).tolist()))
+
+    def probability_above(self, target: float) -> float:
+        """
+        Devuelve la probabilidad de superar una puntuación total.
+
+        Args:
+            target (float): Puntuación objetivo.
+        """
+        return float((self.totals > target).mean())
+
+class PointsSimulator:
+    """
+    Simulador Monte Carlo de los puntos de una plantilla. Los puntos de cada jugador se muestrean
+    de su distribución histórica (remuestreo de sus actuaciones), mezclada con la de su posición
+    cuando tiene pocos partidos, y se ajustan según lo que concede el rival a esa posición.
+
+    Todas las simulaciones de una plantilla se generan a la vez con operaciones de NumPy sobre
+    una matriz (jugadores x simulaciones), sin bucles por simulación.
+    """
+
+    def __init__(self, features: pd.DataFrame, prior_games: int = 5, opponent_prior_games: int = 20, seed: Optional[int] = None) -> None:
+        """
+        Args:
+            features (pd.DataFrame): Matriz de variables (FeatureBuilder), con los puntos reales.
+            prior_games (int): Peso, en partidos, de la distribución de la posición frente a la del jugador. Por defecto, 5.
+            opponent_prior_games (int): Partidos necesarios para que el ajuste por rival tenga la mitad de su peso. Por defecto, 20.
+            seed (int, optional): Semilla del generador aleatorio.
+        """
+        history: pd.DataFrame = features[features["points"].notna()]
+        self.prior_games: int = prior_games
+        self.generator: np.random.Generator = np.random.default_rng(seed=seed)
+
+        # Historial de cada jugador en una matriz rellenada (jugadores x máximo de partidos)
+        history = history.sort_values(by=["player_id", "date"], kind="stable")
+        self.player_ids: np.ndarray = history["player_id"].unique()
+        self._player_index: Dict[int, int] = {int(player_id): index for index, player_id in enumerate(self.player_ids)}
+        rows: np.ndarray = np.searchsorted(self.player_ids, history["player_id"].to_numpy())
+        self.counts: np.ndarray = np.bincount(rows, minlength=len(self.player_ids))
+        columns: np.ndarray = np.arange(len(rows)) - np.repeat(np.cumsum(self.counts) - self.counts, self.counts)
+        self.history: np.ndarray = np.zeros((len(self.player_ids), max(int(self.counts.max(initial=0)), 1)), dtype=np.float32)
+        self.history[rows, columns] = history["points"].to_numpy(dtype=np.float32)
+        self.positions: np.ndarray = history.groupby(by="player_id", sort=True)["player_position"].last().to_numpy(dtype=np.int64)
+
+        # Distribución de cada posición
+        self._position_points: Dict[int, np.ndarray] = {
+            int(position): table["points"].to_numpy(dtype=np.float32)
+            for position, table in history.groupby(by="player_position")
+        }
+        position_means: pd.Series = history.groupby(by="player_position")["points"].mean()
+
+        # Ajuste por rival: diferencia entre lo que concede el rival a cada posición y la media de la posición
+        conceded: pd.DataFrame = history.groupby(by=["opponent_id", "player_position"])["points"].agg(["mean", "count"]).reset_index()
+        conceded["adjustment"] = (conceded["mean"] - conceded["player_position"].map(position_means)) * conceded["count"] / (conceded["count"] + opponent_prior_games)
+        self._opponent_adjustments: Dict[Tuple[int, int], float] = {
+            (int(opponent_id), int(position)): float(adjustment)
+            for opponent_id, position, adjustment in conceded[["opponent_id", "player_position", "adjustment"]].itertuples(index=False)
+        }
+
+    def _get_rows(self, player_ids: Sequence[int]) -> np.ndarray:
+        """
+        Devuelve la fila del historial de cada jugador.
+        """
+        try:
+            return np.array([self._player_index[int(player_id)] for player_id in player_ids], dtype=np.int64)
+        except KeyError as e:
+            raise ValueError(f"El jugador {e.args[0]} no tiene partidos con puntos en el historial.")
+
+    def _sample(self, rows: np.ndarray, opponent_ids: Optional[Sequence[int]], simulations: int) -> np.ndarray:
+        """
+        Muestrea los puntos de varios jugadores en una jornada.
+
+        Args:
+            rows (np.ndarray): Filas del historial de los jugadores.
+            opponent_ids (Sequence[int], optional): Rival de cada jugador (None si no se ajusta por rival).
+            simulations (int): Número de simulaciones.
+
+        Returns:
+            np.ndarray: Puntos simulados (jugadores x simulaciones).
+        """
+        counts: np.ndarray = self.counts[rows]
+        picks: np.ndarray = (self.generator.random(size=(len(rows), simulations)) * counts[:, None]).astype(np.int64)
+        points: np.ndarray = self.history[rows[:, None], picks]
+
+        # Con probabilidad prior / (prior + partidos) se muestrea de la distribución de la posición
+        from_position: np.ndarray = self.generator.random(size=(len(rows), simulations)) < (self.prior_games / (self.prior_games + counts))[:, None]
+        positions: np.ndarray = self.positions[rows]
+        for position in np.unique(positions):
+            mask: np.ndarray = from_position & (positions == position)[:, None]
+            pool: np.ndarray = self._position_points[int(position)]
+            points[mask] = pool[self.generator.integers(low=0, high=len(pool), size=int(mask.sum()))]
+
+        if opponent_ids is not None:
+            adjustments: np.ndarray = np.array([
+                self._opponent_adjustments.get((int(opponent_id), int(position)), 0.0)
+                for opponent_id, position in zip(opponent_ids, positions)
+            ], dtype=np.float32)
+            points += adjustments[:, None]
+
+        return points
+
+    def simulate_round(self, player_ids: Sequence[int], opponent_ids: Optional[Sequence[int]] = None, simulations: int = 10000) -> SimulationResult:
+        """
+        Simula los puntos de una plantilla en una jornada.
+
+        Args:
+            player_ids (Sequence[int]): IDs de los jugadores.
+            opponent_ids (Sequence[int], optional): Rival de cada jugador en la jornada.
+            simulations (int): Número de simulaciones. Por defecto, 10000.
+
+        Returns:
+            SimulationResult: Puntos simulados.
+        """
+        rows: np.ndarray = self._get_rows(player_ids=player_ids)
+        points: np.ndarray = self._sample(rows=rows, opponent_ids=opponent_ids, simulations=simulations)
+        return SimulationResult(player_ids=self.player_ids[rows], player_points=points, totals=points.sum(axis=0))
+
+    def simulate_season(
+        self,
+        player_ids: Sequence[int],
+        rounds: int = 38,
+        opponents: Optional[List[Sequence[int]]] = None,
+        simulations: int = 10000
+    ) -> SimulationResult:
+        """
+        Simula los puntos de una plantilla en varias jornadas (los puntos de cada jugador son
+        la suma de sus jornadas).
+
+        Args:
+            player_ids (Sequence[int]): IDs de los jugadores.
+            rounds (int): Número de jornadas. Por defecto, 38 (se ignora si se indican los rivales).
+            opponents (List[Sequence[int]], optional): Rival de cada jugador en cada jornada.
+            simulations (int): Número de simulaciones. Por defecto, 10000.
+
+        Returns:
+            SimulationResult: Puntos simulados.
+        """
+        rows: np.ndarray = self._get_rows(player_ids=player_ids)
+        points: np.ndarray = np.zeros((len(rows), simulations), dtype=np.float32)
+        for round in range(len(opponents) if opponents is not None else rounds):
+            points += self._sample(rows=rows, opponent_ids=opponents[round] if opponents is not None else None, simulations=simulations)
+        return SimulationResult(player_ids=self.player_ids[rows], player_points=points, totals=points.sum(axis=0))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    features: pd.DataFrame = FeatureBuilder(processor=BiwengerProcessor()).load()
+    simulator: PointsSimulator = PointsSimulator(features=features, seed=0)
+    squad: np.ndarray = simulator.player_ids[:11]
+    result: SimulationResult = simulator.simulate_round(player_ids=squad, simulations=50000)
+    print(result.percentiles())
+    print(f"P(> 60 puntos): {result.probability_above(target=60):.3f}")
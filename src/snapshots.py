@@ -0,0 +1,333 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from manifest import Manifest
+from archive import _get_zstandard
+from utils import save_json
+from config import Competition, DEFAULT_COMPETITION
+
+class SnapshotInfo(NamedTuple):
+    snapshot_id: str # ID de la instantánea (hash de su contenido)
+    name: Optional[str] # Nombre opcional (p. ej. '2023-R20')
+    created: float # Momento de creación
+    objects: int # Número de archivos de la instantánea
+
+def _encode(data: Dict) -> bytes:
+    """
+    Serializa un JSON de forma canónica (compacta), que es lo que se guarda y se hashea.
+    """
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+class ObjectStore:
+    """
+    Almacén direccionado por contenido de los JSON descargados. Cada objeto se guarda una única
+    vez, comprimido con zstd, en '<carpeta>/<2 primeros caracteres>/<sha256>.zst'; los archivos
+    que no cambian entre instantáneas comparten el mismo objeto.
+
+    Un índice de solo escritura al final ('index.jsonl': ruta, mtime, tamaño y hash) evita
+    volver a leer y hashear los archivos que no han cambiado desde que se guardaron.
+    """
+
+    def __init__(self, folder: str = "data/Objects", compress: bool = True) -> None:
+        """
+        Args:
+            folder (str): Carpeta de los objetos. Por defecto, 'data/Objects'.
+            compress (bool): Si los objetos nuevos se comprimen con zstd. Por defecto, True.
+        """
+        self.folder: str = folder
+        self.compress: bool = compress
+        self.index_path: str = os.path.join(folder, "index.jsonl")
+        self._index: Optional[Dict[str, Tuple[float, int, str]]] = None
+        self._compressor: Any = None
+        self._decompressor: Any = None
+
+    def _get_object_path(self, digest: str, extension: str) -> str:
+        return os.path.join(self.folder, digest[:2], f"{digest}.{extension}")
+
+    @property
+    def index(self) -> Dict[str, Tuple[float, int, str]]:
+        """
+        Índice ruta -> (mtime, tamaño, hash). Se lee la primera vez que se usa.
+        """
+        if self._index is None:
+            self._index = {}
+            if os.path.exists(self.index_path):
+                with open(file=self.index_path, mode="r", encoding="utf-8") as file:
+                    for line in file:
+                        if line.endswith("\n"):
+                            path, mtime, size, digest = json.loads(line)
+                            self._index[path] = (mtime, size, digest)
+        return self._index
+
+    def __contains__(self, digest: str) -> bool:
+        return any(os.path.exists(self._get_object_path(digest=digest, extension=extension)) for extension in ("zst", "json"))
+
+    def put(self, data: Dict, path: Optional[str] = None) -> str:
+        """
+        Guarda un JSON en el almacén (si no estaba ya).
+
+        Args:
+            data (Dict): Contenido a guardar.
+            path (str, optional): Archivo de 'data/JSONs' con este contenido. Si se indica (y existe),
+                se registra en el índice para no tener que volver a hashearlo.
+
+        Returns:
+            str: Hash (sha256) del contenido.
+        """
+        raw: bytes = _encode(data=data)
+        digest: str = hashlib.sha256(raw).hexdigest()
+
+        if digest not in self:
+            extension: str = "json"
+            if self.compress:
+                if self._compressor is None:
+                    self._compressor = _get_zstandard().ZstdCompressor(level=9)
+                raw = self._compressor.compress(raw)
+                extension = "zst"
+
+            object_path: str = self._get_object_path(digest=digest, extension=extension)
+            os.makedirs(name=os.path.dirname(object_path), exist_ok=True)
+            # Varios scrapers (p. ej. de distintas competiciones) pueden guardar el mismo objeto a la vez
+            tmp_path: str = f"{object_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(file=tmp_path, mode="wb") as file:
+                file.write(raw)
+            os.replace(src=tmp_path, dst=object_path)
+
+        if path is not None and os.path.exists(path):
+            stat: os.stat_result = os.stat(path)
+            entry: Tuple[float, int, str] = (stat.st_mtime, stat.st_size, digest)
+            if self.index.get(path) != entry:
+                self.index[path] = entry
+                os.makedirs(name=self.folder, exist_ok=True)
+                with open(file=self.index_path, mode="a", encoding="utf-8") as file:
+                    file.write(json.dumps([path, *entry], ensure_ascii=False) + "\n")
+        return digest
+
+    def put_file(self, path: str) -> str:
+        """
+        Guarda un archivo JSON en el almacén. Si no ha cambiado desde que se registró en el
+        índice, no se vuelve a leer.
+
+        Args:
+            path (str): Ruta del archivo.
+
+        Returns:
+            str: Hash (sha256) del contenido.
+        """
+        stat: os.stat_result = os.stat(path)
+        entry: Optional[Tuple[float, int, str]] = self.index.get(path)
+        if entry is not None and entry[0] == stat.st_mtime and entry[1] == stat.st_size and entry[2] in self:
+            return entry[2]
+
+        with open(file=path, mode="r", encoding="utf-8") as file:
+            return self.put(data=json.load(fp=file), path=path)
+
+    def get(self, digest: str) -> Dict:
+        """
+        Lee un objeto del almacén.
+
+        Args:
+            digest (str): Hash del objeto.
+
+        Returns:
+            Dict: Contenido del objeto.
+        """
+        compressed_path: str = self._get_object_path(digest=digest, extension="zst")
+        if os.path.exists(compressed_path):
+            with open(file=compressed_path, mode="rb") as file:
+                raw: bytes = file.read()
+            if self._decompressor is None:
+                self._decompressor = _get_zstandard().ZstdDecompressor()
+            return json.loads(self._decompressor.decompress(raw))
+
+        try:
+            with open(file=self._get_object_path(digest=digest, extension="json"), mode="rb") as file:
+                return json.loads(file.read())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"El objeto {digest} no está en el almacén '{self.folder}'.")
+
+class Snapshot:
+    """
+    Versión congelada del corpus: un manifiesto (mismo formato que Manifest) y el hash del
+    contenido de cada archivo. Abrirla solo requiere leer su JSON; los archivos se leen del
+    almacén de objetos bajo demanda.
+    """
+
+    def __init__(self, info: SnapshotInfo, manifest: Manifest, objects: Dict[str, str], store: ObjectStore) -> None:
+        self.info: SnapshotInfo = info
+        self.manifest: Manifest = manifest
+        self.objects: Dict[str, str] = objects
+        self.store: ObjectStore = store
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.objects
+
+    def load_json(self, path: str) -> Dict:
+        """
+        Lee un archivo tal y como estaba al crear la instantánea.
+
+        Args:
+            path (str): Ruta del archivo en 'data/JSONs'.
+
+        Returns:
+            Dict: Contenido del archivo.
+        """
+        digest: Optional[str] = self.objects.get(path)
+        if digest is None:
+            raise FileNotFoundError(f"El archivo {path} no está en la instantánea {self.info.snapshot_id}.")
+        return self.store.get(digest=digest)
+
+class SnapshotStore:
+    """
+    Instantáneas del corpus (p. ej. "el corpus tras la jornada 20") para entrenar modelos de
+    forma reproducible sin copiar 'data/JSONs'. Cada instantánea es un JSON en
+    '<carpeta>/<ID>.json' con el manifiesto y el hash de cada archivo; el ID es el hash de ese
+    contenido (sin las fechas de modificación), por lo que dos instantáneas del mismo corpus
+    tienen el mismo ID.
+    """
+
+    def __init__(self, folder: Optional[str] = None, store: Optional[ObjectStore] = None, competition: str = DEFAULT_COMPETITION) -> None:
+        """
+        Args:
+            folder (str, optional): Carpeta de las instantáneas. Por defecto, '<carpeta de la competición>/Snapshots'.
+            store (ObjectStore, optional): Almacén de objetos. Por defecto, 'data/Objects' (compartido por
+                todas las competiciones: los objetos se identifican por su contenido).
+            competition (str): Competición del corpus. Por defecto, DEFAULT_COMPETITION.
+        """
+        self.root: str = Competition.from_value(value=competition).get_json_folder()
+        self.folder: str = folder or f"{Competition.from_value(value=competition).get_data_folder()}/Snapshots"
+        self.store: ObjectStore = store or ObjectStore()
+        self.names_path: str = os.path.join(self.folder, "names.json")
+
+    def _load_names(self) -> Dict[str, str]:
+        if not os.path.exists(self.names_path):
+            return {}
+        with open(file=self.names_path, mode="r", encoding="utf-8") as file:
+            return json.load(fp=file)
+
+    def create(self, manifest: Optional[Manifest] = None, name: Optional[str] = None) -> str:
+        """
+        Crea una instantánea del corpus actual. Solo se leen y se guardan los archivos nuevos o
+        modificados desde la última vez que se registraron en el almacén.
+
+        Args:
+            manifest (Manifest, optional): Manifiesto del corpus. Por defecto, el actual de la competición.
+            name (str, optional): Nombre de la instantánea, para cargarla sin conocer su ID.
+
+        Returns:
+            str: ID de la instantánea.
+        """
+        if manifest is None:
+            manifest = Manifest.load(path=f"{self.root}/manifest.json", root=self.root)
+
+        paths: List[str] = [
+            *manifest.seasons.values(),
+            *(path for rounds in manifest.rounds.values() for path in rounds.values()),
+            *(
+                entry["path"]
+                for seasons in manifest.games.values()
+                for rounds in seasons.values()
+                for games in rounds.values()
+                for entry in games.values()
+            ),
+        ]
+        objects: Dict[str, str] = {path: self.store.put_file(path=path) for path in sorted(paths)}
+
+        games: Dict = {
+            scoring_folder: {
+                season: {
+                    round: {game_id: {"path": entry["path"], "status": entry["status"]} for game_id, entry in round_games.items()}
+                    for round, round_games in rounds.items()
+                }
+                for season, rounds in seasons.items()
+            }
+            for scoring_folder, seasons in manifest.games.items()
+        }
+        content: Dict = {"seasons": manifest.seasons, "rounds": manifest.rounds, "games": games, "objects": objects}
+        snapshot_id: str = hashlib.sha256(_encode(data=content)).hexdigest()[:16]
+
+        # La fecha de modificación se guarda (la usan los consumidores del manifiesto para detectar
+        # cambios), pero no forma parte del ID: volver a guardar un archivo sin cambios no lo altera
+        for scoring_folder, seasons in games.items():
+            for season, rounds in seasons.items():
+                for round, round_games in rounds.items():
+                    for game_id, entry in round_games.items():
+                        entry["mtime"] = manifest.games[scoring_folder][season][round][game_id].get("mtime")
+
+        path: str = os.path.join(self.folder, f"{snapshot_id}.json")
+        os.makedirs(name=self.folder, exist_ok=True)
+        if not os.path.exists(path):
+            save_json(path=path, data={"id": snapshot_id, "name": name, "created": time.time(), **content})
+        if name is not None:
+            names: Dict[str, str] = self._load_names()
+            names[name] = snapshot_id
+            save_json(path=self.names_path, data=names)
+
+        logging.info(msg=f"Instantánea {snapshot_id}{f' ({name})' if name else ''} creada con {len(objects)} archivos.")
+        return snapshot_id
+
+    def load(self, snapshot: str) -> Snapshot:
+        """
+        Abre una instantánea.
+
+        Args:
+            snapshot (str): ID o nombre de la instantánea.
+
+        Returns:
+            Snapshot: Instantánea.
+        """
+        snapshot_id: str = self._load_names().get(snapshot, snapshot)
+        path: str = os.path.join(self.folder, f"{snapshot_id}.json")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"La instantánea '{snapshot}' no existe.")
+
+        with open(file=path, mode="r", encoding="utf-8") as file:
+            data: Dict = json.load(fp=file)
+
+        manifest: Manifest = Manifest(path=path)
+        manifest.seasons = data["seasons"]
+        manifest.rounds = data["rounds"]
+        manifest.games = data["games"]
+        # Las instantáneas antiguas no guardan la fecha de modificación de los partidos
+        for seasons in manifest.games.values():
+            for rounds in seasons.values():
+                for round_games in rounds.values():
+                    for entry in round_games.values():
+                        entry.setdefault("mtime", None)
+        info: SnapshotInfo = SnapshotInfo(snapshot_id=data["id"], name=data.get("name"), created=data["created"], objects=len(data["objects"]))
+        return Snapshot(info=info, manifest=manifest, objects=data["objects"], store=self.store)
+
+    def list(self) -> List[SnapshotInfo]:
+        """
+        Devuelve las instantáneas disponibles, de la más antigua a la más reciente.
+        """
+        if not os.path.isdir(self.folder):
+            return []
+
+        names: Dict[str, str] = {snapshot_id: name for name, snapshot_id in self._load_names().items()}
+        snapshots: List[SnapshotInfo] = []
+        for file in os.listdir(path=self.folder):
+            if not file.endswith(".json") or file == os.path.basename(self.names_path):
+                continue
+            with open(file=os.path.join(self.folder, file), mode="r", encoding="utf-8") as snapshot_file:
+                data: Dict = json.load(fp=snapshot_file)
+            snapshots.append(SnapshotInfo(
+                snapshot_id=data["id"],
+                name=names.get(data["id"], data.get("name")),
+                created=data["created"],
+                objects=len(data["objects"])
+            ))
+        return sorted(snapshots, key=lambda snapshot: snapshot.created)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    store: SnapshotStore = SnapshotStore()
+    store.create()
+    for info in store.list():
+        print(info)
@@ -1,4 +1,7 @@
+import os
+import json
 from time import sleep
+from typing import Dict
 
 def wait(seconds: int = 5) -> None:
     """
@@ -7,4 +10,27 @@ def wait(seconds: int = 5) -> None:
     Args:
         seconds (int): Tiempo a esperar en segundos.
     """
-    sleep(seconds)
\ No newline at end of file
+    sleep(seconds)
+
+def save_json(path: str, data: Dict) -> None:
+    """
+    Guarda un diccionario en formato JSON de forma atómica: se escribe en un archivo
+    temporal junto al destino y después se renombra, de modo que nunca queda un JSON a medias.
+
+    Args:
+        path (str): Ruta del archivo JSON.
+        data (Dict): Contenido a guardar.
+    """
+    tmp_path: str = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(file=tmp_path, mode="w", encoding="utf-8") as file:
+            json.dump(
+                obj=data,
+                fp=file,
+                indent=4,
+                ensure_ascii=False
+            )
+        os.replace(src=tmp_path, dst=path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,279 @@
+import os
+import logging
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed, Future
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from definitions.event import EventType
+from definitions.player import PlayerPosition
+from definitions.status import Status
+from processor import BiwengerProcessor
+from utils import save_json
+from config import DEFAULT_COMPETITION
+
+ERROR: str = "error" # El procesador no puede procesar el dato
+WARNING: str = "warning" # El dato se procesa, pero probablemente es incorrecto
+
+EVENT_TYPES: Set[int] = {event_type.get_value() for event_type in EventType}
+STATUSES: Set[str] = {status.get_value() for status in Status}
+POSITIONS: Set[int] = {position.get_value() for position in PlayerPosition}
+
+class Issue(NamedTuple):
+    severity: str # Gravedad (ERROR o WARNING)
+    check: str # Comprobación que ha fallado
+    season: int # Temporada
+    round: int # Número de la jornada
+    game: Optional[str] # Nombre del partido (None si el problema es de la jornada)
+    game_id: Optional[int] # ID del partido, si se conoce
+    player_id: Optional[int] # ID del jugador, si el problema es de un jugador
+    message: str # Descripción del problema
+
+class ValidationReport:
+    """
+    Resultado de la validación del corpus: todos los problemas encontrados, sin interrumpir
+    la validación en el primero.
+    """
+
+    def __init__(self, scoring_folder: str, issues: List[Issue], games_checked: int, folder: str = "data") -> None:
+        """
+        Args:
+            scoring_folder (str): Carpeta del sistema de puntuación validado.
+            issues (List[Issue]): Problemas encontrados.
+            games_checked (int): Número de partidos validados.
+            folder (str): Carpeta de datos de la competición validada, donde se guarda el informe. Por defecto, 'data'.
+        """
+        self.scoring_folder: str = scoring_folder
+        self.issues: List[Issue] = issues
+        self.games_checked: int = games_checked
+        self.folder: str = folder
+
+    @property
+    def has_errors(self) -> bool:
+        """
+        Indica si hay algún problema que impide procesar los datos.
+        """
+        return any(issue.severity == ERROR for issue in self.issues)
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Devuelve el número de problemas de cada comprobación.
+        """
+        return dict(Counter(f"{issue.severity}:{issue.check}" for issue in self.issues).most_common())
+
+    def get_invalid_games(self) -> Set[Tuple[int, int, str]]:
+        """
+        Devuelve los partidos con algún error, como (temporada, jornada, partido).
+        """
+        return {(issue.season, issue.round, issue.game) for issue in self.issues if issue.severity == ERROR and issue.game is not None}
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Guarda el informe en un archivo JSON.
+
+        Args:
+            path (str, optional): Ruta del archivo. Por defecto, '<carpeta de la competición>/quality_report_<puntuación>.json'.
+        """
+        if path is None:
+            path = f"{self.folder}/quality_report_{self.scoring_folder}.json"
+        os.makedirs(name=os.path.dirname(path) or ".", exist_ok=True)
+        save_json(path=path, data={
+            "scoring_folder": self.scoring_folder,
+            "games_checked": self.games_checked,
+            "summary": self.summary(),
+            "issues": [issue._asdict() for issue in self.issues],
+        })
+
+def _check_game(game_raw_data: Dict, manifest_status: str, round_status: Optional[str], issue: Any) -> None:
+    """
+    Comprueba un partido y registra sus problemas.
+
+    Args:
+        game_raw_data (Dict): Contenido del JSON del partido.
+        manifest_status (str): Estado del partido según el manifiesto.
+        round_status (str, optional): Estado de la jornada.
+        issue (Callable): Función que registra un problema (gravedad, comprobación, mensaje, jugador).
+    """
+    data: Dict = game_raw_data["data"]
+    status: Any = data.get("status")
+    if status not in STATUSES:
+        issue(ERROR, "unknown_status", f"Estado de partido desconocido: {status!r}.", None)
+    if status != manifest_status:
+        issue(WARNING, "status_mismatch", f"El manifiesto indica '{manifest_status}' y el archivo '{status}'.", None)
+    if round_status == "finished" and status != "finished":
+        issue(WARNING, "status_mismatch", f"La jornada está finalizada y el partido está en '{status}'.", None)
+
+    player_ids: Set[int] = set()
+    for team in ["home", "away"]:
+        if not isinstance(data.get(team), dict) or "id" not in data[team]:
+            issue(ERROR, "missing_key", f"Falta el equipo '{team}' o su ID.", None)
+            continue
+        if status == "finished" and data[team].get("score") is None:
+            issue(ERROR, "missing_score", f"Partido finalizado sin goles del equipo '{team}'.", None)
+        if not isinstance(data[team].get("reports"), list):
+            issue(ERROR, "missing_key", f"Faltan las actuaciones del equipo '{team}'.", None)
+            continue
+
+        for player_raw_data in data[team]["reports"]:
+            if not isinstance(player_raw_data, dict) or not isinstance(player_raw_data.get("player"), dict):
+                issue(ERROR, "missing_key", f"Actuación sin jugador: {player_raw_data!r}.", None)
+                continue
+            player: Dict = player_raw_data["player"]
+            player_id: Optional[int] = player.get("id")
+            if player_id is None:
+                issue(ERROR, "missing_key", f"Actuación sin ID de jugador: {player_raw_data}.", None)
+                continue
+            if player_id in player_ids:
+                issue(WARNING, "duplicate_player", f"El jugador {player_id} aparece varias veces en el partido.", player_id)
+            player_ids.add(player_id)
+
+            if player.get("position") not in POSITIONS:
+                issue(ERROR, "unknown_position", f"Posición desconocida: {player.get('position')!r}.", player_id)
+            if "points" not in player_raw_data:
+                issue(ERROR, "missing_key", "Actuación sin puntos.", player_id)
+            elif player_raw_data["points"] is None and status == "finished":
+                issue(WARNING, "missing_points", "Actuación sin puntos en un partido finalizado.", player_id)
+
+            raw_events: Any = player_raw_data.get("events", [])
+            if not isinstance(raw_events, list):
+                issue(ERROR, "invalid_events", f"Los eventos no son una lista: {raw_events!r}.", player_id)
+                continue
+            for raw_event in raw_events:
+                if not isinstance(raw_event, dict):
+                    issue(ERROR, "invalid_events", f"Evento no válido: {raw_event!r}.", player_id)
+                elif "type" not in raw_event:
+                    issue(ERROR, "missing_event_type", f"Evento sin tipo: {raw_event}.", player_id)
+                elif raw_event["type"] not in EVENT_TYPES:
+                    issue(ERROR, "unknown_event_type", f"Tipo de evento desconocido: {raw_event['type']!r}.", player_id)
+                if isinstance(raw_event, dict) and "metadata" in raw_event and not isinstance(raw_event["metadata"], int):
+                    issue(ERROR, "invalid_event_minute", f"Minuto de evento no válido: {raw_event['metadata']!r}.", player_id)
+
+_worker_processor: Optional[BiwengerProcessor] = None
+
+def _init_worker(score: int, competition: str) -> None:
+    """
+    Inicializa un proceso trabajador con su propio procesador.
+    """
+    global _worker_processor
+    _worker_processor = BiwengerProcessor(score=score, competition=competition)
+
+def _validate_round(season: int, round: int) -> Tuple[List[Issue], List[Tuple[int, str]]]:
+    """
+    Valida todos los partidos de una jornada.
+
+    Args:
+        season (int): Temporada.
+        round (int): Número de la jornada.
+
+    Returns:
+        Tuple[List[Issue], List[Tuple[int, str]]]: Problemas encontrados e (ID, nombre) de cada partido leído.
+    """
+    processor: BiwengerProcessor = _worker_processor
+    issues: List[Issue] = []
+
+    round_status: Optional[str] = None
+    try:
+        round_status = processor._load_round(round=round, season=season)["data"]["status"]
+    except (FileNotFoundError, KeyError, TypeError, ValueError) as e:
+        issues.append(Issue(severity=ERROR, check="invalid_round", season=season, round=round, game=None, game_id=None, player_id=None, message=str(e)))
+
+    game_ids: List[Tuple[int, str]] = []
+    games: Dict[int, Dict] = processor.manifest.get_games(scoring_folder=processor.scoring_folder, season=season, round=round)
+    for game_id, entry in games.items():
+        game_name: str = os.path.splitext(os.path.basename(entry["path"]))[0]
+
+        def issue(severity: str, check: str, message: str, player_id: Optional[int]) -> None:
+            issues.append(Issue(severity=severity, check=check, season=season, round=round, game=game_name, game_id=game_id, player_id=player_id, message=message))
+
+        try:
+            game_raw_data: Any = processor._load_game(game_name=game_name, round=round, season=season)
+        except (FileNotFoundError, KeyError, ValueError) as e:
+            issue(ERROR, "unreadable_file", str(e), None)
+            continue
+        except Exception as e:
+            issue(ERROR, "malformed_file", repr(e), None)
+            continue
+
+        if not isinstance(game_raw_data, dict) or not isinstance(game_raw_data.get("data"), dict):
+            issue(ERROR, "missing_key", "Falta la clave 'data'.", None)
+            continue
+        if game_raw_data["data"].get("id") != game_id:
+            issue(ERROR, "id_mismatch", f"El archivo tiene el ID {game_raw_data['data'].get('id')!r}.", None)
+        game_ids.append((game_id, f"{season}/R{round}/{game_name}"))
+
+        try:
+            _check_game(game_raw_data=game_raw_data, manifest_status=entry["status"], round_status=round_status, issue=issue)
+        except Exception as e:
+            # Una estructura inesperada no puede ocultar los problemas del resto de la jornada
+            issue(ERROR, "malformed_file", repr(e), None)
+
+    return issues, game_ids
+
+def validate_corpus(score: int = 1, max_workers: Optional[int] = None, competition: str = DEFAULT_COMPETITION) -> ValidationReport:
+    """
+    Valida en paralelo (una tarea por jornada) todos los partidos de un sistema de puntuación
+    y devuelve todos los problemas encontrados: tipos de evento o estados desconocidos, claves
+    que faltan, puntos ausentes en partidos finalizados, estados incoherentes con el manifiesto
+    o con la jornada e IDs duplicados. Un archivo corrupto no detiene la validación.
+
+    Args:
+        score (int): Sistema de puntuación. Por defecto, 1.
+        max_workers (int, optional): Número de procesos. Por defecto, uno por núcleo.
+        competition (str): Competición a validar. Por defecto, DEFAULT_COMPETITION.
+
+    Returns:
+        ValidationReport: Informe de la validación.
+    """
+    processor: BiwengerProcessor = BiwengerProcessor(score=score, competition=competition)
+    rounds: List[Tuple[int, int]] = [
+        (season, round)
+        for season in processor.manifest.get_game_seasons(scoring_folder=processor.scoring_folder)
+        for round in processor.manifest.get_game_rounds(scoring_folder=processor.scoring_folder, season=season)
+    ]
+
+    issues: List[Issue] = []
+    locations: Dict[int, List[str]] = {}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(score, processor.competition)) as executor:
+        futures: Dict[Future, Tuple[int, int]] = {executor.submit(_validate_round, season, round): (season, round) for season, round in rounds}
+        for future in as_completed(fs=futures):
+            season, round = futures[future]
+            try:
+                round_issues, game_ids = future.result()
+            except Exception as e:
+                issues.append(Issue(severity=ERROR, check="validation_failed", season=season, round=round, game=None, game_id=None, player_id=None, message=repr(e)))
+                continue
+
+            issues.extend(round_issues)
+            for game_id, location in game_ids:
+                locations.setdefault(game_id, []).append(location)
+
+    for game_id, game_locations in locations.items():
+        if len(game_locations) > 1:
+            season, round, game = game_locations[0].split(sep="/", maxsplit=2)
+            issues.append(Issue(
+                severity=WARNING,
+                check="duplicate_game",
+                season=int(season),
+                round=int(round.lstrip("R")),
+                game=game,
+                game_id=game_id,
+                player_id=None,
+                message=f"El partido {game_id} aparece en varios archivos: {', '.join(sorted(game_locations))}."
+            ))
+
+    issues.sort(key=lambda issue: (issue.season, issue.round, issue.game or "", issue.check))
+    report: ValidationReport = ValidationReport(
+        scoring_folder=processor.scoring_folder,
+        issues=issues,
+        games_checked=sum(map(len, locations.values())),
+        folder=processor.folder
+    )
+    logging.info(msg=f"Validación de {report.scoring_folder}: {report.games_checked} partidos, {len(issues)} problemas.")
+    return report
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    report: ValidationReport = validate_corpus()
+    report.save()
+    for check, count in report.summary().items():
+        print(f"{check}: {count}")
@@ -0,0 +1,117 @@
+import os
+import sqlite3
+from typing import List, NamedTuple, Optional
+
+class FetchTask(NamedTuple):
+    season: str # Temporada del partido
+    round: str # Nombre de la jornada (p. ej. 'R12')
+    game_id: int # ID del partido
+    score: int # Sistema de puntuación
+    path: str # Ruta de destino del JSON del partido
+
+class WorkQueue:
+    """
+    Cola de trabajo persistente (SQLite) con las descargas de partidos pendientes.
+
+    Las jornadas se planifican una única vez por sistema de puntuación y cada tarea
+    se marca como completada en su propia transacción, por lo que un reinicio
+    retoma el trabajo recorriendo solo las tareas pendientes.
+    """
+
+    def __init__(self, path: str = "data/queue.sqlite") -> None:
+        folder: str = os.path.dirname(path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(name=folder)
+
+        self.path: str = path
+        self.connection: sqlite3.Connection = sqlite3.connect(database=path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS plans (
+                season TEXT NOT NULL,
+                round TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                PRIMARY KEY (season, round, score)
+            );
+            CREATE TABLE IF NOT EXISTS tasks (
+                season TEXT NOT NULL,
+                round TEXT NOT NULL,
+                game_id INTEGER NOT NULL,
+                score INTEGER NOT NULL,
+                path TEXT NOT NULL,
+                done INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (season, round, game_id, score)
+            );
+            CREATE INDEX IF NOT EXISTS tasks_pending ON tasks (score, season, round) WHERE done = 0;
+        """)
+        self.connection.commit()
+
+    def is_planned(self, season: str, round: str, score: int) -> bool:
+        """
+        Comprueba si las tareas de una jornada ya se han planificado.
+
+        Args:
+            season (str): Temporada.
+            round (str): Nombre de la jornada.
+            score (int): Sistema de puntuación.
+        """
+        row: Optional[tuple] = self.connection.execute(
+            "SELECT 1 FROM plans WHERE season = ? AND round = ? AND score = ?",
+            (season, round, score)
+        ).fetchone()
+        return row is not None
+
+    def plan(self, season: str, round: str, score: int, tasks: List[FetchTask], done: List[bool]) -> None:
+        """
+        Registra las tareas de una jornada y marca la jornada como planificada en una única transacción.
+
+        Args:
+            season (str): Temporada.
+            round (str): Nombre de la jornada.
+            score (int): Sistema de puntuación.
+            tasks (List[FetchTask]): Tareas de la jornada.
+            done (List[bool]): Si cada tarea está ya completada (p. ej. el archivo ya existía).
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO tasks (season, round, game_id, score, path, done) VALUES (?, ?, ?, ?, ?, ?)",
+                [(*task, int(is_done)) for task, is_done in zip(tasks, done)]
+            )
+            self.connection.execute(
+                "INSERT OR IGNORE INTO plans (season, round, score) VALUES (?, ?, ?)",
+                (season, round, score)
+            )
+
+    def get_pending(self, scores: List[int]) -> List[FetchTask]:
+        """
+        Devuelve las tareas pendientes de los sistemas de puntuación indicados.
+
+        Args:
+            scores (List[int]): Sistemas de puntuación.
+        """
+        placeholders: str = ", ".join("?" for _ in scores)
+        rows: List[tuple] = self.connection.execute(
+            f"SELECT season, round, game_id, score, path FROM tasks WHERE done = 0 AND score IN ({placeholders}) "
+            "ORDER BY season, round, game_id, score",
+            scores
+        ).fetchall()
+        return [FetchTask(*row) for row in rows]
+
+    def complete(self, task: FetchTask) -> None:
+        """
+        Marca una tarea como completada.
+
+        Args:
+            task (FetchTask): Tarea completada.
+        """
+        with self.connection:
+            self.connection.execute(
+                "UPDATE tasks SET done = 1 WHERE season = ? AND round = ? AND game_id = ? AND score = ?",
+                (task.season, task.round, task.game_id, task.score)
+            )
+
+    def close(self) -> None:
+        """
+        Cierra la conexión con la base de datos.
+        """
+        self.connection.close()
@@ -1,21 +1,44 @@
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-import requests
-from requests import Response
-
-from config import Headers
+from config import Headers, get_env
 from config import APIUrls 
+from config import AdditionalUrls
+from config import DEFAULT_COMPETITION
+from resilience import RequestEngine, RetryPolicy, RateLimiter
 
-import time
 import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+if TYPE_CHECKING:
+    import requests
+    from requests import Response
 
 class Wrapper:
-    def __init__(self, email: str, password: str) -> None:
+    def __init__(
+            self,
+            email: str,
+            password: str,
+            pool_size: int = 16,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limit: Optional[float] = None
+        ) -> None:
         logging.info(msg="Creando instancia de Wrapper.")
         self.email: str = email
         self.password: str = password
 
+        # requests se importa al crear el wrapper, no al importar el módulo
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        # Sesión compartida para reutilizar conexiones entre peticiones (también entre hilos)
+        self.session: requests.Session = requests.Session()
+        adapter: HTTPAdapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount(prefix="https://", adapter=adapter)
+
+        # Reintentos, Retry-After, circuit breaker y límite de peticiones por segundo compartidos
+        # por todas las peticiones (también entre competiciones)
+        limiter: Optional[RateLimiter] = RateLimiter(rate=rate_limit) if rate_limit else None
+        self.engine: RequestEngine = RequestEngine(session=self.session, policy=retry_policy, limiter=limiter)
+
         logging.info(msg="Iniciando sesión en Biwenger.")
         self.token: str = self.login()
         logging.info(msg="Login exitoso. Token obtenido.")
@@ -35,8 +58,10 @@ class Wrapper:
             "password": self.password
         }
         
+        import requests
+
         try:
-            response: Response = requests.post(url=APIUrls.LOGIN_URL.value, json=payload, headers=headers, timeout=10)
+            response: Response = self.session.post(url=APIUrls.LOGIN_URL.value, json=payload, headers=headers, timeout=10)
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             logging.error(msg=f"Error iniciando sesión: {e}")
@@ -70,9 +95,9 @@ class Wrapper:
             self,
             token: str,
             user_agent: str = Headers.USER_AGENT.value,
-            x_user: str = Headers.X_USER.value,
-            x_league: str = Headers.X_LEAGUE.value,
-            x_version: str = Headers.X_VERSION.value
+            x_user: Optional[str] = None,
+            x_league: Optional[str] = None,
+            x_version: Optional[str] = None
         ) -> Dict:
         """
         Devuelve un diccionario con los headers necesarios para realizar peticiones a la API de Biwenger.
@@ -80,81 +105,97 @@ class Wrapper:
         Args:
             token (str): Token de autenticación.
             user_agent (str): User-Agent a utilizar. Default: USER_AGENT.
-            x_user (str): X-User a utilizar. Default: X_USER.
-            x_league (str): X-League a utilizar. Default: X_LEAGUE.
-            x_version (str): X-Version a utilizar. Default: X_VERSION.
+            x_user (str, optional): X-User a utilizar. Default: variable de entorno X-USER.
+            x_league (str, optional): X-League a utilizar. Default: variable de entorno X-LEAGUE.
+            x_version (str, optional): X-Version a utilizar. Default: variable de entorno X-VERSION.
         """
         return {
             "Authorization": f"Bearer {token}",
             "User-Agent": user_agent,
-            "X-User": x_user,
-            "X-League": x_league,
-            "X-Version": x_version
+            "X-User": x_user if x_user is not None else get_env(name="X-USER"),
+            "X-League": x_league if x_league is not None else get_env(name="X-LEAGUE"),
+            "X-Version": x_version if x_version is not None else get_env(name="X-VERSION")
         }
     
 class GameDataExtractor(Wrapper):
-    def _make_request_with_retry(self, url: str, headers: Dict, max_retries: int = 5) -> Dict:
+    def _make_request_with_retry(self, url: str, headers: Dict, max_retries: Optional[int] = None) -> Dict:
         """
-        Makes a request with retry logic for rate limiting.
+        Makes a request with retry logic for rate limiting, server and network errors.
         
         Args:
             url (str): URL to make the request to
             headers (Dict): Headers to use in the request
-            max_retries (int): Maximum number of retries before failing
+            max_retries (int, optional): Maximum number of retries before failing. Default: the engine policy.
         """
-        data: Dict = {}
-        for attempt in range(max_retries):
-            response: Response = requests.get(url=url, headers=headers)
-            data: Dict = response.json()
-            
-            if data.get("status") != 429:
-                return data
-                
-            wait_time: int = min(2 ** attempt, 60)
-            logging.warning(msg=f"Rate limit exceeded. Attempt {attempt + 1}/{max_retries}. "
-                          f"Waiting {wait_time} seconds before retry...")
-            time.sleep(wait_time)
-            
-        raise Exception(f"Failed after {max_retries} attempts: {data.get('userMessage', 'Unknown error')}")
-
-    def get_season_data(self, year: int) -> Dict:
+        if max_retries is None:
+            return self.engine.get_json(url=url, headers=headers)
+        engine: RequestEngine = RequestEngine(
+            session=self.session,
+            policy=self.engine.policy._replace(max_retries=max_retries),
+            breaker=self.engine.breaker,
+            limiter=self.engine.limiter
+        )
+        return engine.get_json(url=url, headers=headers)
+
+    def get_season_data(self, year: int, competition: str = DEFAULT_COMPETITION) -> Dict:
         """
         Obtiene los datos de la temporada especificada.
         
         Args:
             year (int): Año de la temporada.
-            score (int): Sistema de puntuación a utilizar.
+            competition (str): Competición (p. ej. 'la-liga'). Default: DEFAULT_COMPETITION.
         """
         header: Dict = self.get_user_agent_header()
         if year:
-            url: str = APIUrls.SEASON_DATA_URL.value.format(year=year)
+            url: str = APIUrls.SEASON_DATA_URL.value.format(competition=competition, year=year)
         else:
-            url: str = APIUrls.SEASON_DATA_URL.value.split(sep="/{year}")[0]
+            url: str = APIUrls.SEASON_DATA_URL.value.split(sep="/{year}")[0].format(competition=competition)
         return self._make_request_with_retry(url=url, headers=header)
     
-    def get_round_data(self, round: Optional[int]) -> Dict:
+    def get_round_data(self, round: Optional[int], competition: str = DEFAULT_COMPETITION) -> Dict:
         """
         Obtiene los datos de la jornada especificada.
 
         Args:
             round (int, Opcional): Número de la jornada. Selecciona la jornada actual si no se especifica.
-            score (int): Sistema de puntuación a utilizar.
+            competition (str): Competición (p. ej. 'la-liga'). Default: DEFAULT_COMPETITION.
         """
         header: Dict = self.get_user_agent_header()
         if round:
-            url: str = APIUrls.ROUND_DATA_URL.value.format(round=round)
+            url: str = APIUrls.ROUND_DATA_URL.value.format(competition=competition, round=round)
         else:
-            url: str = APIUrls.ROUND_DATA_URL.value.split(sep="/{round}")[0]
+            url: str = APIUrls.ROUND_DATA_URL.value.split(sep="/{round}")[0].format(competition=competition)
         return self._make_request_with_retry(url=url, headers=header)
     
-    def get_game_data(self, game: int, score: int) -> Dict:
+    def get_game_data(self, game: int, score: int, competition: str = DEFAULT_COMPETITION) -> Dict:
         """
         Obtiene los datos del partido especificado.
 
         Args:
             game (int): ID del partido.
             score (int): Sistema de puntuación a utilizar.
+            competition (str): Competición (p. ej. 'la-liga'). Default: DEFAULT_COMPETITION.
+        """
+        header: Dict = self.get_user_agent_header()
+        url: str = APIUrls.GAME_DATA_URL.value.format(competition=competition, game=game, score=score)
+        return self._make_request_with_retry(url=url, headers=header)
+
+    def get_competition_data(self, score: int, competition: str = DEFAULT_COMPETITION) -> Dict:
+        """
+        Obtiene los datos de la competición (jugadores, equipos y precios actuales).
+
+        Args:
+            score (int): Sistema de puntuación a utilizar.
+            competition (str): Competición (p. ej. 'la-liga'). Default: DEFAULT_COMPETITION.
         """
         header: Dict = self.get_user_agent_header()
-        url: str = APIUrls.GAME_DATA_URL.value.format(game=game, score=score)
-        return self._make_request_with_retry(url=url, headers=header)
\ No newline at end of file
+        url: str = AdditionalUrls.COMPETITION_URL.value.format(competition=competition, score=score)
+        return self._make_request_with_retry(url=url, headers=header)
+
+    def get_market_data(self) -> Dict:
+        """
+        Obtiene los datos del mercado activo de la liga del usuario.
+        """
+        header: Dict = self.get_user_headers(token=self.token)
+        url: str = AdditionalUrls.MARKET_DATA_URL.value
+        return self._make_request_with_retry(url=url, headers=header)